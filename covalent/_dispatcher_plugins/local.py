@@ -16,16 +16,19 @@
 
 import os
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 from functools import wraps
 from pathlib import Path
 from typing import Callable, Dict, List, Optional, Union
 
-from furl import furl
+import requests
+from requests.adapters import HTTPAdapter
 
 from .._api.apiclient import CovalentAPIClient as APIClient
 from .._results_manager.result import Result
 from .._results_manager.results_manager import get_result, get_result_manager
+from .._serialize.common import parse_asset_uri
 from .._serialize.result import (
     extract_assets,
     merge_response_manifest,
@@ -50,6 +53,12 @@ dispatch_cache_dir.mkdir(parents=True, exist_ok=True)
 
 BASE_ENDPOINT = os.getenv("COVALENT_DISPATCH_BASE_ENDPOINT", "/api/v2/dispatches")
 
+# Number of bytes of an interrupted upload received by the server
+UPLOAD_OFFSET_HEADER = "Upload-Offset"
+
+# Attempts to upload an asset before giving up
+MAX_UPLOAD_ATTEMPTS = 3
+
 
 def get_redispatch_request_body_v2(
     dispatch_id: str,
@@ -589,51 +598,131 @@ class LocalDispatcher(BaseDispatcher):
         return merge_response_manifest(manifest, parsed_resp)
 
     @staticmethod
-    def upload_assets(manifest: ResultSchema):
+    def upload_assets(manifest: ResultSchema, resume: bool = False):
+        """Upload the assets of a registered manifest.
+
+        Args:
+            manifest: The manifest returned by the server, with asset
+                `remote_uri`s filled in
+            resume: Whether some assets may already have been uploaded,
+                e.g. by an interrupted previous attempt. If so, each
+                asset is first checked against the server and only
+                its missing data is sent.
+        """
         assets = extract_assets(manifest)
-        LocalDispatcher._upload(assets)
+        LocalDispatcher._upload(assets, resume)
 
     @staticmethod
-    def _upload(assets: List[AssetSchema]):
+    def _upload(assets: List[AssetSchema], resume: bool = False):
         local_scheme_prefix = "file://"
         total = len(assets)
-        number_uploaded = 0
-        for i, asset in enumerate(assets):
-            if not asset.remote_uri or not asset.uri:
-                app_log.debug(f"Skipping asset {i + 1} out of {total}")
-                continue
-            if asset.remote_uri.startswith(local_scheme_prefix):
-                copy_file_locally(asset.uri, asset.remote_uri)
-                number_uploaded += 1
-            else:
-                _upload_asset(asset.uri, asset.remote_uri)
-                number_uploaded += 1
-            app_log.debug(f"Uploaded asset {i + 1} out of {total}.")
-        app_log.debug(f"uploaded {number_uploaded} assets.")
+        pending = [asset for asset in assets if asset.remote_uri and asset.uri]
+        app_log.debug(f"Skipping {total - len(pending)} out of {total} assets")
+        if not pending:
+            return
+
+        max_workers = get_config("sdk.upload_workers")
+        with _get_upload_session(max_workers) as session, ThreadPoolExecutor(
+            max_workers=max_workers
+        ) as pool:
+            futures = []
+            for asset in pending:
+                if asset.remote_uri.startswith(local_scheme_prefix):
+                    futures.append(pool.submit(copy_file_locally, asset.uri, asset.remote_uri))
+                else:
+                    futures.append(pool.submit(_upload_asset, session, asset, resume))
+            try:
+                for fut in futures:
+                    fut.result()
+            except Exception:
+                for fut in futures:
+                    fut.cancel()
+                raise
+
+        app_log.debug(f"uploaded {len(pending)} assets.")
+
+
+def _get_upload_session(max_workers: int) -> requests.Session:
+    """A keep-alive session whose connection pool fits `max_workers` uploads."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers.update(APIClient.get_extra_headers())
+    return session
+
+
+def _get_upload_offset(session: requests.Session, asset: AssetSchema, filesize: int):
+    """Find where to resume uploading an asset.
+
+    Returns:
+        The number of bytes to skip, or `None` if the server already
+        has the asset.
+    """
+    r = session.head(asset.remote_uri)
+    if not r.ok:
+        # The server doesn't support resumable uploads
+        return 0
+
+    # Asset digests computed by the SDK are sha1 checksums
+    if asset.digest and r.headers.get("Digest-Alg") == "sha1":
+        if r.headers.get("Digest") == asset.digest:
+            return None
+
+    offset = int(r.headers.get(UPLOAD_OFFSET_HEADER, 0))
+    return offset if offset < filesize else 0
+
+
+def _put_file(
+    session: requests.Session,
+    remote_uri: str,
+    local_path: str,
+    start: int,
+    size: int,
+    offset: int,
+):
+    """Upload the `size` bytes of a file at `start`, skipping the first `offset` of them."""
+    length = size - offset
+    headers = {"Content-Length": str(length)}
+    if offset > 0:
+        headers[UPLOAD_OFFSET_HEADER] = str(offset)
 
+    with open(local_path, "rb") as reader:
+        reader.seek(start + offset)
 
-def _upload_asset(local_uri, remote_uri):
-    scheme_prefix = "file://"
-    if local_uri.startswith(scheme_prefix):
-        local_path = local_uri[len(scheme_prefix) :]
-    else:
-        local_path = local_uri
+        # Only stream until EOF; this also works around a Requests
+        # bug when streaming from empty files
+        is_tail = start + size == os.fstat(reader.fileno()).st_size
+        data = reader if is_tail and length >= 50 else reader.read(length)
 
-    filesize = os.path.getsize(local_path)
-    with open(local_path, "rb") as reader:
-        app_log.debug(f"uploading to {remote_uri}")
-        f = furl(remote_uri)
-        scheme = f.scheme
-        host = f.host
-        port = f.port
-        dispatcher_addr = f"{scheme}://{host}:{port}"
-        endpoint = str(f.path)
-        api_client = APIClient(dispatcher_addr)
-        if f.query:
-            endpoint = f"{endpoint}?{f.query}"
-
-        # Workaround for Requests bug when streaming from empty files
-        data = reader.read() if filesize < 50 else reader
-
-        r = api_client.put(endpoint, headers={"Content-Length": str(filesize)}, data=data)
+        r = session.put(remote_uri, headers=headers, data=data)
         r.raise_for_status()
+
+
+def _upload_asset(session: requests.Session, asset: AssetSchema, resume: bool = False):
+    """Upload an asset file, resuming the upload if it is interrupted.
+
+    Args:
+        session: The HTTP session to upload with
+        asset: The asset, with both its local `uri` and `remote_uri` set
+        resume: Whether to ask the server for previously uploaded data
+            before the first attempt
+    """
+    local_path, start, size = parse_asset_uri(asset.uri)
+    filesize = os.path.getsize(local_path) - start if size is None else size
+    app_log.debug(f"uploading to {asset.remote_uri}")
+
+    for attempt in range(MAX_UPLOAD_ATTEMPTS):
+        offset = 0
+        if resume or attempt > 0:
+            offset = _get_upload_offset(session, asset, filesize)
+            if offset is None:
+                app_log.debug(f"Server already has {asset.remote_uri}")
+                return
+        try:
+            _put_file(session, asset.remote_uri, local_path, start, filesize, offset)
+            return
+        except (requests.exceptions.ConnectionError, requests.exceptions.ChunkedEncodingError):
+            if attempt == MAX_UPLOAD_ATTEMPTS - 1:
+                raise
+            app_log.debug(f"Upload to {asset.remote_uri} was interrupted; resuming")
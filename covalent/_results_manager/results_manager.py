@@ -18,10 +18,18 @@
 from __future__ import annotations
 
 import contextlib
+import hashlib
+import json
 import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
+import requests
 from furl import furl
 from requests.adapters import HTTPAdapter
 from urllib3.util import Retry
@@ -41,6 +49,7 @@ from .._shared_files.exceptions import MissingLatticeRecordError
 from .._shared_files.schemas.asset import AssetSchema
 from .._shared_files.schemas.result import ResultSchema
 from .._shared_files.utils import copy_file_locally, format_server_url
+from .._workflow.transport import DeferredNodeValue
 from .result import Result
 from .wait import EXTREME
 
@@ -48,6 +57,13 @@ app_log = logger.app_log
 log_stack_info = logger.log_stack_info
 
 
+# Event streams which the server closes sooner than this without sending
+# any event are considered broken (e.g. by a proxy). After a few of
+# these in a row, waiting falls back to polling.
+EVENT_STREAM_MIN_SECONDS = 1.0
+EVENT_STREAM_MAX_EMPTY = 5
+EVENT_STREAM_BACKOFF_SECONDS = 0.5
+
 SDK_NODE_META_KEYS = {
     "executor",
     "executor_data",
@@ -68,6 +84,9 @@ DEFERRED_KEYS = {
     "qelectron_db",
 }
 
+# Digest algorithms of the sha1 checksums naming locally cached assets
+CACHED_DIGEST_ALGS = {"sha", "sha1"}
+
 
 def _delete_result(
     dispatch_id: str,
@@ -139,6 +158,64 @@ def cancel(dispatch_id: str, task_ids: List[int] = None, dispatcher_addr: str =
 # Multi-part
 
 
+def _wait_for_dispatch(dispatch_id: str, dispatcher_addr: str) -> bool:
+    """
+    Internal function to block until a dispatch reaches a terminal status.
+
+    Listens to the server-sent events published by the server for the
+    dispatch, reconnecting whenever the server closes an idle stream.
+    Streams which close right away without any event are retried with
+    an increasing delay, up to `EVENT_STREAM_MAX_EMPTY` times in a row.
+
+    Args:
+        dispatch_id: The dispatch id of the result.
+        dispatcher_addr: Dispatcher server address.
+
+    Returns:
+        Whether the server reported the dispatch as finished. False means
+        that the event stream is unavailable (for instance with older
+        servers), in which case callers should fall back to polling.
+    """
+
+    api_client = CovalentAPIClient(dispatcher_addr, auto_raise=False)
+    endpoint = f"/api/v2/dispatches/{dispatch_id}/events"
+
+    num_empty = 0
+    while True:
+        start_time = time.monotonic()
+        received = False
+        try:
+            with api_client.get(endpoint, stream=True) as response:
+                if response.status_code != 200:
+                    return False
+
+                event = None
+                for line in response.iter_lines():
+                    line = line.decode("utf-8")
+                    if line.startswith("event:"):
+                        event = line[len("event:") :].strip()
+                    elif line.startswith("data:"):
+                        received = True
+                        msg = json.loads(line[len("data:") :])
+                        app_log.debug(f"Dispatch {dispatch_id} {event} event: {msg}")
+                        if event == "dispatch":
+                            return True
+
+        except requests.exceptions.RequestException as ex:
+            app_log.debug(f"Event stream for dispatch {dispatch_id} interrupted: {ex}")
+            return False
+
+        if received or time.monotonic() - start_time >= EVENT_STREAM_MIN_SECONDS:
+            num_empty = 0
+            continue
+
+        num_empty += 1
+        if num_empty >= EVENT_STREAM_MAX_EMPTY:
+            app_log.debug(f"Event stream for dispatch {dispatch_id} keeps closing; polling")
+            return False
+        time.sleep(EVENT_STREAM_BACKOFF_SECONDS * 2 ** (num_empty - 1))
+
+
 def _get_result_export_from_dispatcher(
     dispatch_id: str,
     wait: bool = False,
@@ -164,6 +241,10 @@ def _get_result_export_from_dispatcher(
     if dispatcher_addr is None:
         dispatcher_addr = format_server_url()
 
+    # Wait for the server to announce completion instead of polling
+    if wait and _wait_for_dispatch(dispatch_id, dispatcher_addr):
+        wait = False
+
     retries = int(EXTREME) if wait else 5
 
     adapter = HTTPAdapter(max_retries=Retry(total=retries, backoff_factor=1))
@@ -182,7 +263,7 @@ def _get_result_export_from_dispatcher(
 
 
 # Function to download default assets
-def _get_default_assets(rm: ResultManager):
+def _get_default_assets(rm: ResultManager, lazy: bool = False):
     for key in RESULT_ASSET_TYPES.keys():
         if key not in DEFERRED_KEYS:
             rm.download_result_asset(key)
@@ -198,11 +279,8 @@ def _get_default_assets(rm: ResultManager):
     tg.lattice_metadata = rm.result_object.lattice.metadata
     rm.result_object.lattice.__doc__ = rm.result_object.lattice.__dict__.pop("doc")
 
-    for key in ELECTRON_ASSET_TYPES.keys():
-        if key not in DEFERRED_KEYS:
-            for node_id in tg._graph.nodes:
-                rm.download_node_asset(node_id, key)
-                rm.load_node_asset(node_id, key)
+    node_keys = [key for key in ELECTRON_ASSET_TYPES.keys() if key not in DEFERRED_KEYS]
+    rm.fetch_node_assets(node_keys, lazy=lazy)
 
 
 # Functions for computing local URIs
@@ -223,12 +301,40 @@ def get_result_asset_path(results_dir: str, key: str):
 
 # Asset transfers
 
-
-def download_asset(remote_uri: str, local_path: str, chunk_size: int = 1024 * 1024):
+_session = None
+_session_pid = None
+_session_lock = threading.Lock()
+
+
+def _get_download_session() -> requests.Session:
+    """Return the keep-alive HTTP session shared by asset downloads."""
+    global _session, _session_pid
+
+    with _session_lock:
+        # Sessions don't survive a fork
+        if _session_pid != os.getpid():
+            max_workers = get_config("sdk.download_workers")
+            _session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+            _session.mount("http://", adapter)
+            _session.mount("https://", adapter)
+            _session.headers.update(CovalentAPIClient.get_extra_headers())
+            _session_pid = os.getpid()
+    return _session
+
+
+def download_asset(
+    remote_uri: str,
+    local_path: str,
+    chunk_size: int = 1024 * 1024,
+    session: Optional[requests.Session] = None,
+):
     local_scheme = "file"
     if remote_uri.startswith(local_scheme):
         copy_file_locally(remote_uri, f"file://{local_path}")
-    else:
+        return
+
+    if session is None:
         f = furl(remote_uri)
         scheme = f.scheme
         host = f.host
@@ -237,41 +343,97 @@ def download_asset(remote_uri: str, local_path: str, chunk_size: int = 1024 * 10
         endpoint = str(f.path)
         api_client = CovalentAPIClient(dispatcher_addr)
         r = api_client.get(endpoint, stream=True)
-        with open(local_path, "wb") as f:
-            for chunk in r.iter_content(chunk_size=chunk_size):
-                f.write(chunk)
+    else:
+        r = session.get(remote_uri, stream=True)
+        r.raise_for_status()
+
+    with open(local_path, "wb") as f:
+        for chunk in r.iter_content(chunk_size=chunk_size):
+            f.write(chunk)
+
+
+def _link_or_copy(src: Union[str, Path], dest: Union[str, Path]):
+    tmp_path = f"{dest}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.link(src, tmp_path)
+    except OSError:
+        shutil.copyfile(src, tmp_path)
+    os.replace(tmp_path, dest)
+
+
+def _get_cached_asset_path(digest_alg: Optional[str], digest: Optional[str]) -> Optional[Path]:
+    if digest_alg not in CACHED_DIGEST_ALGS or not digest:
+        return None
+    return Path(get_config("sdk.results_dir")) / ".objects" / digest[:2] / digest
+
+
+def _cache_asset(local_path: str, cached_path: Path):
+    h = hashlib.sha1()
+    with open(local_path, "rb") as f:
+        for chunk in iter(partial(f.read, 1024 * 1024), b""):
+            h.update(chunk)
+
+    # Only cache data that matches its advertised digest
+    if h.hexdigest() != cached_path.name:
+        app_log.debug(f"Digest mismatch for {local_path}; not caching it")
+        return
+
+    try:
+        cached_path.parent.mkdir(parents=True, exist_ok=True)
+        _link_or_copy(local_path, cached_path)
+    except OSError as e:
+        app_log.debug(f"Unable to cache {local_path}: {e}")
+
+
+def _fetch_asset(asset: dict, local_path: str):
+    """Download an asset unless data with the same digest was downloaded before.
+
+    Args:
+        asset: The asset's entry in the manifest
+        local_path: The path to which to download the asset
+    """
+    cached_path = _get_cached_asset_path(asset.get("digest_alg"), asset.get("digest"))
+    if cached_path is not None and cached_path.exists():
+        _link_or_copy(cached_path, local_path)
+        return
+
+    # Never write through a link to a cached file
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(local_path)
+
+    download_asset(asset["remote_uri"], local_path, session=_get_download_session())
+    if cached_path is not None:
+        _cache_asset(local_path, cached_path)
 
 
 def _download_result_asset(manifest: dict, results_dir: str, key: str):
-    remote_uri = manifest["assets"][key]["remote_uri"]
     size = manifest["assets"][key]["size"]
 
     if size > 0:
         local_path = get_result_asset_path(results_dir, key)
-        download_asset(remote_uri, local_path)
+        _fetch_asset(manifest["assets"][key], local_path)
         manifest["assets"][key]["uri"] = f"file://{local_path}"
 
 
 def _download_lattice_asset(manifest: dict, results_dir: str, key: str):
     lattice_assets = manifest["lattice"]["assets"]
-    remote_uri = lattice_assets[key]["remote_uri"]
     size = lattice_assets[key]["size"]
 
     if size > 0:
         local_path = get_lattice_asset_path(results_dir, key)
-        download_asset(remote_uri, local_path)
+        _fetch_asset(lattice_assets[key], local_path)
         lattice_assets[key]["uri"] = f"file://{local_path}"
 
 
 def _download_node_asset(manifest: dict, results_dir: str, node_id: int, key: str):
     node = manifest["lattice"]["transport_graph"]["nodes"][node_id]
     node_assets = node["assets"]
-    remote_uri = node_assets[key]["remote_uri"]
     size = node_assets[key]["size"]
 
     if size > 0:
         local_path = get_node_asset_path(results_dir, node_id, key)
-        download_asset(remote_uri, local_path)
+        Path(local_path).parent.mkdir(exist_ok=True)
+        _fetch_asset(node_assets[key], local_path)
         node_assets[key]["uri"] = f"file://{local_path}"
 
 
@@ -332,6 +494,9 @@ class ResultManager:
 
     def load_node_asset(self, node_id: int, key: str):
         data = _load_node_asset(self._manifest, node_id, key)
+        self._set_node_asset(node_id, key, data)
+
+    def _set_node_asset(self, node_id: int, key: str, data: Any):
         tg = self.result_object.lattice.transport_graph
         if key in SDK_NODE_META_KEYS:
             node_meta = tg.get_node_value(node_id, "metadata")
@@ -339,6 +504,45 @@ class ResultManager:
         else:
             tg.set_node_value(node_id, key, data)
 
+    def _fetch_node_asset(self, node_id: int, key: str) -> Any:
+        self.download_node_asset(node_id, key)
+        return _load_node_asset(self._manifest, node_id, key)
+
+    def fetch_node_assets(self, keys: List[str], lazy: bool = False):
+        """Download and load an asset of every node.
+
+        Args:
+            keys: The asset keys to fetch
+            lazy: Whether to defer each download until the asset is
+                first accessed through the transport graph. Assets
+                stored in the node metadata are always fetched.
+        """
+        tg = self.result_object.lattice.transport_graph
+        node_ids = list(tg._graph.nodes)
+        eager_keys = [key for key in keys if not lazy or key in SDK_NODE_META_KEYS]
+
+        if lazy:
+            for key in keys:
+                if key in SDK_NODE_META_KEYS:
+                    continue
+                for node_id in node_ids:
+                    loader = partial(self._fetch_node_asset, node_id, key)
+                    tg.set_node_value(node_id, key, DeferredNodeValue(loader))
+
+        if not eager_keys:
+            return
+
+        with ThreadPoolExecutor(max_workers=get_config("sdk.download_workers")) as pool:
+            futures = {
+                (node_id, key): pool.submit(self._fetch_node_asset, node_id, key)
+                for key in eager_keys
+                for node_id in node_ids
+            }
+
+        # The transport graph is only updated from this thread
+        for (node_id, key), fut in futures.items():
+            self._set_node_asset(node_id, key, fut.result())
+
     @staticmethod
     def from_dispatch_id(
         dispatch_id: str,
@@ -358,12 +562,9 @@ class ResultManager:
         rm = ResultManager(manifest, results_dir)
         result_object = rm.result_object
         result_object._results_dir = results_dir
-        Path(results_dir).mkdir(parents=True, exist_ok=True)
 
-        # Create node subdirectories
-        for node_id in result_object.lattice.transport_graph._graph.nodes:
-            node_dir = f"{results_dir}/node_{node_id}"
-            Path(node_dir).mkdir(exist_ok=True)
+        # Node subdirectories are created as assets are downloaded
+        Path(results_dir).mkdir(parents=True, exist_ok=True)
 
         return rm
 
@@ -385,6 +586,7 @@ def _get_result_multistage(
     intermediate_outputs: bool = True,
     sublattice_results: bool = True,
     qelectron_db: bool = False,
+    lazy: bool = False,
 ) -> Result:
     """
     Get the results of a dispatch from a file.
@@ -402,6 +604,7 @@ def _get_result_multistage(
         intermediate_outputs: Whether to return all intermediate outputs in the compute graph. Defaults to True.
         sublattice_results: Whether to recursively retrieve sublattice results. Default is True.
         qelectron_db: Whether to load the bytes data of qelectron_db. Default is False.
+        lazy: Whether to defer downloading node assets and sublattice results until they are first accessed. Default is False.
 
     Returns:
         The Result object from the Covalent server
@@ -417,43 +620,53 @@ def _get_result_multistage(
                 dispatcher_addr=dispatcher_addr,
             )
         rm = get_result_manager(dispatch_id, results_dir, wait, dispatcher_addr)
-        _get_default_assets(rm)
+        _get_default_assets(rm, lazy)
 
         if workflow_output:
             rm.download_result_asset("result")
             rm.load_result_asset("result")
 
         if intermediate_outputs:
-            tg = rm.result_object.lattice.transport_graph
-            for node_id in tg._graph.nodes:
-                rm.download_node_asset(node_id, "output")
-                rm.load_node_asset(node_id, "output")
+            rm.fetch_node_assets(["output"], lazy=lazy)
 
         if qelectron_db:
-            for node_id in tg._graph.nodes:
-                rm.download_node_asset(node_id, "qelectron_db")
-                rm.load_node_asset(node_id, "qelectron_db")
+            rm.fetch_node_assets(["qelectron_db"], lazy=lazy)
 
         # Fetch sublattice result objects recursively
         tg = rm.result_object.lattice.transport_graph
+        get_sub_result = partial(
+            _get_result_multistage,
+            wait=wait,
+            dispatcher_addr=dispatcher_addr,
+            status_only=status_only,
+            results_dir=results_dir,
+            workflow_output=workflow_output,
+            intermediate_outputs=intermediate_outputs,
+            sublattice_results=sublattice_results,
+            qelectron_db=qelectron_db,
+            lazy=lazy,
+        )
+        sub_dispatch_ids = {}
         for node_id in tg._graph.nodes:
             sub_dispatch_id = tg.get_node_value(node_id, "sub_dispatch_id")
             if sublattice_results and sub_dispatch_id:
-                sub_result = _get_result_multistage(
-                    sub_dispatch_id,
-                    wait,
-                    dispatcher_addr,
-                    status_only,
-                    results_dir=results_dir,
-                    workflow_output=workflow_output,
-                    intermediate_outputs=intermediate_outputs,
-                    sublattice_results=sublattice_results,
-                    qelectron_db=qelectron_db,
-                )
-                tg.set_node_value(node_id, "sublattice_result", sub_result)
+                sub_dispatch_ids[node_id] = sub_dispatch_id
             else:
                 tg.set_node_value(node_id, "sublattice_result", None)
 
+        if lazy:
+            for node_id, sub_dispatch_id in sub_dispatch_ids.items():
+                loader = partial(get_sub_result, sub_dispatch_id)
+                tg.set_node_value(node_id, "sublattice_result", DeferredNodeValue(loader))
+        elif sub_dispatch_ids:
+            with ThreadPoolExecutor(max_workers=get_config("sdk.download_workers")) as pool:
+                futures = {
+                    node_id: pool.submit(get_sub_result, sub_dispatch_id)
+                    for node_id, sub_dispatch_id in sub_dispatch_ids.items()
+                }
+            for node_id, fut in futures.items():
+                tg.set_node_value(node_id, "sublattice_result", fut.result())
+
     except MissingLatticeRecordError as ex:
         app_log.warning(
             f"Dispatch ID {dispatch_id} was not found in the database. Incorrect dispatch id."
@@ -475,6 +688,7 @@ def get_result(
     intermediate_outputs: bool = True,
     sublattice_results: bool = True,
     qelectron_db: bool = False,
+    lazy: bool = False,
 ) -> Result:
     """
     Get the results of a dispatch.
@@ -491,6 +705,7 @@ def get_result(
         intermediate_outputs: Whether to return all intermediate outputs in the compute graph. Defaults to True.
         sublattice_results: Whether to recursively retrieve sublattice results. Default is True.
         qelectron_db: Whether to load the bytes data of qelectron_db. Default is False.
+        lazy: Whether to defer downloading node assets and sublattice results until they are first accessed. Default is False.
 
     Returns:
         The Result object from the Covalent server
@@ -510,6 +725,7 @@ def get_result(
                 intermediate_outputs=intermediate_outputs,
                 sublattice_results=sublattice_results,
                 qelectron_db=qelectron_db,
+                lazy=lazy,
             )
 
         except RecursionError as re:
@@ -18,24 +18,36 @@
 
 import hashlib
 import json
+import mmap
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import Any, List, Optional, Tuple, Union
 
 import cloudpickle
 
 from .._shared_files.schemas.asset import AssetSchema
-from .._workflow.transportable_object import TransportableObject
+from .._workflow.transportable_object import BytesLike, TransportableObject
 
 __all__ = [
     "AssetType",
     "save_asset",
     "load_asset",
+    "write_asset_file",
+    "read_asset_file",
+    "parse_asset_uri",
+    "AssetPack",
 ]
 
 
 CHECKSUM_ALGORITHM = "sha"
 
+# Assets at most this large are appended to an AssetPack instead of
+# being written to their own files
+PACKED_ASSET_MAX_SIZE = 64 * 1024
+
 
 class AssetType(Enum):
     """
@@ -77,6 +89,27 @@ def serialize_asset(data: Any, data_type: AssetType) -> bytes:
         raise TypeError(f"Unsupported data type {type(data)}")
 
 
+def serialize_asset_segments(data: Any, data_type: AssetType) -> List[BytesLike]:
+    """
+    Serialize the asset data as a list of consecutive segments
+
+    For TransportableObjects this avoids copying out-of-band pickle
+    buffers into a single bytes object.
+
+    Args:
+        data: Data to serialize
+        data_type: Type of the Asset data to serialize
+
+    Returns:
+        Segments which, concatenated, equal `serialize_asset(data, data_type)`
+
+    """
+
+    if data_type == AssetType.TRANSPORTABLE:
+        return data.serialize_segments()
+    return [serialize_asset(data, data_type)]
+
+
 def deserialize_asset(data: bytes, data_type: AssetType) -> Any:
     """
     Deserialize the asset data
@@ -119,6 +152,192 @@ def _sha1_asset(data: bytes) -> str:
     return hashlib.sha1(data).hexdigest()
 
 
+def write_asset_file(data: Any, data_type: AssetType, path: Union[str, Path]) -> Tuple[str, int]:
+    """
+    Serialize the asset data directly to a file
+
+    The data is written to a temporary file which then replaces `path`,
+    so that objects previously memory-mapped from `path` by
+    `read_asset_file` are unaffected.
+
+    Args:
+        data: Data to save
+        data_type: Type of the Asset data to save
+        path: Path of the file to write
+
+    Returns:
+        (sha1 checksum, size) of the serialized data
+
+    """
+
+    checksum = hashlib.sha1()
+    size = 0
+    segments = serialize_asset_segments(data, data_type)
+
+    path = Path(path)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            for segment in segments:
+                checksum.update(segment)
+                size += f.write(segment)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    return checksum.hexdigest(), size
+
+
+def _map_file(f) -> Union[bytes, mmap.mmap]:
+    """Map a file into memory as a private, copy-on-write buffer."""
+
+    if os.fstat(f.fileno()).st_size == 0:
+        return b""
+    return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+
+
+def read_asset_file(path: Union[str, Path], data_type: AssetType) -> Any:
+    """
+    Deserialize an asset from a file
+
+    TransportableObjects are memory-mapped so that their out-of-band
+    buffers are backed by the file instead of being read into memory.
+
+    Args:
+        path: Path of the file to read
+        data_type: Type of the Asset data to load
+
+    Returns:
+        Asset data
+
+    """
+
+    with open(path, "rb") as f:
+        if data_type == AssetType.TRANSPORTABLE:
+            return deserialize_asset(_map_file(f), data_type)
+        return deserialize_asset(f.read(), data_type)
+
+
+def parse_asset_uri(uri: str) -> Tuple[str, int, Optional[int]]:
+    """
+    Locate the data of a local asset
+
+    Assets stored in an `AssetPack` are addressed by a byte range of
+    the pack file, given as the URI fragment `#offset=<offset>&size=<size>`.
+
+    Args:
+        uri: The asset URI, with or without the `file://` scheme
+
+    Returns:
+        (path, offset, size) of the asset data, where `size` is `None`
+        if the asset occupies the rest of the file
+
+    """
+
+    scheme_prefix = "file://"
+    if uri.startswith(scheme_prefix):
+        uri = uri[len(scheme_prefix) :]
+
+    path, _, fragment = uri.partition("#")
+    if not fragment:
+        return path, 0, None
+
+    byte_range = dict(param.split("=", 1) for param in fragment.split("&"))
+    return path, int(byte_range["offset"]), int(byte_range["size"])
+
+
+class AssetPack:
+    """
+    Writes the assets of many electrons into a single file
+
+    Small assets are appended to the pack file, sparing the filesystem
+    one file per asset, while larger assets are still written to their
+    own files. The latter are hashed and written in background threads;
+    their digests are filled in when the pack is closed.
+
+    Usage:
+        with AssetPack(path) as pack:
+            asset = pack.save_asset(data, data_type, storage_path, filename)
+
+    """
+
+    def __init__(self, path: Union[str, Path], max_workers: int = None):
+        self.path = Path(path).resolve()
+        self._file = open(self.path, "wb")
+        self._offset = 0
+        self._pool = ThreadPoolExecutor(max_workers=max_workers)
+        self._pending: List[Tuple[AssetSchema, Future]] = []
+
+    def save_asset(
+        self, data: Any, data_type: AssetType, storage_path: str, filename: str
+    ) -> AssetSchema:
+        """
+        Save the asset data, packing it if it is small
+
+        Args:
+            data: Data to save
+            data_type: Type of the Asset data to save
+            storage_path: Directory in which to save large assets;
+                created if needed
+            filename: Name of the file for large assets
+
+        Returns:
+            AssetSchema object containing metadata about the saved data
+
+        """
+
+        if data is None:
+            return AssetSchema(size=0)
+
+        segments = serialize_asset_segments(data, data_type)
+        size = sum(memoryview(segment).nbytes for segment in segments)
+
+        if size > PACKED_ASSET_MAX_SIZE:
+            os.makedirs(storage_path, exist_ok=True)
+            path = Path(storage_path).resolve() / filename
+            asset = AssetSchema(digest_alg=CHECKSUM_ALGORITHM, size=size, uri=f"file://{path}")
+            fut = self._pool.submit(_write_segments, segments, path)
+            self._pending.append((asset, fut))
+            return asset
+
+        checksum = hashlib.sha1()
+        for segment in segments:
+            checksum.update(segment)
+        self._file.writelines(segments)
+        uri = f"file://{self.path}#offset={self._offset}&size={size}"
+        self._offset += size
+        return AssetSchema(
+            digest_alg=CHECKSUM_ALGORITHM, digest=checksum.hexdigest(), size=size, uri=uri
+        )
+
+    def close(self):
+        """Flush the pack and wait for all large assets to be written"""
+
+        try:
+            self._file.close()
+            for asset, fut in self._pending:
+                asset.digest = fut.result()
+        finally:
+            self._pool.shutdown(cancel_futures=True)
+            self._pending = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def _write_segments(segments: List[BytesLike], path: Path) -> str:
+    checksum = hashlib.sha1()
+    with open(path, "wb") as f:
+        for segment in segments:
+            checksum.update(segment)
+            f.write(segment)
+    return checksum.hexdigest()
+
+
 def save_asset(data: Any, data_type: AssetType, storage_path: str, filename: str) -> AssetSchema:
     """
     Save the asset data to the storage path
@@ -139,14 +358,11 @@ def save_asset(data: Any, data_type: AssetType, storage_path: str, filename: str
     if data is None:
         return AssetSchema(size=0)
 
-    serialized = serialize_asset(data, data_type)
-    digest = _sha1_asset(serialized)
     path = Path(storage_path) / filename
     path = path.resolve()
-    with open(path, "wb") as f:
-        f.write(serialized)
+    digest, size = write_asset_file(data, data_type, path)
     uri = f"{scheme}://{path}"
-    return AssetSchema(digest_alg=CHECKSUM_ALGORITHM, digest=digest, size=len(serialized), uri=uri)
+    return AssetSchema(digest_alg=CHECKSUM_ALGORITHM, digest=digest, size=size, uri=uri)
 
 
 def load_asset(asset_meta: AssetSchema, data_type: AssetType) -> Any:
@@ -162,14 +378,15 @@ def load_asset(asset_meta: AssetSchema, data_type: AssetType) -> Any:
 
     """
 
-    scheme_prefix = "file://"
     uri = asset_meta.uri
 
     if not uri:
         return None
 
-    path = uri[len(scheme_prefix) :] if uri.startswith(scheme_prefix) else uri
+    path, offset, size = parse_asset_uri(uri)
+    if size is None:
+        return read_asset_file(path, data_type)
 
     with open(path, "rb") as f:
-        data = f.read()
-    return deserialize_asset(data, data_type)
+        f.seek(offset)
+        return deserialize_asset(f.read(size), data_type)
@@ -26,7 +26,7 @@ from .._shared_files.schemas.electron import (
     ElectronSchema,
 )
 from .._shared_files.util_classes import RESULT_STATUS, Status
-from .common import AssetType, load_asset, save_asset
+from .common import AssetPack, AssetType, load_asset, save_asset
 
 __all__ = [
     "serialize_node",
@@ -53,6 +53,7 @@ def _serialize_node_metadata(node_attrs: dict, node_storage_path: str) -> Electr
     executor = node_attrs["metadata"]["executor"]
     executor_data = node_attrs["metadata"]["executor_data"]
     qelectron_data_exists = node_attrs["metadata"]["qelectron_data_exists"]
+    cache = node_attrs["metadata"].get("cache", False)
 
     # Optional
     status = node_attrs.get("status", RESULT_STATUS.NEW_OBJECT)
@@ -71,6 +72,7 @@ def _serialize_node_metadata(node_attrs: dict, node_storage_path: str) -> Electr
         executor=executor,
         executor_data=executor_data,
         qelectron_data_exists=qelectron_data_exists,
+        cache=cache,
         status=str(status),
         start_time=start_time,
         end_time=end_time,
@@ -89,90 +91,25 @@ def _deserialize_node_metadata(meta: ElectronMetadata) -> dict:
             "executor": meta.executor,
             "executor_data": meta.executor_data,
             "qelectron_data_exists": meta.qelectron_data_exists,
+            "cache": meta.cache,
         },
     }
 
 
-def _serialize_node_assets(node_attrs: dict, node_storage_path: str) -> ElectronAssets:
-    function = node_attrs["function"]
-    function_asset = save_asset(
-        function,
-        ASSET_TYPES["function"],
-        node_storage_path,
-        ASSET_FILENAME_MAP["function"],
-    )
-
-    function_string = node_attrs.get("function_string", None)
-    function_string_asset = save_asset(
-        function_string,
-        ASSET_TYPES["function_string"],
-        node_storage_path,
-        ASSET_FILENAME_MAP["function_string"],
-    )
-
-    node_value = node_attrs.get("value", None)
-    value_asset = save_asset(
-        node_value,
-        ASSET_TYPES["value"],
-        node_storage_path,
-        ASSET_FILENAME_MAP["value"],
-    )
-
-    node_output = node_attrs.get("output", None)
-    output_asset = save_asset(
-        node_output,
-        ASSET_TYPES["output"],
-        node_storage_path,
-        ASSET_FILENAME_MAP["output"],
-    )
-
-    node_stdout = node_attrs.get("stdout", None)
-    stdout_asset = save_asset(
-        node_stdout,
-        ASSET_TYPES["stdout"],
-        node_storage_path,
-        ASSET_FILENAME_MAP["stdout"],
-    )
-
-    node_stderr = node_attrs.get("stderr", None)
-    stderr_asset = save_asset(
-        node_stderr,
-        ASSET_TYPES["stderr"],
-        node_storage_path,
-        ASSET_FILENAME_MAP["stderr"],
-    )
-
-    qelectron_db = node_attrs.get("qelectron_db", None)
-    qelectron_db_asset = save_asset(
-        qelectron_db,
-        ASSET_TYPES["qelectron_db"],
-        node_storage_path,
-        ASSET_FILENAME_MAP["qelectron_db"],
-    )
+def _serialize_node_assets(
+    node_attrs: dict, node_storage_path: str, asset_pack: AssetPack = None
+) -> ElectronAssets:
+    save = asset_pack.save_asset if asset_pack else save_asset
 
-    node_error = node_attrs.get("error", None)
-    error_asset = save_asset(
-        node_error,
-        ASSET_TYPES["error"],
-        node_storage_path,
-        ASSET_FILENAME_MAP["error"],
-    )
+    assets = {}
+    for key, asset_type in ASSET_TYPES.items():
+        if key == "hooks":
+            data = node_attrs["metadata"]["hooks"]
+        else:
+            data = node_attrs.get(key, None)
+        assets[key] = save(data, asset_type, node_storage_path, ASSET_FILENAME_MAP[key])
 
-    hooks = node_attrs["metadata"]["hooks"]
-    hooks_asset = save_asset(
-        hooks, ASSET_TYPES["hooks"], node_storage_path, ASSET_FILENAME_MAP["hooks"]
-    )
-    return ElectronAssets(
-        function=function_asset,
-        function_string=function_string_asset,
-        value=value_asset,
-        output=output_asset,
-        stdout=stdout_asset,
-        stderr=stderr_asset,
-        qelectron_db=qelectron_db_asset,
-        error=error_asset,
-        hooks=hooks_asset,
-    )
+    return ElectronAssets(**assets)
 
 
 def _deserialize_node_assets(ea: ElectronAssets) -> dict:
@@ -207,9 +144,11 @@ def _get_node_custom_assets(node_attrs: dict) -> Dict[str, AssetSchema]:
         return {key: AssetSchema(size=0) for key in node_attrs["metadata"]["custom_asset_keys"]}
 
 
-def serialize_node(node_id: int, node_attrs: dict, node_storage_path) -> ElectronSchema:
+def serialize_node(
+    node_id: int, node_attrs: dict, node_storage_path, asset_pack: AssetPack = None
+) -> ElectronSchema:
     meta = _serialize_node_metadata(node_attrs, node_storage_path)
-    assets = _serialize_node_assets(node_attrs, node_storage_path)
+    assets = _serialize_node_assets(node_attrs, node_storage_path, asset_pack)
     assets._custom = _get_node_custom_assets(node_attrs)
     return ElectronSchema(id=node_id, metadata=meta, assets=assets)
 
@@ -16,7 +16,6 @@
 
 """Functions to convert tg -> TransportGraphSchema"""
 
-import os
 from pathlib import Path
 from typing import List
 
@@ -26,6 +25,7 @@ from .._shared_files.schemas.edge import EdgeMetadata, EdgeSchema
 from .._shared_files.schemas.electron import ElectronSchema
 from .._shared_files.schemas.transport_graph import TransportGraphSchema
 from .._workflow.transport import _TransportGraph
+from .common import AssetPack
 from .electron import deserialize_node, serialize_node
 
 __all__ = [
@@ -34,6 +34,9 @@ __all__ = [
 ]
 
 
+NODE_ASSET_PACK_FILENAME = "node_assets.pack"
+
+
 def _serialize_edge(source: int, target: int, attrs: dict) -> EdgeSchema:
     """
     Serialize an edge in a graph
@@ -79,6 +82,9 @@ def _serialize_nodes(g: nx.MultiDiGraph, storage_path: str) -> List[ElectronSche
     """
     Serialize nodes in a graph
 
+    Small node assets are packed into a single file in `storage_path`;
+    larger ones are written to per-node directories.
+
     Args:
         g: NetworkX graph
         storage_path: Path to store serialized object
@@ -90,10 +96,10 @@ def _serialize_nodes(g: nx.MultiDiGraph, storage_path: str) -> List[ElectronSche
 
     results = []
     base_path = Path(storage_path)
-    for i in g.nodes:
-        node_storage_path = base_path / f"node_{i}"
-        os.mkdir(node_storage_path)
-        results.append(serialize_node(i, g.nodes[i], node_storage_path))
+    with AssetPack(base_path / NODE_ASSET_PACK_FILENAME) as asset_pack:
+        for i in g.nodes:
+            node_storage_path = str(base_path / f"node_{i}")
+            results.append(serialize_node(i, g.nodes[i], node_storage_path, asset_pack))
     return results
 
 
@@ -77,6 +77,16 @@ def get_default_sdk_config():
             (os.environ.get("XDG_CACHE_HOME") or (os.environ["HOME"] + "/.cache"))
             + "/covalent/results"
         ),
+        # String representations of TransportableObjects whose
+        # picklebytes exceed the threshold are built according to the
+        # policy: "full", "truncate", "summarize", or "skip"
+        "tobj_string_policy": os.environ.get("COVALENT_TOBJ_STRING_POLICY", "summarize"),
+        "tobj_string_threshold": int(os.environ.get("COVALENT_TOBJ_STRING_THRESHOLD", 1048576)),
+        "tobj_string_max_length": int(os.environ.get("COVALENT_TOBJ_STRING_MAX_LENGTH", 4096)),
+        # Number of assets uploaded concurrently when submitting a dispatch
+        "upload_workers": int(os.environ.get("COVALENT_UPLOAD_WORKERS", 8)),
+        # Number of assets downloaded concurrently when retrieving a result
+        "download_workers": int(os.environ.get("COVALENT_DOWNLOAD_WORKERS", 8)),
     }
 
 
@@ -121,6 +131,18 @@ def get_default_dispatcher_config():
         "use_async_dispatcher": os.environ.get("COVALENT_USE_ASYNC_DISPATCHER", "true") or "false",
         "data_uri_filter_policy": os.environ.get("COVALENT_DATA_URI_FILTER_POLICY", "http"),
         "asset_cache_size": int(os.environ.get("COVALENT_ASSET_CACHE_SIZE", 32)),
+        "node_update_batch_window": float(
+            os.environ.get("COVALENT_NODE_UPDATE_BATCH_WINDOW", 0.01)
+        ),
+        "db_concurrency": os.environ.get("COVALENT_DB_CONCURRENCY", "false"),
+        "db_workers": int(os.environ.get("COVALENT_DB_WORKERS", 4)),
+        "db_async": os.environ.get("COVALENT_DB_ASYNC", "false"),
+        "asset_dedup": os.environ.get("COVALENT_ASSET_DEDUP", "false"),
+        # Compression codec ("none", "gzip", "zstd", "lz4") by asset file extension
+        "asset_compression": {
+            ext: os.environ.get("COVALENT_ASSET_COMPRESSION", "none")
+            for ext in ("tobj", "pkl", "json", "log", "txt")
+        },
     }
 
 
@@ -34,6 +34,7 @@ ELECTRON_METADATA_KEYS = {
     "executor",
     "executor_data",
     "qelectron_data_exists",
+    "cache",
 }
 
 ELECTRON_ASSET_KEYS = {
@@ -100,6 +101,7 @@ class ElectronMetadata(BaseModel):
     executor: str
     executor_data: dict
     qelectron_data_exists: Optional[bool] = None
+    cache: bool = False
     sub_dispatch_id: Optional[str] = None
     status: StatusEnum
     start_time: Optional[datetime] = None
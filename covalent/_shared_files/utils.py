@@ -242,9 +242,11 @@ def format_server_url(hostname: str = None, port: int = None) -> str:
 # For use by LocalDispatcher and ResultsManager when running Covalent
 # server locally
 def copy_file_locally(src_uri, dest_uri):
+    from .._serialize.common import parse_asset_uri
+
     scheme_prefix = "file://"
     if src_uri.startswith(scheme_prefix):
-        src_path = src_uri[len(scheme_prefix) :]
+        src_path, offset, size = parse_asset_uri(src_uri)
     else:
         raise TypeError(f"{src_uri} is not a valid URI")
         # src_path = src_uri
@@ -253,7 +255,14 @@ def copy_file_locally(src_uri, dest_uri):
     else:
         raise TypeError(f"{dest_uri} is not a valid URI")
 
-    shutil.copyfile(src_path, dest_path)
+    if size is None:
+        shutil.copyfile(src_path, dest_path)
+        return
+
+    # Extract the asset from an asset pack
+    with open(src_path, "rb") as reader, open(dest_path, "wb") as writer:
+        reader.seek(offset)
+        writer.write(reader.read(size))
 
 
 def get_qelectron_db_path(dispatch_id: str, task_id: int):
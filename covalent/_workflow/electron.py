@@ -684,6 +684,7 @@ def electron(
     deps_module: Union[DepsModule, List[DepsModule], str, List[str]] = None,
     call_before: Union[List[DepsCall], DepsCall] = None,
     call_after: Union[List[DepsCall], DepsCall] = None,
+    cache: bool = False,
 ) -> Callable:  # sourcery skip: assign-if-exp
     """
     Electron decorator to be called upon a function. Returns the wrapper function with the same functionality as `_func`.
@@ -701,6 +702,8 @@ def electron(
         call_before: An optional list of DepsCall objects specifying python functions to invoke before the electron
         call_after: An optional list of DepsCall objects specifying python functions to invoke after the electron
         files: An optional list of FileTransfer objects which copy files to/from remote or local filesystems.
+        cache: Whether to reuse the outputs of a previously completed electron, possibly from another dispatch,
+            with the same function, hooks, and inputs instead of executing the electron again.
 
     Returns:
         :obj:`Electron <covalent._workflow.electron.Electron>` : Electron object inside which the decorated function exists.
@@ -798,6 +801,7 @@ def electron(
     constraints = {
         "executor": executor,
         "hooks": hooks,
+        "cache": cache,
     }
     constraints = encode_metadata(constraints)
 
@@ -177,6 +177,20 @@ def add_module_deps_to_lattice_metadata(pp, bound_electrons: Dict[int, Any]):
     pp.lattice.metadata = old_lattice_metadata
 
 
+class DeferredNodeValue:
+    """A node value that is loaded when it is first accessed.
+
+    Args:
+        loader: A callable returning the value
+    """
+
+    def __init__(self, loader: Callable[[], Any]) -> None:
+        self._loader = loader
+
+    def load(self) -> Any:
+        return self._loader()
+
+
 class _TransportGraph:
     """
     A TransportGraph is the most essential part of the whole workflow. This contains
@@ -297,7 +311,11 @@ class _TransportGraph:
         Raises:
             KeyError: If the value key or node key is not found.
         """
-        return self._graph.nodes[node_key][value_key]
+        value = self._graph.nodes[node_key][value_key]
+        if isinstance(value, DeferredNodeValue):
+            value = value.load()
+            self._graph.nodes[node_key][value_key] = value
+        return value
 
     def set_node_value(self, node_key: str, value_key: int, value: Any) -> None:
         """
@@ -18,11 +18,16 @@
 
 import base64
 import json
+import pickle
 import platform
-from typing import Any, Callable, Tuple
+import pickletools
+import reprlib
+from typing import Any, Callable, Iterator, List, Sequence, Tuple, Union
 
 import cloudpickle
 
+from .._shared_files.config import get_config
+
 #  [string offset (8 bytes), big][data offset (8 bytes), big][header][string][data]
 
 STRING_OFFSET_BYTES = 8
@@ -30,18 +35,60 @@ DATA_OFFSET_BYTES = 8
 HEADER_OFFSET = STRING_OFFSET_BYTES + DATA_OFFSET_BYTES
 BYTE_ORDER = "big"
 
+# Archive header key recording how the data segment is encoded. Older
+# archives don't set it and store base64-encoded picklebytes.
+DATA_FORMAT_KEY = "data_format"
+DATA_FORMAT_RAW = "raw"
+DATA_FORMAT_BASE64 = "base64"
+
+# Pickle protocol 5 with out-of-band buffers. The data segment holds
+# the picklebytes followed by each buffer; the header records the
+# (offset, size) of each of these relative to the data offset.
+DATA_FORMAT_BUFFERS = "buffers"
+BUFFER_LAYOUT_KEY = "buffer_layout"
+
+# Out-of-band buffers start on this boundary in the archive so that
+# arrays mapped directly from a file are aligned.
+BUFFER_ALIGNMENT = 64
+
+PICKLE_PROTOCOL = 5
+
+# Policies for the string representation of large objects
+STRING_POLICY_FULL = "full"
+STRING_POLICY_TRUNCATE = "truncate"
+STRING_POLICY_SUMMARIZE = "summarize"
+STRING_POLICY_SKIP = "skip"
+STRING_POLICIES = {
+    STRING_POLICY_FULL,
+    STRING_POLICY_TRUNCATE,
+    STRING_POLICY_SUMMARIZE,
+    STRING_POLICY_SKIP,
+}
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
 
 class _TOArchive:
     """Archived transportable object."""
 
-    def __init__(self, header: bytes, object_string: bytes, data: bytes):
+    def __init__(
+        self,
+        header: bytes,
+        object_string: bytes,
+        data: Union[BytesLike, Sequence[BytesLike]],
+        *,
+        alignment: int = 1,
+    ):
         """
         Initialize TOArchive.
 
         Args:
             header: Archived transportable object header.
             object_string: Archived transportable object string.
-            data: Archived transportable object data.
+            data: Archived transportable object data, either as a single
+                bytes-like object or as a sequence of consecutive segments.
+            alignment: Pad the header with whitespace so that the data
+                offset is a multiple of `alignment`.
 
         Returns:
             None
@@ -50,6 +97,7 @@ class _TOArchive:
         self.header = header
         self.object_string = object_string
         self.data = data
+        self.alignment = alignment
 
     def cat(self) -> bytes:
         """
@@ -60,7 +108,24 @@ class _TOArchive:
 
         """
 
-        header_size = len(self.header)
+        # Copy the (possibly large) data segment only once
+        return b"".join(self.segments())
+
+    def segments(self) -> List[BytesLike]:
+        """
+        Return the consecutive segments of the archive without concatenating them.
+
+        Returns:
+            [string offset, data offset, header, string, *data]
+
+        """
+
+        header = self.header
+        unpadded_size = HEADER_OFFSET + len(header) + len(self.object_string)
+        # JSON allows trailing whitespace
+        header += b" " * (-unpadded_size % self.alignment)
+
+        header_size = len(header)
         string_size = len(self.object_string)
         data_offset = STRING_OFFSET_BYTES + DATA_OFFSET_BYTES + header_size + string_size
         string_offset = STRING_OFFSET_BYTES + DATA_OFFSET_BYTES + header_size
@@ -68,13 +133,22 @@ class _TOArchive:
         data_offset = data_offset.to_bytes(DATA_OFFSET_BYTES, BYTE_ORDER, signed=False)
         string_offset = string_offset.to_bytes(STRING_OFFSET_BYTES, BYTE_ORDER, signed=False)
 
-        return string_offset + data_offset + self.header + self.object_string + self.data
+        if isinstance(self.data, (bytes, bytearray, memoryview)):
+            data = [self.data]
+        else:
+            data = list(self.data)
+
+        return [string_offset, data_offset, header, self.object_string, *data]
 
     @staticmethod
-    def load(serialized: bytes, header_only: bool, string_only: bool) -> "_TOArchive":
+    def load(serialized: BytesLike, header_only: bool, string_only: bool) -> "_TOArchive":
         """
         Load TOArchive object from serialized bytes.
 
+        The archive segments are zero-copy views into `serialized`,
+        which can be any bytes-like object such as a `memoryview` or
+        an `mmap`.
+
         Args:
             serialized: Serialized transportable object.
             header_only: Load header only.
@@ -85,6 +159,7 @@ class _TOArchive:
 
         """
 
+        serialized = memoryview(serialized)
         string_offset = TOArchiveUtils.string_offset(serialized)
         header = TOArchiveUtils.parse_header(serialized, string_offset)
         object_string = b""
@@ -119,7 +194,7 @@ class TOArchiveUtils:
 
     @staticmethod
     def data_byte_range(serialized: bytes) -> Tuple[int, int]:
-        """Return byte range for the b64 picklebytes"""
+        """Return byte range for the picklebytes (base64-encoded in legacy archives)"""
         start_byte = TOArchiveUtils.data_offset(serialized)
         return start_byte, -1
 
@@ -144,16 +219,19 @@ class TransportableObject:
     will also contain additional info like the python version used to serialize it.
 
     Attributes:
-        _object: The serialized object.
+        _object: The picklebytes of the object.
+        _buffers: Out-of-band pickle buffers, such as the data of NumPy arrays.
         python_version: The python version used on the client's machine.
     """
 
     def __init__(self, obj: Any) -> None:
-        b64object = base64.b64encode(cloudpickle.dumps(obj))
-        object_string_u8 = str(obj).encode("utf-8")
+        buffers = []
+        self._object = cloudpickle.dumps(
+            obj, protocol=PICKLE_PROTOCOL, buffer_callback=buffers.append
+        )
+        self._buffers = list(map(_snapshot_buffer, buffers))
 
-        self._object = b64object.decode("utf-8")
-        self._object_string = object_string_u8.decode("utf-8")
+        self._object_string, string_repr = _make_object_string(obj, self._pickled_size())
 
         self._header = {
             "py_version": platform.python_version(),
@@ -162,6 +240,7 @@ class TransportableObject:
                 "doc": getattr(obj, "__doc__", ""),
                 "name": getattr(obj, "__name__", ""),
             },
+            "string_repr": string_repr,
         }
 
     @property
@@ -176,19 +255,45 @@ class TransportableObject:
     def attrs(self):
         return self._header["attrs"]
 
+    @property
+    def string_repr(self) -> dict:
+        """How `object_string` was built; see `_make_object_string`."""
+        return self._header.get("string_repr", {"policy": STRING_POLICY_FULL, "complete": True})
+
     @property
     def object_string(self):
         # For compatibility with older Covalent
-        try:
-            return self._object_string
-        except AttributeError:
+        if "_object_string" not in self.__dict__:
             return self.__dict__["object_string"]
 
+        return self._object_string
+
+    def _pickled_size(self) -> int:
+        """Size of the picklebytes, including out-of-band buffers."""
+        buffers = getattr(self, "_buffers", [])
+        return len(self._object) + sum(memoryview(buf).nbytes for buf in buffers)
+
     def __eq__(self, obj) -> bool:
         if not isinstance(obj, TransportableObject):
             return False
         return self.__dict__ == obj.__dict__
 
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        # memoryviews (e.g. into a loaded archive) can't be pickled
+        if isinstance(state.get("_object"), memoryview):
+            state["_object"] = state["_object"].tobytes()
+        if state.get("_buffers"):
+            state["_buffers"] = [bytes(buf) for buf in state["_buffers"]]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        # Objects pickled by older Covalent hold base64-encoded picklebytes
+        if isinstance(state.get("_object"), str):
+            state["_object"] = base64.b64decode(state["_object"].encode("utf-8"))
+        state.setdefault("_buffers", [])
+        self.__dict__.update(state)
+
     def get_deserialized(self) -> Callable:
         """
         Get the deserialized transportable object.
@@ -201,11 +306,21 @@ class TransportableObject:
 
         """
 
-        return cloudpickle.loads(base64.b64decode(self._object.encode("utf-8")))
+        # Read-only buffers are copied so that the deserialized
+        # object is writable and independent of this one. Writable
+        # buffers (from a private file mapping) are used in place.
+        buffers = [
+            buf if not memoryview(buf).readonly else bytearray(buf)
+            for buf in getattr(self, "_buffers", [])
+        ]
+        return cloudpickle.loads(self._object, buffers=buffers)
 
     def to_dict(self) -> dict:
         """Return a JSON-serializable dictionary representation of self"""
-        return {"type": "TransportableObject", "attributes": self.__dict__.copy()}
+        attributes = self.__dict__.copy()
+        attributes["_object"] = self.get_serialized()
+        attributes["_buffers"] = []
+        return {"type": "TransportableObject", "attributes": attributes}
 
     @staticmethod
     def from_dict(object_dict) -> "TransportableObject":
@@ -219,7 +334,8 @@ class TransportableObject:
         """
 
         sc = TransportableObject(None)
-        sc.__dict__ = object_dict["attributes"]
+        sc.__dict__ = {}
+        sc.__setstate__(object_dict["attributes"].copy())
         return sc
 
     def get_serialized(self) -> str:
@@ -230,10 +346,19 @@ class TransportableObject:
             None
 
         Returns:
-            object: The serialized transportable object.
+            object: The base64-encoded picklebytes of the object.
         """
 
-        return self._object
+        picklebytes = self._object
+        buffers = getattr(self, "_buffers", [])
+        if buffers:
+            # Consumers expect self-contained picklebytes
+            sizes = [memoryview(buf).nbytes for buf in buffers]
+            picklebytes = b"".join(
+                buffers[segment] if isinstance(segment, int) else segment
+                for segment in _inband_pickle_segments(picklebytes, sizes)
+            )
+        return base64.b64encode(picklebytes).decode("utf-8")
 
     def serialize(self) -> bytes:
         """
@@ -248,6 +373,20 @@ class TransportableObject:
 
         return _to_archive(self).cat()
 
+    def serialize_segments(self) -> List[BytesLike]:
+        """
+        Serialize the transportable object as a list of consecutive segments.
+
+        Unlike `serialize()`, this doesn't copy out-of-band buffers into
+        a single bytes object. The segments can be written out with
+        `file.writelines()`.
+
+        Returns:
+            The segments which, concatenated, equal `serialize()`.
+        """
+
+        return _to_archive(self).segments()
+
     def serialize_to_json(self) -> str:
         """
         Serialize the transportable object to JSON.
@@ -296,13 +435,17 @@ class TransportableObject:
 
     @staticmethod
     def deserialize(
-        serialized: bytes, *, header_only: bool = False, string_only: bool = False
+        serialized: BytesLike, *, header_only: bool = False, string_only: bool = False
     ) -> "TransportableObject":
         """
         Deserialize the transportable object.
 
+        The picklebytes of the returned object are a view into
+        `serialized`, which must therefore not be modified or closed
+        while the object is in use.
+
         Args:
-            data: serialized transportable object
+            data: serialized transportable object (any bytes-like object)
 
         Returns:
             object: The deserialized transportable object.
@@ -370,10 +513,32 @@ def _to_archive(to: TransportableObject) -> _TOArchive:
 
     """
 
-    header = json.dumps(to._header).encode("utf-8")
-    object_string = to._object_string.encode("utf-8")
-    data = to._object.encode("utf-8")
-    return _TOArchive(header=header, object_string=object_string, data=data)
+    object_string = to.object_string.encode("utf-8")
+    buffers = getattr(to, "_buffers", [])
+    if not buffers:
+        header = json.dumps({**to._header, DATA_FORMAT_KEY: DATA_FORMAT_RAW}).encode("utf-8")
+        return _TOArchive(header=header, object_string=object_string, data=to._object)
+
+    segments = []
+    layout = []
+    offset = 0
+    for segment in [to._object, *buffers]:
+        padding = -offset % BUFFER_ALIGNMENT
+        if padding:
+            segments.append(b"\0" * padding)
+            offset += padding
+        size = memoryview(segment).nbytes
+        segments.append(segment)
+        layout.append((offset, size))
+        offset += size
+
+    header = {**to._header, DATA_FORMAT_KEY: DATA_FORMAT_BUFFERS, BUFFER_LAYOUT_KEY: layout}
+    return _TOArchive(
+        header=json.dumps(header).encode("utf-8"),
+        object_string=object_string,
+        data=segments,
+        alignment=BUFFER_ALIGNMENT,
+    )
 
 
 def _from_archive(ar: _TOArchive) -> TransportableObject:
@@ -388,12 +553,149 @@ def _from_archive(ar: _TOArchive) -> TransportableObject:
 
     """
 
-    decoded_object_str = ar.object_string.decode("utf-8")
-    decoded_data = ar.data.decode("utf-8")
-    decoded_header = json.loads(ar.header.decode("utf-8"))
+    decoded_object_str = str(ar.object_string, "utf-8")
+    decoded_header = json.loads(str(ar.header, "utf-8"))
+    data_format = decoded_header.pop(DATA_FORMAT_KEY, DATA_FORMAT_BASE64)
+    buffer_layout = decoded_header.pop(BUFFER_LAYOUT_KEY, [])
+    buffers = []
+    if data_format == DATA_FORMAT_RAW:
+        decoded_data = ar.data
+    elif data_format == DATA_FORMAT_BUFFERS:
+        decoded_data = ar.data
+        if len(decoded_data):
+            segments = [decoded_data[start : start + size] for start, size in buffer_layout]
+            decoded_data, buffers = segments[0], segments[1:]
+    else:
+        decoded_data = base64.b64decode(ar.data)
+
     to = TransportableObject(None)
     to._header = decoded_header
     to._object_string = decoded_object_str or ""
-    to._object = decoded_data or ""
+    to._object = decoded_data if len(decoded_data) else b""
+    to._buffers = buffers
 
     return to
+
+
+class _BoundedRepr(reprlib.Repr):
+    """A `reprlib.Repr` which stops representing objects after `budget` characters."""
+
+    def __init__(self, budget: int) -> None:
+        super().__init__()
+        self.budget = budget
+
+    def repr1(self, x, level):
+        if self.budget <= 0:
+            return "..."
+        budget = self.budget
+        object_string = super().repr1(x, level)
+        self.budget = budget - len(object_string)
+        return object_string
+
+
+def _make_object_string(obj: Any, pickled_size: int) -> Tuple[str, dict]:
+    """Build the string representation of an object.
+
+    Objects whose picklebytes exceed `sdk.tobj_string_threshold` are
+    handled according to `sdk.tobj_string_policy`:
+
+    - full: always use `str(obj)`
+    - truncate: use the first `sdk.tobj_string_max_length` characters
+      of a representation showing as many elements of containers as fit
+    - summarize: use a `reprlib` summary showing a few elements of
+      containers
+    - skip: don't build a string representation at all
+
+    Except for `full`, the work done doesn't grow with the size of the
+    object beyond `sdk.tobj_string_max_length`.
+
+    Args:
+        obj: The object to represent.
+        pickled_size: Size of the picklebytes, including out-of-band buffers.
+
+    Returns:
+        The string representation and a description of how it was
+        built, to be recorded in the header.
+    """
+
+    policy = get_config("sdk.tobj_string_policy")
+    if policy not in STRING_POLICIES:
+        raise ValueError(f"Unknown TransportableObject string policy {policy}")
+
+    if policy == STRING_POLICY_FULL or pickled_size <= get_config("sdk.tobj_string_threshold"):
+        return str(obj), {"policy": STRING_POLICY_FULL, "complete": True}
+
+    if policy == STRING_POLICY_SKIP:
+        return "", {"policy": policy, "complete": False}
+
+    max_length = get_config("sdk.tobj_string_max_length")
+    if isinstance(obj, str):
+        return obj[:max_length], {"policy": policy, "complete": len(obj) <= max_length}
+
+    summarizer = _BoundedRepr(max_length)
+    summarizer.maxstring = summarizer.maxlong = summarizer.maxother = max_length
+    if policy == STRING_POLICY_TRUNCATE:
+        # Show as many elements of each container as may fit
+        for limit in (
+            "maxtuple",
+            "maxlist",
+            "maxarray",
+            "maxdict",
+            "maxset",
+            "maxfrozenset",
+            "maxdeque",
+        ):
+            setattr(summarizer, limit, max_length)
+
+    return summarizer.repr(obj)[:max_length], {"policy": policy, "complete": False}
+
+
+def _snapshot_buffer(buffer: pickle.PickleBuffer) -> BytesLike:
+    """Detach an out-of-band buffer from the object being pickled.
+
+    Read-only buffers can't change and are kept as views; writable
+    ones are copied so that the TransportableObject isn't affected by
+    later modifications of the original object. Creating a
+    TransportableObject from a writable NumPy array therefore still
+    holds two copies of its data until the array is released; mark the
+    array read-only (`arr.flags.writeable = False`) to avoid the copy.
+    """
+
+    raw = buffer.raw()
+    return raw if raw.readonly else raw.tobytes()
+
+
+def _inband_pickle_segments(
+    picklebytes: BytesLike, buffer_sizes: Sequence[int]
+) -> Iterator[Union[bytes, int]]:
+    """Rewrite picklebytes with out-of-band buffers as self-contained picklebytes.
+
+    Each reference to an out-of-band buffer is replaced by an in-band
+    bytearray holding its data. This only rewrites the pickle opcodes,
+    so the object is never unpickled.
+
+    Args:
+        picklebytes: Picklebytes referencing out-of-band buffers.
+        buffer_sizes: The size of each out-of-band buffer.
+
+    Returns:
+        Yields the segments of the in-band picklebytes: either bytes,
+        or the index of the buffer whose data goes there.
+    """
+
+    picklebytes = bytes(picklebytes)
+    buffer_index = 0
+    start = 0
+    for opcode, arg, pos in pickletools.genops(picklebytes):
+        if opcode.name == "FRAME":
+            # Frames are optional, and their lengths would no longer match
+            yield picklebytes[start:pos]
+            start = pos + 1 + 8
+        elif opcode.name == "NEXT_BUFFER":
+            yield picklebytes[start:pos]
+            size = buffer_sizes[buffer_index]
+            yield pickle.BYTEARRAY8 + size.to_bytes(8, "little")
+            yield buffer_index
+            buffer_index += 1
+            start = pos + 1
+    yield picklebytes[start:]
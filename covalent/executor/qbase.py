@@ -15,12 +15,13 @@
 # limitations under the License.
 
 import asyncio
+import math
 import time
 from abc import ABC, abstractmethod
 from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
-from threading import Thread
-from typing import Any, Dict, List, Optional, Sequence, Union
+from threading import Thread, local
+from typing import Any, Dict, List, Literal, Optional, Sequence, Union
 
 import orjson
 import pennylane as qml
@@ -43,6 +44,9 @@ __all__ = [
 
 SHOTS_DEFAULT = -1
 
+# Devices created by the current pool worker, see `get_worker_device`
+_worker_local = local()
+
 
 def orjson_dumps(v, *, default):
     return orjson.dumps(v, default=default).decode()  # pylint: disable=no-member
@@ -78,6 +82,76 @@ def get_asyncio_event_loop():
     return loop
 
 
+def get_worker_device(device_name: str, wires: int, shots: Any) -> qml.Device:
+    """
+    Return a device for the current thread or process, creating it on first use.
+    Devices are reset before each execution, so they can be reused by the
+    circuits a worker runs.
+    """
+    devices = getattr(_worker_local, "devices", None)
+    if devices is None:
+        devices = _worker_local.devices = {}
+
+    key = (device_name, wires, repr(shots))
+    if key not in devices:
+        devices[key] = qml.device(device_name, wires=wires, shots=shots)
+
+    return devices[key]
+
+
+def run_chunk(executor: "BaseQExecutor", qscripts: List[qml.tape.QuantumScript]):
+    """
+    Run a chunk of circuits with the given executor, on a device cached by the
+    current worker.
+    """
+    dev = get_worker_device(
+        executor.device,
+        executor.qelectron_info.device_wires,
+        executor.qelectron_info.device_shots,
+    )
+    return executor.run_circuits(qscripts, dev)
+
+
+def get_chunks(qscripts_list, num_chunks: int) -> List[List[qml.tape.QuantumScript]]:
+    """
+    Split a list of circuits into at most `num_chunks` contiguous chunks of equal size.
+    """
+    qscripts_list = list(qscripts_list)
+    chunk_size = max(1, math.ceil(len(qscripts_list) / num_chunks))
+    return [qscripts_list[i : i + chunk_size] for i in range(0, len(qscripts_list), chunk_size)]
+
+
+class _ChunkFuture:
+    """
+    Future for one circuit in a chunk, i.e. the `index`-th result of `future`.
+    """
+
+    __slots__ = ("future", "index")
+
+    def __init__(self, future, index: int):
+        self.future = future
+        self.index = index
+
+
+def _get_pool_results(futures_list, get_result) -> List["QCResult"]:
+    """
+    Wait for pool futures and return one result object per circuit. Accepts both
+    plain futures, which resolve to a single result object, and chunk futures.
+    """
+    chunk_results = {}
+    result_objs = []
+    for fut in futures_list:
+        if not isinstance(fut, _ChunkFuture):
+            result_objs.append(get_result(fut))
+            continue
+
+        if id(fut.future) not in chunk_results:
+            chunk_results[id(fut.future)] = get_result(fut.future)
+        result_objs.append(chunk_results[id(fut.future)][fut.index])
+
+    return result_objs
+
+
 class BaseQExecutor(ABC, BaseModel):
     """
     Base class for all Quantum Executors.
@@ -87,6 +161,16 @@ class BaseQExecutor(ABC, BaseModel):
     shots_converter: Optional[type] = None
     persist_data: bool = True
 
+    # How much of each circuit is stored in the node's database: nothing,
+    # metadata only, or metadata together with the circuit and its results.
+    # Setting `persist_data=False` limits this to metadata.
+    persistence: Literal["none", "metadata", "full"] = "full"
+
+    # Reuse the results of identical circuits instead of re-executing them.
+    # With `persist_cache`, results are also kept in the node's database.
+    cache_results: bool = False
+    persist_cache: bool = False
+
     # Executors need to contain certain information about original QNode, in order
     # to produce correct results. These attributes below contain that information.
     # They are set inside the `QServer` and will be `None` client-side.
@@ -142,6 +226,35 @@ class BaseQExecutor(ABC, BaseModel):
 
         return result_obj
 
+    def run_circuits(self, qscripts, device) -> List["QCResult"]:
+        """
+        Execute several circuits on a device and return one result object per circuit.
+        The circuits are executed as a single batch, with its execution time split
+        evenly between them, unless a subclass overrides `run_circuit`.
+        """
+        if type(self).run_circuit is not BaseQExecutor.run_circuit:
+            return [
+                self.run_circuit(
+                    qscript,
+                    device,
+                    QCResult.with_metadata(device_name=device.short_name, executor=self),
+                )
+                for qscript in qscripts
+            ]
+
+        start_time = time.perf_counter()
+        results = qml.execute(qscripts, device, gradient_fn="best")
+        execution_time = (time.perf_counter() - start_time) / len(qscripts)
+
+        result_objs = []
+        for result in results:
+            result_obj = QCResult.with_metadata(device_name=device.short_name, executor=self)
+            result_obj.results = [result]
+            result_obj.execution_time = execution_time
+            result_objs.append(result_obj)
+
+        return result_objs
+
     def dict(self, *args, **kwargs):
         dict_ = super().model_dump(*args, **kwargs)
 
@@ -295,25 +408,17 @@ class BaseProcessPoolQExecutor(BaseQExecutor):
     def batch_submit(self, qscripts_list):
         pool = get_process_pool(self.num_processes)
 
+        # Each task runs a chunk of circuits, so that neither the executor
+        # nor a device needs to be sent to the worker processes per circuit.
         futures = []
-        for qscript in qscripts_list:
-            dev = qml.device(
-                self.device,
-                wires=self.qelectron_info.device_wires,
-                shots=self.qelectron_info.device_shots,
-            )
-
-            result_obj = QCResult.with_metadata(
-                device_name=dev.short_name,
-                executor=self,
-            )
-            fut = pool.apply_async(self.run_circuit, args=(qscript, dev, result_obj))
-            futures.append(fut)
+        for chunk in get_chunks(qscripts_list, self.num_processes):
+            fut = pool.apply_async(run_chunk, args=(self, chunk))
+            futures.extend(_ChunkFuture(fut, i) for i in range(len(chunk)))
 
         return futures
 
     def batch_get_results(self, futures_list: List) -> List[QCResult]:
-        return [fut.get() for fut in futures_list]
+        return _get_pool_results(futures_list, lambda fut: fut.get())
 
 
 class BaseThreadPoolQExecutor(BaseQExecutor):
@@ -323,22 +428,13 @@ class BaseThreadPoolQExecutor(BaseQExecutor):
     def batch_submit(self, qscripts_list):
         pool = get_thread_pool(self.num_threads)
 
+        # Each task runs a chunk of circuits on a device cached by its thread.
         futures = []
-        for qscript in qscripts_list:
-            dev = qml.device(
-                self.device,
-                wires=self.qelectron_info.device_wires,
-                shots=self.qelectron_info.device_shots,
-            )
-
-            result_obj = QCResult.with_metadata(
-                device_name=dev.short_name,
-                executor=self,
-            )
-            fut = pool.submit(self.run_circuit, qscript, dev, result_obj)
-            futures.append(fut)
+        for chunk in get_chunks(qscripts_list, self.num_threads):
+            fut = pool.submit(run_chunk, self, chunk)
+            futures.extend(_ChunkFuture(fut, i) for i in range(len(chunk)))
 
         return futures
 
     def batch_get_results(self, futures_list: List) -> List[QCResult]:
-        return [fut.result() for fut in futures_list]
+        return _get_pool_results(futures_list, lambda fut: fut.result())
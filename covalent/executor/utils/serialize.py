@@ -20,7 +20,12 @@ Functions for serializing and deserializing assets
 
 from typing import Any
 
-from ..._serialize.common import deserialize_asset, serialize_asset
+from ..._serialize.common import (
+    deserialize_asset,
+    read_asset_file,
+    serialize_asset,
+    write_asset_file,
+)
 from ..._serialize.electron import ASSET_TYPES
 
 
@@ -31,3 +36,14 @@ def serialize_node_asset(data: Any, key: str) -> bytes:
 
 def deserialize_node_asset(data: bytes, key: str) -> Any:
     return deserialize_asset(data, ASSET_TYPES[key])
+
+
+def save_node_asset(data: Any, key: str, path: str) -> int:
+    """Serialize a node asset to a file, returning its size."""
+    _, size = write_asset_file(data, ASSET_TYPES[key], path)
+    return size
+
+
+def load_node_asset(path: str, key: str) -> Any:
+    """Deserialize a node asset from a file, memory-mapping large buffers."""
+    return read_asset_file(path, ASSET_TYPES[key])
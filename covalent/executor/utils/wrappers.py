@@ -18,11 +18,15 @@
 Helper functions for the local executor
 """
 
+import hashlib
 import io
 import json
 import os
 import sys
+import threading
 import traceback
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
 from typing import Any, Callable, Dict, List, Tuple
@@ -35,7 +39,11 @@ from covalent._workflow.depscall import RESERVED_RETVAL_KEY__FILES, DepsCall
 from covalent._workflow.depspip import DepsPip
 from covalent._workflow.transport import TransportableObject
 from covalent.executor.utils import set_context
-from covalent.executor.utils.serialize import deserialize_node_asset, serialize_node_asset
+from covalent.executor.utils.serialize import (
+    deserialize_node_asset,
+    load_node_asset,
+    save_node_asset,
+)
 
 
 def wrapper_fn(
@@ -53,6 +61,22 @@ def wrapper_fn(
 
     """
 
+    return _invoke(function.get_deserialized, call_before, call_after, args, kwargs)
+
+
+def _invoke(
+    load_function: Callable[[], Callable],
+    call_before: List,
+    call_after: List,
+    args: Tuple,
+    kwargs: Dict,
+) -> TransportableObject:
+    """Run the call_before hooks, the task function, and the call_after hooks.
+
+    The function is only loaded after the call_before hooks have run
+    since they may install packages it depends on.
+    """
+
     cb_retvals = {}
     for tup in call_before:
         serialized_fn, serialized_args, serialized_kwargs, retval_key = tup
@@ -74,7 +98,7 @@ def wrapper_fn(
         for key, value in cb_retvals.items()
     }
 
-    fn = function.get_deserialized()
+    fn = load_function()
 
     new_args = [arg.get_deserialized() for arg in args]
 
@@ -120,12 +144,21 @@ def io_wrapper(
 
 
 # Copied from runner.py
-def _gather_deps(deps, call_before_objs_json, call_after_objs_json) -> Tuple[List, List]:
-    """Assemble deps for a node into the final call_before and call_after"""
+def _gather_deps(
+    deps, call_before_objs_json, call_after_objs_json, skip_deps: bool = False
+) -> Tuple[List, List]:
+    """Assemble deps for a node into the final call_before and call_after
+
+    If `skip_deps` is set, the pip and bash deps are assumed to be
+    already satisfied and are omitted.
+    """
 
     call_before = []
     call_after = []
 
+    if skip_deps:
+        deps = {}
+
     # Rehydrate deps from JSON
     if "bash" in deps:
         dep = DepsBash()
@@ -150,6 +183,211 @@ def _gather_deps(deps, call_before_objs_json, call_after_objs_json) -> Tuple[Lis
     return call_before, call_after
 
 
+class _LRUCache:
+    """A bounded, thread-safe mapping evicting the least recently used entries."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, key) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def add(self, key, value=True):
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_load(self, key, load: Callable[[], Any]) -> Any:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                return self._entries[key]
+        value = load()
+        self.add(key, value)
+        return value
+
+
+# Worker-local caches keyed by the digest of the serialized function
+# or hooks. These live for the lifetime of the worker process
+# (LocalExecutor pool process or Dask worker), so large maps of one
+# electron only deserialize its function and install its deps once.
+TASK_CACHE_SIZE = 128
+_function_cache = _LRUCache(TASK_CACHE_SIZE)
+_hooks_cache = _LRUCache(TASK_CACHE_SIZE)
+_satisfied_deps = _LRUCache(TASK_CACHE_SIZE)
+
+
+def _run_cached_task(
+    dispatch_id: str,
+    task_id: int,
+    fn_data: bytes,
+    hooks_data: bytes,
+    args: List,
+    kwargs: Dict,
+) -> TransportableObject:
+    """Run a task, reusing deserialized functions and prepared hooks.
+
+    Args:
+        dispatch_id: The dispatch id
+        task_id: The node id of the task
+        fn_data: The serialized function asset
+        hooks_data: The serialized hooks asset
+        args: The serialized positional arguments
+        kwargs: The serialized keyword arguments
+
+    Returns:
+        The serialized task output
+    """
+    fn_digest = hashlib.sha1(fn_data).hexdigest()
+    hooks_digest = hashlib.sha1(hooks_data).hexdigest()
+
+    # Pip and bash deps only need to run once per worker
+    deps_satisfied = hooks_digest in _satisfied_deps
+
+    def _prepare_hooks():
+        hooks_json = deserialize_node_asset(hooks_data, "hooks")
+        return _gather_deps(
+            hooks_json.get("deps", {}),
+            hooks_json.get("call_before", []),
+            hooks_json.get("call_after", []),
+            skip_deps=deps_satisfied,
+        )
+
+    def _load_function():
+        serialized_fn = deserialize_node_asset(fn_data, "function")
+        return serialized_fn.get_deserialized()
+
+    call_before, call_after = _hooks_cache.get_or_load(
+        (hooks_digest, deps_satisfied), _prepare_hooks
+    )
+
+    with set_context(dispatch_id, task_id):
+        output = _invoke(
+            lambda: _function_cache.get_or_load(fn_digest, _load_function),
+            call_before,
+            call_after,
+            args,
+            kwargs,
+        )
+
+    _satisfied_deps.add(hooks_digest)
+    return output
+
+
+def _read_file(path: str) -> bytes:
+    with open(path, "rb") as f:
+        return f.read()
+
+
+# Bound on concurrent asset transfers per worker process
+MAX_TRANSFER_WORKERS = 8
+
+_session = None
+_transfer_pool = None
+_transfer_pid = None
+
+# Task groups may run concurrently in threaded workers (e.g. Dask)
+_transfer_lock = threading.Lock()
+
+
+def _reset_transfer_lock():
+    global _transfer_lock
+    _transfer_lock = threading.Lock()
+
+
+# A lock held by another thread at fork time would stay locked in the child
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_transfer_lock)
+
+
+def _init_transfers():
+    global _session, _transfer_pool, _transfer_pid
+
+    # Neither sessions nor thread pools survive a fork
+    if _transfer_pid == os.getpid():
+        return
+
+    with _transfer_lock:
+        if _transfer_pid == os.getpid():
+            return
+
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=MAX_TRANSFER_WORKERS, pool_maxsize=MAX_TRANSFER_WORKERS
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _session = session
+        _transfer_pool = ThreadPoolExecutor(max_workers=MAX_TRANSFER_WORKERS)
+        _transfer_pid = os.getpid()
+
+
+def _get_session() -> requests.Session:
+    """Return the keep-alive HTTP session of this worker process."""
+    _init_transfers()
+    return _session
+
+
+def _get_transfer_pool() -> ThreadPoolExecutor:
+    """Return the thread pool for concurrent asset transfers of this worker process."""
+    _init_transfers()
+    return _transfer_pool
+
+
+def _download(url: str) -> bytes:
+    resp = _get_session().get(url, stream=True)
+    resp.raise_for_status()
+    return resp.content
+
+
+def _download_asset(url: str, key: str) -> Any:
+    return deserialize_node_asset(_download(url), key)
+
+
+def _upload_file(url: str, path: str):
+    with open(path, "rb") as f:
+        _get_session().put(url, data=f)
+
+
+def _upload_task_artifacts(
+    server_url: str,
+    dispatch_id: str,
+    task_id: int,
+    result_uri: str,
+    stdout_uri: str,
+    stderr_uri: str,
+    qelectron_db_bytes: bytes,
+    terminal_status: str,
+):
+    """Upload the artifacts of a task and then report its terminal status."""
+
+    session = _get_session()
+    pool = _get_transfer_pool()
+    asset_url = f"{server_url}/api/v2/dispatches/{dispatch_id}/electrons/{task_id}/assets"
+
+    futures = []
+    for key, path in (("output", result_uri), ("stdout", stdout_uri), ("stderr", stderr_uri)):
+        if path:
+            futures.append(pool.submit(_upload_file, f"{asset_url}/{key}", path))
+
+    if qelectron_db_bytes:
+        futures.append(
+            pool.submit(session.put, f"{asset_url}/qelectron_db", data=qelectron_db_bytes)
+        )
+
+    for fut in futures:
+        fut.result()
+
+    url = f"{server_url}/api/v2/dispatches/{dispatch_id}/electrons/{task_id}/job"
+    data = {"status": terminal_status}
+    session.put(url, json=data)
+
+
 # Basic wrapper for executing a topologically sorted sequence of
 # tasks. For the `task_specs` and `resources` schema see the comments
 # for `AsyncBaseExecutor.send()`.
@@ -182,6 +420,13 @@ def run_task_group(
     os.environ["COVALENT_DISPATCH_ID"] = dispatch_id
     os.environ["COVALENT_DISPATCHER_URL"] = server_url
 
+    # Artifacts are uploaded in the order in which tasks finish
+    upload_pool = ThreadPoolExecutor(max_workers=1)
+    uploads = []
+
+    pool = _get_transfer_pool()
+    electrons_url = f"{server_url}/api/v2/dispatches/{dispatch_id}/electrons"
+
     for i, task in enumerate(task_specs):
         result_uri, stdout_uri, stderr_uri, qelectron_db_uri = output_uris[i]
 
@@ -195,59 +440,49 @@ def run_task_group(
                     args_ids = task["args_ids"]
                     kwargs_ids = task["kwargs_ids"]
 
-                    function_uri = f"{server_url}/api/v2/dispatches/{dispatch_id}/electrons/{task_id}/assets/function"
-
-                    # Download function
-                    resp = requests.get(function_uri, stream=True)
-                    resp.raise_for_status()
-                    serialized_fn = deserialize_node_asset(resp.content, "function")
-
-                    ser_args = []
-                    ser_kwargs = {}
+                    # Download the function, hooks, and inputs
+                    # concurrently; outputs of earlier tasks in the
+                    # group are handed off in memory
+                    fn_fut = pool.submit(_download, f"{electrons_url}/{task_id}/assets/function")
+                    hooks_fut = pool.submit(_download, f"{electrons_url}/{task_id}/assets/hooks")
+                    input_ids = {*args_ids, *kwargs_ids.values()}
+                    input_futs = {
+                        node_id: pool.submit(
+                            _download_asset, f"{electrons_url}/{node_id}/assets/output", "output"
+                        )
+                        for node_id in input_ids
+                        if node_id not in outputs
+                    }
+                    inputs = {
+                        node_id: outputs[node_id]
+                        if node_id in outputs
+                        else input_futs[node_id].result()
+                        for node_id in input_ids
+                    }
 
-                    # Download args and kwargs
-                    for node_id in args_ids:
-                        url = f"{server_url}/api/v2/dispatches/{dispatch_id}/electrons/{node_id}/assets/output"
-                        resp = requests.get(url, stream=True)
-                        resp.raise_for_status()
-                        ser_args.append(deserialize_node_asset(resp.content, "output"))
-
-                    for k, node_id in kwargs_ids.items():
-                        url = f"{server_url}/api/v2/dispatches/{dispatch_id}/electrons/{node_id}/assets/output"
-                        resp = requests.get(url, stream=True)
-                        resp.raise_for_status()
-                        ser_kwargs[k] = deserialize_node_asset(resp.content, "output")
-
-                    # Download deps, call_before, and call_after
-                    hooks_url = f"{server_url}/api/v2/dispatches/{dispatch_id}/electrons/{task_id}/assets/hooks"
-                    resp = requests.get(hooks_url, stream=True)
-                    resp.raise_for_status()
-                    hooks_json = deserialize_node_asset(resp.content, "hooks")
-                    deps_json = hooks_json.get("deps", {})
-                    call_before_json = hooks_json.get("call_before", [])
-                    call_after_json = hooks_json.get("call_after", [])
+                    ser_args = [inputs[node_id] for node_id in args_ids]
+                    ser_kwargs = {k: inputs[node_id] for k, node_id in kwargs_ids.items()}
 
                     # Assemble and run the task
-                    call_before, call_after = _gather_deps(
-                        deps_json, call_before_json, call_after_json
-                    )
                     exception_occurred = False
 
-                    with set_context(dispatch_id, task_id):
-                        transportable_output = wrapper_fn(
-                            serialized_fn, call_before, call_after, *ser_args, **ser_kwargs
-                        )
+                    transportable_output = _run_cached_task(
+                        dispatch_id,
+                        task_id,
+                        fn_fut.result(),
+                        hooks_fut.result(),
+                        ser_args,
+                        ser_kwargs,
+                    )
 
-                    ser_output = serialize_node_asset(transportable_output, "output")
-                    with open(result_uri, "wb") as f:
-                        f.write(ser_output)
+                    save_node_asset(transportable_output, "output", result_uri)
 
                     qelectron_db_path = get_qelectron_db_path(dispatch_id, task_id)
                     if qelectron_db_path is not None:
                         with open(qelectron_db_path / "data.mdb", "rb") as f:
                             qelectron_db_bytes = f.read()
 
-                    outputs[task_id] = result_uri
+                    outputs[task_id] = transportable_output
 
                     result_summary = {
                         "node_id": task_id,
@@ -275,29 +510,8 @@ def run_task_group(
                     break
 
                 finally:
-                    # POST task artifacts
-                    if result_uri:
-                        upload_url = f"{server_url}/api/v2/dispatches/{dispatch_id}/electrons/{task_id}/assets/output"
-                        with open(result_uri, "rb") as f:
-                            requests.put(upload_url, data=f)
-
                     sys.stdout.flush()
-                    if stdout_uri:
-                        upload_url = f"{server_url}/api/v2/dispatches/{dispatch_id}/electrons/{task_id}/assets/stdout"
-                        with open(stdout_uri, "rb") as f:
-                            headers = {"Content-Length": os.path.getsize(stdout_uri)}
-                            requests.put(upload_url, data=f)
-
                     sys.stderr.flush()
-                    if stderr_uri:
-                        upload_url = f"{server_url}/api/v2/dispatches/{dispatch_id}/electrons/{task_id}/assets/stderr"
-                        with open(stderr_uri, "rb") as f:
-                            headers = {"Content-Length": os.path.getsize(stderr_uri)}
-                            requests.put(upload_url, data=f)
-
-                    if qelectron_db_bytes:
-                        upload_url = f"{server_url}/api/v2/dispatches/{dispatch_id}/electrons/{task_id}/assets/qelectron_db"
-                        requests.put(upload_url, data=qelectron_db_bytes)
 
                     result_path = os.path.join(results_dir, f"result-{dispatch_id}:{task_id}.json")
 
@@ -306,11 +520,27 @@ def run_task_group(
 
                     results.append(result_summary)
 
-                    # Notify Covalent that the task has terminated
+                    # Upload task artifacts and notify Covalent that
+                    # the task has terminated while the next task runs
                     terminal_status = "FAILED" if exception_occurred else "COMPLETED"
-                    url = f"{server_url}/api/v2/dispatches/{dispatch_id}/electrons/{task_id}/job"
-                    data = {"status": terminal_status}
-                    requests.put(url, json=data)
+                    uploads.append(
+                        upload_pool.submit(
+                            _upload_task_artifacts,
+                            server_url,
+                            dispatch_id,
+                            task_id,
+                            result_uri,
+                            stdout_uri,
+                            stderr_uri,
+                            qelectron_db_bytes,
+                            terminal_status,
+                        )
+                    )
+
+    # Surface any upload errors
+    upload_pool.shutdown(wait=True)
+    for fut in uploads:
+        fut.result()
 
     # Deal with any tasks that did not run
     n = len(results)
@@ -333,7 +563,7 @@ def run_task_group(
                 json.dump(result_summary, f)
 
             url = f"{server_url}/api/v2/dispatches/{dispatch_id}/electrons/{task_id}/job"
-            requests.put(url)
+            _get_session().put(url)
 
 
 def run_task_group_alt(
@@ -386,9 +616,6 @@ def run_task_group_alt(
                     if function_uri.startswith(prefix):
                         function_uri = function_uri[prefix_len:]
 
-                    with open(function_uri, "rb") as f:
-                        serialized_fn = deserialize_node_asset(f.read(), "function")
-
                     # Load args and kwargs
                     ser_args = []
                     ser_kwargs = {}
@@ -397,44 +624,33 @@ def run_task_group_alt(
                     for uri in args_uris:
                         if uri.startswith(prefix):
                             uri = uri[prefix_len:]
-                        with open(uri, "rb") as f:
-                            ser_args.append(deserialize_node_asset(f.read(), "output"))
+                        ser_args.append(load_node_asset(uri, "output"))
 
                     kwargs_uris = {k: resources["inputs"][v] for k, v in kwargs_ids.items()}
                     for key, uri in kwargs_uris.items():
                         if uri.startswith(prefix):
                             uri = uri[prefix_len:]
-                        with open(uri, "rb") as f:
-                            ser_kwargs[key] = deserialize_node_asset(f.read(), "output")
+                        ser_kwargs[key] = load_node_asset(uri, "output")
 
                     # Load deps, call_before, and call_after
                     hooks_uri = resources["hooks"][task_id]
                     if hooks_uri.startswith(prefix):
                         hooks_uri = hooks_uri[prefix_len:]
-                    with open(hooks_uri, "rb") as f:
-                        hooks_json = deserialize_node_asset(f.read(), "hooks")
-                    deps_json = hooks_json.get("deps", {})
-                    call_before_json = hooks_json.get("call_before", [])
-                    call_after_json = hooks_json.get("call_after", [])
-
-                    # Assemble and invoke the task
-                    call_before, call_after = _gather_deps(
-                        deps_json, call_before_json, call_after_json
-                    )
 
                     exception_occurred = False
 
                     # Run the task function
-                    with set_context(dispatch_id, task_id):
-                        transportable_output = wrapper_fn(
-                            serialized_fn, call_before, call_after, *ser_args, **ser_kwargs
-                        )
-
-                    ser_output = serialize_node_asset(transportable_output, "output")
+                    transportable_output = _run_cached_task(
+                        dispatch_id,
+                        task_id,
+                        _read_file(function_uri),
+                        _read_file(hooks_uri),
+                        ser_args,
+                        ser_kwargs,
+                    )
 
                     # Save output
-                    with open(result_uri, "wb") as f:
-                        f.write(ser_output)
+                    output_size = save_node_asset(transportable_output, "output", result_uri)
 
                     # Save QElectron DB
                     qelectron_db_path = get_qelectron_db_path(dispatch_id, task_id)
@@ -447,7 +663,6 @@ def run_task_group_alt(
 
                     resources["inputs"][task_id] = result_uri
 
-                    output_size = len(ser_output)
                     qelectron_db_size = len(qelectron_db_bytes)
                     stdout.flush()
                     stderr.flush()
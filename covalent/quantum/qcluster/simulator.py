@@ -55,6 +55,17 @@ class Simulator(BaseQExecutor):
             :code:`shots` value from the original device if set to :code:`None` or
             a positive :code:`int`. The shots setting from the original device is
             is used by default.
+        cache_results: Whether to reuse the results of identical circuits, i.e. circuits
+            with the same operations, parameters, measurements, shots, and executor
+            settings, instead of executing them again. With a finite number of shots,
+            repeated circuits return the same samples. Defaults to :code:`False`.
+        persist_cache: Whether to also store cached results in the electron's QElectron
+            database, so that they outlive the process that computed them.
+            Defaults to :code:`False`.
+        persistence: How much of each circuit to store in the electron's QElectron
+            database. One of :code:`"none"`, :code:`"metadata"` (names, specs, executor,
+            and timings), or :code:`"full"` (also the circuit and its results).
+            Defaults to :code:`"full"`.
     """
 
     device: str = "default.qubit"
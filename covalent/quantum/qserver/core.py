@@ -18,10 +18,13 @@
 Quantum Server Implementation: Handles the async execution of quantum circuits.
 """
 
+import copy
 import datetime
 import uuid
 from asyncio import Task
-from typing import Callable, List, Tuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from typing import Callable, Dict, Iterator, List, Tuple
 
 from pennylane.tape import QuantumScript
 
@@ -31,10 +34,27 @@ from ..._shared_files.qelectron_utils import (
     select_first_executor,
 )
 from ..._shared_files.qinfo import QElectronInfo, QNodeSpecs
+from ...executor.qbase import QCResult
 from ...executor.utils import get_context
 from ..qcluster.base import AsyncBaseQCluster, BaseQExecutor
 from .database import Database
-from .utils import CircuitInfo, get_cached_executor, get_circuit_id
+from .utils import (
+    MAX_DIFFERENT_EXECUTORS,
+    CircuitInfo,
+    CircuitResultCache,
+    get_cached_executor,
+    get_circuit_id,
+    get_circuit_key,
+    get_persistence_level,
+)
+
+
+@lru_cache
+def get_results_pool():
+    """
+    Thread pool used to wait for the results of several executors at once.
+    """
+    return ThreadPoolExecutor(max_workers=MAX_DIFFERENT_EXECUTORS)
 
 
 class FuturesTable:
@@ -50,18 +70,32 @@ class FuturesTable:
         self,
         executor_future_pairs: List[Tuple[BaseQExecutor, Task]],
         submission_order: List[int],
+        cached_results: Dict[int, Tuple[BaseQExecutor, QCResult]] = None,
+        circuit_keys: Dict[int, str] = None,
     ) -> str:
         """
         Add a list of futures to the table and return a corresponding UUID.
+        Results found in the circuit cache and the cache keys of submitted
+        circuits are stored alongside the futures.
         """
         batch_id = str(uuid.uuid4())
-        self._ef_pairs[batch_id] = (executor_future_pairs, submission_order)
+        self._ef_pairs[batch_id] = (
+            executor_future_pairs,
+            submission_order,
+            cached_results or {},
+            circuit_keys or {},
+        )
         return batch_id
 
     def pop_executor_future_pairs(
         self,
         batch_id: str,
-    ) -> Tuple[List[Tuple[BaseQExecutor, Task]], List[int]]:
+    ) -> Tuple[
+        List[Tuple[BaseQExecutor, Task]],
+        List[int],
+        Dict[int, Tuple[BaseQExecutor, QCResult]],
+        Dict[int, str],
+    ]:
         """
         Retrieve a list of futures from the table using a UUID.
         """
@@ -71,22 +105,31 @@ class FuturesTable:
 class QServer:
     """
     Initialize a QServer instance with a given selector function.
+
+    Args:
+        selector: Function used to pick an executor for each qscript.
+        in_process: Whether the server is called from the client's own
+            process. In that case arguments and results are passed by
+            reference instead of being serialized.
     """
 
     # def __init__(self, selector: BaseQSelector = None) -> None:
-    def __init__(self, selector: Callable = None) -> None:
+    def __init__(self, selector: Callable = None, *, in_process: bool = False) -> None:
+        self.in_process = in_process
         self.futures_table = FuturesTable()
 
         # self._selector = selector or SimpleSelector(selector_function=select_first_executor)
         self._selector = selector or select_first_executor
         self._database = Database()
+        self._circuit_cache = CircuitResultCache()
+        self._pending_records = {}
 
     @property
     def selector(self):
         """
         Executor selector function for the Quantum server.
         """
-        return self._selector
+        return self.serialize(self._selector)
 
     @selector.setter
     def selector(self, ser_selector):
@@ -95,7 +138,8 @@ class QServer:
     @property
     def database(self):
         """Return the database for reading."""
-        return self.serialize(self._database)
+        # Copied so that in-process clients can't modify the server's database
+        return self.serialize(copy.copy(self._database))
 
     def select_executors(
         self,
@@ -110,7 +154,7 @@ class QServer:
 
         linked_executors = []
         for qscript in qscripts:
-            selected_executor = self.selector(qscript, executors)
+            selected_executor = self._selector(qscript, executors)
 
             # Use cached executor.
             selected_executor = get_cached_executor(**selected_executor.dict())
@@ -144,33 +188,42 @@ class QServer:
         of qscripts on respective executors
         """
 
-        # Since we will be modifying the qscripts list (or sometimes tuple).
-        qscripts = list(qscripts).copy()
-
-        submission_order = []
+        # Bucket qscripts by executor identity, keeping the order in which
+        # executors first appear. Linked executors come from the executor
+        # cache, so equal executors are almost always the same object.
+        sub_batches_by_id = {}
         executor_qscript_sub_batch_pairs = []
         for i, qscript in enumerate(qscripts):
             if qscript is None:
                 continue
 
-            # Generate a sub batch of qscripts to be executed on the same executor
-            qscript_sub_batch = [linked_executors[i], {i: qscript}]
-
-            # The qscript submission order is stored in this list to ensure that
-            # the final result is recombined correctly, even if task-circuit
-            # correspondence is not one-to-one. See, for example, PR #13.
-            submission_order.append(i)
-
-            for j in range(i + 1, len(qscripts)):
-                if linked_executors[i] == linked_executors[j]:
-                    qscript_sub_batch[1][j] = qscripts[j]
-                    qscripts[j] = None
-                    submission_order.append(j)
+            executor = linked_executors[i]
+            qscript_sub_batch = sub_batches_by_id.get(id(executor))
+            if qscript_sub_batch is None:
+                # Fall back to comparing against the (few) distinct executors
+                qscript_sub_batch = next(
+                    (pair for pair in executor_qscript_sub_batch_pairs if pair[0] == executor),
+                    None,
+                )
+                if qscript_sub_batch is None:
+                    # Generate a sub batch of qscripts to be executed on the same executor
+                    qscript_sub_batch = [executor, {}]
+                    executor_qscript_sub_batch_pairs.append(qscript_sub_batch)
+                sub_batches_by_id[id(executor)] = qscript_sub_batch
+
+            qscript_sub_batch[1][i] = qscript
 
             # An example `qscript_sub_batch` will look like:
             # [exec_4, {0: qscript_1, 3: qscript_4}]
 
-            executor_qscript_sub_batch_pairs.append(qscript_sub_batch)
+        # The qscript submission order is stored in this list to ensure that
+        # the final result is recombined correctly, even if task-circuit
+        # correspondence is not one-to-one. See, for example, PR #13.
+        submission_order = [
+            i
+            for _, qscript_sub_batch in executor_qscript_sub_batch_pairs
+            for i in qscript_sub_batch
+        ]
 
         # An example `executor_qscript_sub_batch_pairs` will look like:
         # [
@@ -196,6 +249,57 @@ class QServer:
 
         return executor_future_pairs, submission_order
 
+    def lookup_cached_results(
+        self,
+        qscripts: List[QuantumScript],
+        linked_executors: List[BaseQExecutor],
+        qelectron_info: QElectronInfo,
+        dispatch_id: str,
+        node_id: int,
+    ) -> Tuple[Dict[int, Tuple[BaseQExecutor, QCResult]], Dict[int, str]]:
+        """
+        Find the results of identical circuits that were executed before,
+        for qscripts linked to executors with `cache_results` enabled.
+
+        Returns:
+            The cached results and the cache keys of the remaining
+            cacheable qscripts, both keyed by qscript index.
+        """
+
+        cached_results = {}
+        circuit_keys = {}
+        for i, qscript in enumerate(qscripts):
+            executor = linked_executors[i]
+            if not executor.cache_results:
+                continue
+
+            key = get_circuit_key(qscript, executor, qelectron_info)
+            if key is None:
+                continue
+
+            result_obj = self._circuit_cache.get(key)
+            if result_obj is None:
+                circuit_keys[i] = key
+            else:
+                cached_results[i] = (executor, result_obj)
+
+        # Fall back to results persisted in the node's database
+        persisted_keys = {
+            i: key for i, key in circuit_keys.items() if linked_executors[i].persist_cache
+        }
+        if persisted_keys:
+            persisted_results = self._database.get_cached_results(
+                persisted_keys.values(), dispatch_id=dispatch_id, node_id=node_id
+            )
+            for i, key in persisted_keys.items():
+                if key in persisted_results:
+                    result_obj = QCResult(**persisted_results[key])
+                    self._circuit_cache.put(key, result_obj)
+                    cached_results[i] = (linked_executors[i], result_obj.model_copy(deep=True))
+                    del circuit_keys[i]
+
+        return cached_results, circuit_keys
+
     def submit(
         self,
         qscripts: List[QuantumScript],
@@ -229,77 +333,140 @@ class QServer:
         # Generate a list of executors for each qscript.
         linked_executors = self.select_executors(qscripts, executors, qnode_specs)
 
+        # Reuse the results of identical circuits instead of executing them again.
+        cached_results, circuit_keys = self.lookup_cached_results(
+            qscripts, linked_executors, qelectron_info, context.dispatch_id, context.task_id
+        )
+        # Executors modify tapes in place (e.g. their trainable parameters), so
+        # they get copies. The submitted tapes are kept intact for the circuit
+        # records and, with an in-process client, for the caller.
+        uncached_qscripts = [
+            None if i in cached_results else qscript.copy() for i, qscript in enumerate(qscripts)
+        ]
+
         # Assign qscript sub-batches to unique executors.
         executor_future_pairs, submission_order = self.submit_to_executors(
-            qscripts, linked_executors, qelectron_info
+            uncached_qscripts, linked_executors, qelectron_info
         )
 
         # Get batch ID for N qscripts being async-executed on M <= N executors.
         batch_id = self.futures_table.add_executor_future_pairs(
-            executor_future_pairs, submission_order
+            executor_future_pairs, submission_order, cached_results, circuit_keys
         )
 
-        # Storing the qscripts, executors, and metadata in the database
+        # Records of the qscripts, executors, and metadata. These are written
+        # to the database together with the results in `get_results`.
         batch_time = str(datetime.datetime.now())
-        key_value_pairs = [[], []]
+        circuit_records = {}
+        record_templates = {}
 
         for i, qscript in enumerate(qscripts):
+            executor = linked_executors[i]
+            persistence = get_persistence_level(executor)
+            if persistence == "none":
+                continue
+
+            # Fields shared by all qscripts on the same executor are only validated once
+            template = record_templates.get(id(executor))
+            if template is None:
+                template = CircuitInfo(
+                    electron_node_id=context.task_id,
+                    dispatch_id=context.dispatch_id,
+                    circuit_name=qelectron_info.name,
+                    circuit_description=qelectron_info.description,
+                    qnode_specs=qnode_specs,
+                    qexecutor=executor,
+                    save_time=batch_time,
+                ).dict()
+                record_templates[id(executor)] = template
+
             circuit_id = get_circuit_id(batch_id, i)
-            key_value_pairs[0].append(circuit_id)
-            circuit_info = CircuitInfo(
-                electron_node_id=context.task_id,
-                dispatch_id=context.dispatch_id,
-                circuit_name=qelectron_info.name,
-                circuit_description=qelectron_info.description,
-                circuit_diagram=qscript.draw(),
-                qnode_specs=qnode_specs,
-                qexecutor=linked_executors[i],
-                save_time=batch_time,
-                circuit_id=circuit_id,
-                qscript=qscript.graph.serialize() if linked_executors[i].persist_data else None,
-            ).dict()
-
-            key_value_pairs[1].append(circuit_info)
-
-        # An example `key_value_pairs` will look like:
-        # [
-        #     [
-        #         "circuit_0-uuid",
-        #         "circuit_1-uuid",
+            circuit_info = {**template, "circuit_id": circuit_id}
+
+            # Store the tape rather than its diagram or circuit graph, which are
+            # costly to build for large circuits. See `get_circuit_diagram`.
+            if persistence == "full":
+                circuit_info["tape"] = cloudpickle_serialize(qscript)
+
+            circuit_records[circuit_id] = circuit_info
+
+        # An example `circuit_records` will look like:
+        # {
+        #     "circuit_0-uuid": {
+        #         "electron_node_id": "node_1",
+        #         "dispatch_id": "uuid",
+        #         "circuit_name": "qscript_name",
+        #         "circuit_description": "qscript_description",
+        #         "qnode_specs": {"qnode_specs": "specs"},
+        #         "qexecutor": "executor_1",
+        #         "save_time": "2021-01-01 00:00:00",
+        #         "circuit_id": "circuit_0-uuid",
+        #         "tape": b"pickled_qscript_1",
+        #     },
+        #     "circuit_1-uuid": {
+        #         "electron_node_id": "node_1",
+        #         "dispatch_id": "uuid",
+        #         "circuit_name": "qscript_name",
+        #         "circuit_description": "qscript_description",
+        #         "qnode_specs": {"qnode_specs": "specs"},
+        #         "qexecutor": "executor_2",
+        #         "save_time": "2021-01-01 00:00:00",
+        #         "circuit_id": "circuit_1-uuid",
+        #         "tape": None,
+        #     },
         #
-        #         ...
-        #     ],
-        #     [
-        #         {"electron_node_id": "node_1",
-        #          "dispatch_id": "uuid",
-        #          "circuit_name": "qscript_name",
-        #          "circuit_description": "qscript_description",
-        #          "qnode_specs": {"qnode_specs": "specs"},
-        #          "qexecutor": "executor_1",
-        #          "save_time": "2021-01-01 00:00:00",
-        #          "circuit_id": "circuit_0-uuid",
-        #          "qscript": "qscript_1"},
-
-        #         {"electron_node_id": "node_1",
-        #          "dispatch_id": "uuid",
-        #          "circuit_name": "qscript_name",
-        #          "circuit_description": "qscript_description",
-        #          "qnode_specs": {"qnode_specs": "specs"},
-        #          "qexecutor": "executor_2",
-        #          "save_time": "2021-01-01 00:00:00",
-        #          "circuit_id": "circuit_1-uuid",
-        #          "qscript": "qscript_2"},
-        #
-        #         ...
-        #     ],
-        # ]
+        #     ...
+        # }
 
-        self._database.set(
-            *key_value_pairs, dispatch_id=context.dispatch_id, node_id=context.task_id
-        )
+        self._pending_records[batch_id] = circuit_records
 
         return batch_id
 
+    def gather_results(
+        self, executor_future_pairs: List[Tuple[BaseQExecutor, Dict[int, Task]]]
+    ) -> Iterator[Tuple[int, List[QCResult]]]:
+        """
+        Wait for the results of all executors concurrently, yielding the
+        index and results of each executor as soon as they are available.
+        """
+
+        if len(executor_future_pairs) <= 1:
+            for idx_efp, (executor, futures_sub_batch) in enumerate(executor_future_pairs):
+                yield idx_efp, executor.batch_get_results(futures_sub_batch.values())
+            return
+
+        pool = get_results_pool()
+        futures = {
+            pool.submit(executor.batch_get_results, futures_sub_batch.values()): idx_efp
+            for idx_efp, (executor, futures_sub_batch) in enumerate(executor_future_pairs)
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+    @staticmethod
+    def _record_result(
+        circuit_records: Dict[str, dict],
+        circuit_id: str,
+        executor: BaseQExecutor,
+        result_obj: QCResult,
+        execution_time: float,
+    ) -> None:
+        """
+        Add a circuit's results to its database record, according to the
+        persistence level of the executor that ran it.
+        """
+        persistence = get_persistence_level(executor)
+        if persistence == "none":
+            return
+
+        circuit_records.setdefault(circuit_id, {}).update(
+            {
+                "execution_time": execution_time,
+                "result": result_obj.results if persistence == "full" else None,
+                "result_metadata": result_obj.metadata if persistence == "full" else None,
+            }
+        )
+
     def get_results(self, batch_id):
         # pylint: disable=too-many-locals
         """
@@ -316,60 +483,68 @@ class QServer:
         context = get_context()
 
         results_dict = {}
-        key_value_pairs = [[], []]
-        executor_future_pairs, submission_order = self.futures_table.pop_executor_future_pairs(
-            batch_id
-        )
+        circuit_records = self._pending_records.pop(batch_id, {})
+        persisted_results = {}
+        (
+            executor_future_pairs,
+            submission_order,
+            cached_results,
+            circuit_keys,
+        ) = self.futures_table.pop_executor_future_pairs(batch_id)
+
+        # Results of each executor as (circuit_number, result_number, result) triples
+        executor_results = [[] for _ in executor_future_pairs]
 
         # ids of (e)xecutor_(f)uture_(p)airs, hence `idx_efp`
-        qscript_submission_index = 0
-        for idx_efp, (executor, futures_sub_batch) in enumerate(executor_future_pairs):
-            result_objs = executor.batch_get_results(futures_sub_batch.values())
+        for idx_efp, result_objs in self.gather_results(executor_future_pairs):
+            executor, futures_sub_batch = executor_future_pairs[idx_efp]
 
             # Adding results according to the order of the qscripts
             # ids of (f)utures_(s)ub_(b)atch, hence `idx_fsb`
             for idx_fsb, circuit_number in enumerate(futures_sub_batch.keys()):
                 result_obj = result_objs[idx_fsb]
 
+                # Cache the results of cacheable circuits
+                if circuit_number in circuit_keys:
+                    cache_key = circuit_keys[circuit_number]
+                    self._circuit_cache.put(cache_key, result_obj.model_copy(deep=True))
+                    if executor.persist_cache:
+                        persisted_results[cache_key] = result_obj.model_dump()
+
                 # Expand `result_obj` in case contains multiple circuits.
                 # Loop through sub-results to store separately in db.
                 for result_number, sub_result_obj in enumerate(result_obj.expand()):
-                    qscript_number = submission_order[qscript_submission_index]
-
-                    # Use tuple of integers for key to enable later multi-factor sort.
-                    key = (qscript_number, circuit_number, result_number)
-                    results_dict[key] = sub_result_obj.results[0]
-                    qscript_submission_index += 1
+                    executor_results[idx_efp].append(
+                        (circuit_number, result_number, sub_result_obj.results[0])
+                    )
 
                     # To store the results in the database
                     circuit_id = get_circuit_id(batch_id, circuit_number + result_number)
-                    key_value_pairs[0].append(circuit_id)
-                    key_value_pairs[1].append(
-                        {
-                            "execution_time": sub_result_obj.execution_time,
-                            "result": sub_result_obj.results if executor.persist_data else None,
-                            "result_metadata": (
-                                sub_result_obj.metadata if executor.persist_data else None
-                            ),
-                        }
+                    self._record_result(
+                        circuit_records,
+                        circuit_id,
+                        executor,
+                        sub_result_obj,
+                        sub_result_obj.execution_time,
                     )
 
-            # An example `key_value_pairs` will look like:
-            # [
-            #     [
-            #         "result_circuit_0-uuid",
-            #         "result_circuit_1-uuid",
-            #     ],
-            #     [
-            #         {"execution_time": "2021-01-01 00:00:00",
-            #          "result": [result_11, ...],
-            #          "result_metadata": [{}, ...]},
-            #
-            #         {"execution_time": "2021-01-01 00:00:00",
-            #          "result": [result_21, ...],
-            #          "result_metadata": [{}, ...]},
-            #     ],
-            # ]
+            # An example `circuit_records` will now look like:
+            # {
+            #     "circuit_0-uuid": {
+            #         "electron_node_id": "node_1",
+            #         ...
+            #         "execution_time": 0.01,
+            #         "result": [result_11, ...],
+            #         "result_metadata": [{}, ...],
+            #     },
+            #     "circuit_1-uuid": {
+            #         "electron_node_id": "node_1",
+            #         ...
+            #         "execution_time": 0.02,
+            #         "result": None,
+            #         "result_metadata": None,
+            #     },
+            # }
 
             # Deleting the futures once their results have been retrieved
             del executor_future_pairs[idx_efp][1]
@@ -377,9 +552,40 @@ class QServer:
             # After deletion of one `future_sub_batch`, the `executor_future_pairs` will look like:
             # [[exec_4], [exec_2, {2: future_3}], [exec_3, {4: future_5}]]
 
-        self._database.set(
-            *key_value_pairs, dispatch_id=context.dispatch_id, node_id=context.task_id
-        )
+        # Executors may finish in any order, so match results with the
+        # submission order only once all of them have arrived.
+        qscript_submission_index = 0
+        for sub_results in executor_results:
+            for circuit_number, result_number, result in sub_results:
+                qscript_number = submission_order[qscript_submission_index]
+
+                # Use tuple of integers for key to enable later multi-factor sort.
+                key = (qscript_number, circuit_number, result_number)
+                results_dict[key] = result
+                qscript_submission_index += 1
+
+        # Add the results that were found in the circuit cache
+        for circuit_number, (executor, result_obj) in cached_results.items():
+            for result_number, sub_result_obj in enumerate(result_obj.expand()):
+                key = (circuit_number, circuit_number, result_number)
+                results_dict[key] = sub_result_obj.results[0]
+
+                circuit_id = get_circuit_id(batch_id, circuit_number + result_number)
+                self._record_result(circuit_records, circuit_id, executor, sub_result_obj, 0.0)
+
+        if persisted_results:
+            self._database.set_cached_results(
+                persisted_results, dispatch_id=context.dispatch_id, node_id=context.task_id
+            )
+
+        # Write the whole batch at once
+        if circuit_records:
+            self._database.set(
+                list(circuit_records),
+                list(circuit_records.values()),
+                dispatch_id=context.dispatch_id,
+                node_id=context.task_id,
+            )
 
         # An example `results_dict` will look like:
         # {0: result_1, 3: result_4, 2: result_3, 4: result_5}
@@ -394,12 +600,16 @@ class QServer:
 
     def serialize(self, obj):
         """
-        Serialize an object.
+        Serialize an object, unless the server is in-process.
         """
+        if self.in_process:
+            return obj
         return cloudpickle_serialize(obj)
 
     def deserialize(self, obj):
         """
-        Deserialize an object.
+        Deserialize an object, unless the server is in-process.
         """
+        if self.in_process:
+            return obj
         return cloudpickle_deserialize(obj)
@@ -20,6 +20,10 @@ from ..._shared_files.config import get_config
 from .serialize import JsonLmdb, Strategy
 from .utils import CircuitInfo
 
+# Circuit results are cached in a separate database so that they aren't
+# mixed with the circuit records in the node's `data.mdb`
+CIRCUIT_CACHE_DIRNAME = "circuit-cache"
+
 
 def set_serialization_strategy(strategy_name):
     """
@@ -74,15 +78,7 @@ class Database:
 
     def set(self, keys, values, *, dispatch_id, node_id, direct_path=False):
         with self._open(dispatch_id, node_id, mkdir=True, direct_path=direct_path) as db:
-            for i, circuit_id in enumerate(keys):
-                stored_val: dict = db.get(circuit_id, None)
-                if stored_val is None:
-                    continue
-
-                stored_val.update(values[i])
-                values[i] = stored_val
-
-            db.update(dict(zip(keys, values)))
+            db.merge(dict(zip(keys, values)))
 
     def get_circuit_ids(self, *, dispatch_id, node_id, direct_path=False):
         with self._open(dispatch_id, node_id, direct_path=direct_path) as db:
@@ -99,3 +95,26 @@ class Database:
                 db_copy[key] = value
 
         return db_copy
+
+    def get_cached_results(self, keys, *, dispatch_id, node_id):
+        db_path = self.get_db_path(dispatch_id, node_id).joinpath(CIRCUIT_CACHE_DIRNAME)
+        if not db_path.exists():
+            return {}
+
+        with JsonLmdb.open_with_strategy(
+            file=str(db_path), flag="c", strategy_name=self.strategy_name
+        ) as db:
+            cached_results = {key: db.get(key, None) for key in keys}
+
+        return {key: value for key, value in cached_results.items() if value is not None}
+
+    def set_cached_results(self, cached_results, *, dispatch_id, node_id):
+        db_path = self.get_db_path(dispatch_id, node_id, mkdir=True).joinpath(
+            CIRCUIT_CACHE_DIRNAME
+        )
+        db_path.mkdir(exist_ok=True)
+
+        with JsonLmdb.open_with_strategy(
+            file=str(db_path), flag="c", strategy_name=self.strategy_name
+        ) as db:
+            db.update(cached_results)
@@ -22,7 +22,7 @@ import warnings
 import zlib
 from abc import ABC, abstractmethod
 from enum import Enum
-from typing import Sequence, Union
+from typing import Mapping, Sequence, Union
 
 import cloudpickle as pickle
 import lmdb
@@ -138,6 +138,43 @@ class JsonLmdb(Lmdb):
         self.strategy = self.init_strategy(strategy_type)
         super().__init__(**kw)
 
+    def merge(self, items: Mapping[str, dict]) -> None:
+        """
+        Merge dictionaries into the values stored under their keys, or insert
+        them under new keys, writing all of them in a single transaction.
+        The map is resized beforehand so that the write doesn't have to be
+        retried with a larger map.
+        """
+        with self.env.begin() as txn:
+            stored_values = {key: txn.get(self._pre_key(key)) for key in items}
+
+        pairs = []
+        for key, value in items.items():
+            if stored_values[key] is not None:
+                value = {**self._post_value(stored_values[key]), **value}
+            pairs.append((self._pre_key(key), self._pre_value(value)))
+
+        # Leave room for the B-tree pages, and for large values being
+        # rounded up to whole overflow pages
+        page_size = self.env.stat()["psize"]
+        used_size = (self.env.info()["last_pgno"] + 1) * page_size
+        new_size = sum(2 * (len(k) + len(v)) + page_size for k, v in pairs)
+        if used_size + new_size > self.map_size:
+            self.map_size = used_size + new_size
+
+        for _ in range(12):
+            try:
+                with self.env.begin(write=True) as txn:
+                    with txn.cursor() as curs:
+                        curs.putmulti(pairs)
+                return
+            except lmdb.MapFullError:
+                if not self.autogrow:
+                    raise
+                self.map_size = self.map_size * 2
+
+        raise RuntimeError(f"Unable to grow the database at {self.env.path()}")
+
     def _pre_key(self, key):
         return key.encode("utf-8")
 
@@ -15,18 +15,27 @@
 # limitations under the License.
 
 import datetime
+import hashlib
 import importlib
+from collections import OrderedDict
 from functools import lru_cache
+from threading import Lock
 from typing import Any, Dict, List, Optional, Union
 
+import numpy as np
 import orjson
+import pennylane as qml
+from pennylane.tape import QuantumScript
+from pennylane.wires import Wires
 from pydantic import BaseModel
 
-from ..._shared_files.qinfo import QNodeSpecs
-from ...executor.qbase import BaseQExecutor
+from ..._shared_files.qelectron_utils import cloudpickle_deserialize
+from ..._shared_files.qinfo import QElectronInfo, QNodeSpecs
+from ...executor.qbase import BaseQExecutor, QCResult
 
 BATCH_ID_SEPARATOR = "@"
 MAX_DIFFERENT_EXECUTORS = 10
+CIRCUIT_CACHE_SIZE = 1024
 
 
 class CircuitInfo(BaseModel):
@@ -40,6 +49,7 @@ class CircuitInfo(BaseModel):
     save_time: datetime.datetime
     circuit_id: Optional[str] = None
     qscript: Optional[str] = None
+    tape: Optional[bytes] = None
     execution_time: Optional[float] = None
     result: Optional[List[Any]] = None
     result_metadata: Optional[List[Dict[str, Any]]] = None
@@ -75,3 +85,123 @@ def reconstruct_executors(deconstructed_executors: List[Dict]):
 
 def get_circuit_id(batch_id, circuit_number):
     return f"circuit_{circuit_number}{BATCH_ID_SEPARATOR}{batch_id}"
+
+
+def get_persistence_level(executor: BaseQExecutor) -> str:
+    """
+    Return how much of a circuit run on the executor should be stored.
+    """
+    if executor.persistence == "full" and not executor.persist_data:
+        return "metadata"
+    return executor.persistence
+
+
+def get_circuit_diagram(circuit_info: Dict) -> Optional[str]:
+    """
+    Return the diagram of a stored circuit. Circuits are stored without
+    diagrams, which are instead drawn from the pickled tape on demand.
+    """
+    if circuit_info.get("circuit_diagram"):
+        return circuit_info["circuit_diagram"]
+
+    if not circuit_info.get("tape"):
+        return None
+
+    return cloudpickle_deserialize(circuit_info["tape"]).draw()
+
+
+class CircuitResultCache:
+    """
+    Thread-safe LRU cache of circuit results, keyed by `get_circuit_key`.
+    """
+
+    def __init__(self, maxsize: int = CIRCUIT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._results = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._results)
+
+    def get(self, key: str) -> Optional[QCResult]:
+        with self._lock:
+            result_obj = self._results.get(key)
+            if result_obj is not None:
+                self._results.move_to_end(key)
+
+        # Copied so that callers can't modify the cached results
+        return None if result_obj is None else result_obj.model_copy(deep=True)
+
+    def put(self, key: str, result_obj: QCResult) -> None:
+        with self._lock:
+            self._results[key] = result_obj
+            self._results.move_to_end(key)
+            while len(self._results) > self.maxsize:
+                self._results.popitem(last=False)
+
+
+def _fingerprint(obj: Any) -> Any:
+    """
+    Convert operators, measurements, and tensors of any interface into
+    plain Python values whose `repr` is stable across processes.
+    """
+    if obj is None or isinstance(obj, (bool, int, float, complex, str)):
+        return obj
+
+    if isinstance(obj, Wires):
+        return obj.tolist()
+
+    if isinstance(obj, (list, tuple)):
+        return [_fingerprint(item) for item in obj]
+
+    if isinstance(obj, dict):
+        return {key: _fingerprint(value) for key, value in obj.items()}
+
+    if isinstance(obj, qml.operation.Tensor):
+        return ["Tensor", _fingerprint(obj.obs)]
+
+    if isinstance(obj, qml.operation.Operator):
+        return [
+            type(obj).__name__,
+            obj.wires.tolist(),
+            _fingerprint(obj.data),
+            _fingerprint(obj.hyperparameters),
+            _fingerprint(getattr(obj, "operands", None)),
+        ]
+
+    if isinstance(obj, qml.measurements.MeasurementProcess):
+        return [type(obj).__name__, _fingerprint(vars(obj))]
+
+    if qml.math.is_abstract(obj):
+        raise ValueError("Abstract tensors can't be fingerprinted.")
+
+    value = np.asarray(qml.math.unwrap([obj])[0])
+    if value.dtype != object:
+        return value.tolist()
+
+    return repr(obj)
+
+
+def get_circuit_key(
+    qscript: QuantumScript, executor: BaseQExecutor, qelectron_info: QElectronInfo
+) -> Optional[str]:
+    """
+    Compute a canonical hash of a circuit together with the executor and
+    device settings it runs with. Circuits with the same key produce the
+    same results, up to sampling noise when shots are used.
+
+    Returns `None` if the circuit can't be hashed, for example when its
+    parameters are being traced by JAX.
+    """
+    try:
+        fingerprint = [
+            _fingerprint(qscript.operations),
+            _fingerprint(qscript.measurements),
+            repr(qscript.shots),
+            repr(executor.dict(exclude={"qelectron_info", "qnode_specs"})),
+            repr(qelectron_info.model_dump(exclude={"name", "description"})),
+        ]
+    except ValueError:
+        return None
+
+    return hashlib.sha256(repr(fingerprint).encode("utf-8")).hexdigest()
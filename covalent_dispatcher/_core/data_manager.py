@@ -21,7 +21,7 @@ Defines the core functionality of the result service
 import asyncio
 import tempfile
 import traceback
-from typing import Dict
+from typing import Dict, List
 
 from pydantic import ValidationError
 
@@ -145,6 +145,85 @@ async def update_node_result(dispatch_id, node_result):
             await dispatcher.notify_node_status(dispatch_id, node_id, node_status, detail)
 
 
+# Domain: result
+async def update_node_results(dispatch_id: str, node_results: List[Dict]):
+    """Persist several node results for a dispatch.
+
+    This is equivalent to calling `update_node_result()` on each node
+    result in order, except that the DB writes are coalesced into a
+    single transaction together with any concurrent bulk updates for
+    the same dispatch.
+    """
+
+    if not node_results:
+        return
+
+    app_log.debug(f"Updating {len(node_results)} node results (run_planned_workflow).")
+    try:
+        node_ids = [node_result["node_id"] for node_result in node_results]
+        node_infos = await electron.get_bulk(dispatch_id, node_ids, ["type", "sub_dispatch_id"])
+    except Exception as ex:
+        app_log.debug(f"Bulk node query failed ({ex}); updating nodes individually")
+        for node_result in node_results:
+            await update_node_result(dispatch_id, node_result)
+        return
+
+    sub_dispatch_ids = []
+    for node_result, node_info in zip(node_results, node_infos):
+        sub_dispatch_id = node_info["sub_dispatch_id"]
+
+        # Handle returns from _build_sublattice_graph -- change
+        # COMPLETED -> DISPATCHING
+        _filter_sublattice_status(
+            dispatch_id,
+            node_result["node_id"],
+            node_result["status"],
+            node_info["type"],
+            sub_dispatch_id,
+            node_result,
+        )
+        sub_dispatch_ids.append(sub_dispatch_id)
+
+    try:
+        outcomes = await electron.update_bulk(dispatch_id, node_results)
+    except Exception as ex:
+        outcomes = [ex] * len(node_results)
+
+    for node_result, sub_dispatch_id, outcome in zip(node_results, sub_dispatch_ids, outcomes):
+        node_id = node_result["node_id"]
+        node_status = node_result["status"]
+
+        if isinstance(outcome, Exception):
+            app_log.error(f"Error persisting node update: {outcome}")
+            sub_dispatch_id = None
+            node_result["status"] = Result.FAILED
+
+        elif not outcome:
+            app_log.warning(
+                f"Invalid status update {node_status} for node {dispatch_id}:{node_id}"
+            )
+            continue
+
+        elif node_status == RESULT_STATUS.DISPATCHING:
+            app_log.debug("Received sublattice dispatch")
+            try:
+                sub_dispatch_id = await _make_sublattice_dispatch(dispatch_id, node_result)
+            except Exception as ex:
+                tb = "".join(traceback.TracebackException.from_exception(ex).format())
+                node_result["status"] = RESULT_STATUS.FAILED
+                node_result["error"] = tb
+                try:
+                    await electron.update(dispatch_id, node_result)
+                except Exception as ex:
+                    app_log.exception(f"Error persisting node update: {ex}")
+                    sub_dispatch_id = None
+
+        node_status = node_result["status"]
+        detail = {"sub_dispatch_id": sub_dispatch_id} if sub_dispatch_id else {}
+        if node_status:
+            await dispatcher.notify_node_status(dispatch_id, node_id, node_status, detail)
+
+
 # Domain: result
 def _redirect_lattice(
     json_lattice: str,
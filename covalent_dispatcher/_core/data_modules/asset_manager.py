@@ -99,6 +99,13 @@ def download_assets_for_node_sync(
                 assets_to_download[key] = (asset, asset_update.remote_uri)
             # Prune unset fields
             db_updates[key] = {attr: val for attr, val in asset_update if val is not None}
+            if asset_update.remote_uri:
+                # Downloaded files are stored as received
+                db_updates[key]["codec"] = None
+                # The previous digest no longer describes the data
+                if asset_update.digest is None:
+                    db_updates[key]["digest_alg"] = None
+                    db_updates[key]["digest"] = None
 
         node.update_assets(db_updates, session)
 
@@ -20,8 +20,9 @@ Queries involving dispatches
 
 from typing import Dict, List
 
+from ..._dal import async_queries
 from ..._dal.result import get_result_object
-from .utils import run_in_executor
+from .utils import run_in_executor, run_in_read_executor
 
 
 def get_sync(dispatch_id: str, keys: List[str]) -> Dict:
@@ -31,7 +32,10 @@ def get_sync(dispatch_id: str, keys: List[str]) -> Dict:
 
 
 async def get(dispatch_id: str, keys: List[str]) -> Dict:
-    return await run_in_executor(
+    if async_queries.can_get_dispatch_values(keys):
+        return await async_queries.get_dispatch_values(dispatch_id, keys)
+
+    return await run_in_read_executor(
         get_sync,
         dispatch_id,
         keys,
@@ -54,7 +58,7 @@ async def get_incomplete_tasks(dispatch_id: str) -> Dict:
         {"cancelled": [node_ids], "failed": [node_ids]}
     """
 
-    return await run_in_executor(get_incomplete_tasks_sync, dispatch_id)
+    return await run_in_read_executor(get_incomplete_tasks_sync, dispatch_id)
 
 
 def update_sync(dispatch_id, dispatch_result):
@@ -63,4 +67,8 @@ def update_sync(dispatch_id, dispatch_result):
 
 
 async def update(dispatch_id, dispatch_result):
+    if async_queries.can_update_dispatch(dispatch_result):
+        await async_queries.update_dispatch(dispatch_id, **dispatch_result)
+        return
+
     await run_in_executor(update_sync, dispatch_id, dispatch_result)
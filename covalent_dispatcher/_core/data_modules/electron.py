@@ -18,10 +18,23 @@
 Utilities for querying the transport graph
 """
 
-from typing import Dict, List
+import asyncio
+from typing import Dict, List, Tuple, Union
 
+from covalent._shared_files import logger
+from covalent._shared_files.config import get_config
+
+from ..._dal import async_queries, task_cache
 from ..._dal.result import get_result_object
-from .utils import run_in_executor
+from .utils import run_in_executor, run_in_read_executor
+
+app_log = logger.app_log
+
+# Node updates for a dispatch arriving within this many seconds of
+# each other are persisted in the same transaction
+NODE_UPDATE_BATCH_WINDOW = float(get_config("dispatcher.node_update_batch_window"))
+
+_background_tasks = set()
 
 
 def get_bulk_sync(dispatch_id: str, node_ids: List[int], keys: List[str]) -> List[Dict]:
@@ -64,7 +77,10 @@ async def get_bulk(dispatch_id: str, node_ids: List[int], keys: List[str]) -> Li
     ```
 
     """
-    return await run_in_executor(
+    if async_queries.can_get_electron_values(keys):
+        return await async_queries.get_electron_values_bulk(dispatch_id, node_ids, keys)
+
+    return await run_in_read_executor(
         get_bulk_sync,
         dispatch_id,
         node_ids,
@@ -108,3 +124,122 @@ def update_sync(dispatch_id: str, node_result: Dict):
 async def update(dispatch_id: str, node_result: Dict):
     """Update a node's attributes"""
     return await run_in_executor(update_sync, dispatch_id, node_result)
+
+
+def load_cached_outputs_sync(dispatch_id: str, task_plans: List[Dict]) -> bool:
+    result_object = get_result_object(dispatch_id, bare=True)
+    return task_cache.load_cached_outputs(result_object.lattice.transport_graph, task_plans)
+
+
+async def load_cached_outputs(dispatch_id: str, task_plans: List[Dict]) -> bool:
+    """Reuse the outputs of previously completed electrons for a task group.
+
+    Args:
+        task_plans: The topologically sorted task plans of the group
+
+    Returns:
+        Whether the outputs of all tasks in the group were reused, in
+        which case the group need not be executed.
+    """
+    return await run_in_executor(load_cached_outputs_sync, dispatch_id, task_plans)
+
+
+def update_bulk_sync(dispatch_id: str, node_results: List[Dict]) -> List[bool]:
+    result_object = get_result_object(dispatch_id, bare=True)
+    return result_object._update_nodes(node_results)
+
+
+def _update_each_sync(dispatch_id: str, node_results: List[Dict]) -> List[Union[bool, Exception]]:
+    """Persist node updates one transaction at a time, capturing errors."""
+    outcomes = []
+    for node_result in node_results:
+        try:
+            outcomes.extend(update_bulk_sync(dispatch_id, [node_result]))
+        except Exception as ex:
+            outcomes.append(ex)
+    return outcomes
+
+
+class _NodeUpdateCoalescer:
+    """Write-behind buffer for node updates.
+
+    Updates submitted for the same dispatch within `window` seconds of
+    the first pending update are persisted together in a single
+    transaction, in submission order. If the combined transaction
+    fails, each update is retried in its own transaction so that one
+    bad update does not affect the others. Batches for the same
+    dispatch are persisted one after another even if the DB executor
+    has several workers.
+    """
+
+    def __init__(self, window: float):
+        self._window = window
+        self._pending: Dict[str, List[Tuple[List[Dict], asyncio.Future]]] = {}
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    async def submit(
+        self, dispatch_id: str, node_results: List[Dict]
+    ) -> List[Union[bool, Exception]]:
+        fut = asyncio.get_running_loop().create_future()
+        batch = self._pending.get(dispatch_id)
+        if batch is None:
+            batch = []
+            self._pending[dispatch_id] = batch
+            flush = asyncio.create_task(self._flush_after_window(dispatch_id))
+            _background_tasks.add(flush)
+            flush.add_done_callback(_background_tasks.discard)
+        batch.append((node_results, fut))
+        return await fut
+
+    async def _flush_after_window(self, dispatch_id: str):
+        await asyncio.sleep(self._window)
+        batch = self._pending.pop(dispatch_id)
+        node_results = [node_result for results, _ in batch for node_result in results]
+
+        # Wait for the previous batch for this dispatch to be persisted
+        previous = self._inflight.get(dispatch_id)
+        current = asyncio.current_task()
+        self._inflight[dispatch_id] = current
+        if previous is not None:
+            await asyncio.wait([previous])
+
+        app_log.debug(f"Persisting {len(node_results)} node updates for dispatch {dispatch_id}")
+        try:
+            try:
+                outcomes = await run_in_executor(update_bulk_sync, dispatch_id, node_results)
+            except Exception as ex:
+                app_log.debug(f"Batched node update failed ({ex}); retrying updates individually")
+                outcomes = await run_in_executor(_update_each_sync, dispatch_id, node_results)
+
+            start = 0
+            for results, fut in batch:
+                fut.set_result(outcomes[start : start + len(results)])
+                start += len(results)
+
+        except Exception as ex:
+            for _, fut in batch:
+                if not fut.done():
+                    fut.set_exception(ex)
+
+        finally:
+            if self._inflight.get(dispatch_id) is current:
+                del self._inflight[dispatch_id]
+
+
+_node_update_coalescer = _NodeUpdateCoalescer(NODE_UPDATE_BATCH_WINDOW)
+
+
+async def update_bulk(dispatch_id: str, node_results: List[Dict]) -> List[Union[bool, Exception]]:
+    """Update the attributes of several nodes.
+
+    Concurrent calls for the same dispatch are coalesced into a single
+    transaction.
+
+    Returns:
+        A list with one entry for each node update, in the same order
+        as `node_results`. Each entry is either a boolean indicating
+        whether the update was valid or the exception raised while
+        persisting the update.
+
+    """
+    return await _node_update_coalescer.submit(dispatch_id, node_results)
@@ -21,12 +21,98 @@ Utilities for querying the transport graph
 
 # Note: these query static information which should be amenable to caching
 
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Dict, List, Optional
 
 import networkx as nx
 
+from covalent._shared_files import logger
+
 from ..._dal.result import get_result_object
-from .utils import run_in_executor
+from .utils import run_in_read_executor
+
+app_log = logger.app_log
+
+# Node attributes which never change once a dispatch is registered
+# and can therefore be served from the topology cache.
+STATIC_NODE_KEYS = frozenset({"task_group_id", "name", "type"})
+
+
+class _GraphTopology:
+    """Immutable snapshot of the structure of a dispatch's transport graph.
+
+    Holds the adjacency, edge params, and static node attributes
+    (task group ids, node names and types) so that the dispatcher can
+    walk the graph without round trips to the DB.
+    """
+
+    __slots__ = ("graph", "task_group_ids", "names", "types", "_in_edges", "_successors")
+
+    def __init__(self, g: nx.MultiDiGraph):
+        self.graph = nx.freeze(g)
+        self.task_group_ids = MappingProxyType({n: d["task_group_id"] for n, d in g.nodes.items()})
+        self.names = MappingProxyType({n: d.get("name") for n, d in g.nodes.items()})
+        self.types = MappingProxyType({n: d.get("type") for n, d in g.nodes.items()})
+
+        in_edges = {n: [] for n in g.nodes}
+        successors = {n: [] for n in g.nodes}
+        for source, target, attrs in g.edges(data=True):
+            in_edges[target].append((source, MappingProxyType(dict(attrs))))
+            successors[source].append(target)
+
+        self._in_edges = {n: tuple(e) for n, e in in_edges.items()}
+        self._successors = {n: tuple(c) for n, c in successors.items()}
+
+    @property
+    def nodes(self) -> List[int]:
+        return list(self.graph.nodes)
+
+    def get_incoming_edges(self, node_id: int) -> List[Dict]:
+        return [
+            {"source": source, "target": node_id, "attrs": dict(attrs)}
+            for source, attrs in self._in_edges[node_id]
+        ]
+
+    def get_successors(self, node_id: int, attr_keys: List[str]) -> List[Dict]:
+        node_attrs = self.graph.nodes
+        return [
+            {"node_id": child, **{key: node_attrs[child][key] for key in attr_keys}}
+            for child in self._successors[node_id]
+        ]
+
+    def get_node_link_data(self) -> dict:
+        return nx.readwrite.node_link_data(self.graph)
+
+
+# dispatch_id -> _GraphTopology
+_topology_cache: Dict[str, _GraphTopology] = {}
+
+
+def get_cached_topology(dispatch_id: str) -> Optional[_GraphTopology]:
+    """Return the cached topology of a dispatch, if any."""
+    return _topology_cache.get(dispatch_id)
+
+
+async def cache_topology(dispatch_id: str) -> _GraphTopology:
+    """Load the transport graph topology of a dispatch once and cache it.
+
+    The cached topology is used by the graph queries in this module
+    until it is evicted using `evict_topology()`.
+    """
+
+    topology = _topology_cache.get(dispatch_id)
+    if topology is None:
+        g = nx.readwrite.node_link_graph(await get_nodes_links(dispatch_id))
+        topology = _GraphTopology(g)
+        _topology_cache[dispatch_id] = topology
+        app_log.debug(f"Cached topology for dispatch {dispatch_id}")
+    return topology
+
+
+def evict_topology(dispatch_id: str) -> None:
+    """Remove the cached topology of a dispatch."""
+    if _topology_cache.pop(dispatch_id, None) is not None:
+        app_log.debug(f"Evicted topology for dispatch {dispatch_id}")
 
 
 def get_incoming_edges_sync(dispatch_id: str, node_id: int):
@@ -45,6 +131,19 @@ def get_incoming_edges_sync(dispatch_id: str, node_id: int):
     return result_object.lattice.transport_graph.get_incoming_edges(node_id)
 
 
+def get_incoming_edges_bulk_sync(dispatch_id: str, node_ids: List[int]) -> List[List[Dict]]:
+    """Query in-edges for several nodes.
+
+    Returns:
+        A list of edge lists (see `get_incoming_edges_sync()`), one
+        for each node id, in the same order as `node_ids`.
+    """
+
+    result_object = get_result_object(dispatch_id)
+    tg = result_object.lattice.transport_graph
+    return [tg.get_incoming_edges(node_id) for node_id in node_ids]
+
+
 def get_node_successors_sync(
     dispatch_id: str,
     node_id: int,
@@ -83,7 +182,17 @@ def get_nodes_sync(dispatch_id: str) -> List[int]:
 
 
 async def get_incoming_edges(dispatch_id: str, node_id: int):
-    return await run_in_executor(get_incoming_edges_sync, dispatch_id, node_id)
+    topology = _topology_cache.get(dispatch_id)
+    if topology is not None:
+        return topology.get_incoming_edges(node_id)
+    return await run_in_read_executor(get_incoming_edges_sync, dispatch_id, node_id)
+
+
+async def get_incoming_edges_bulk(dispatch_id: str, node_ids: List[int]) -> List[List[Dict]]:
+    topology = _topology_cache.get(dispatch_id)
+    if topology is not None:
+        return [topology.get_incoming_edges(node_id) for node_id in node_ids]
+    return await run_in_read_executor(get_incoming_edges_bulk_sync, dispatch_id, node_ids)
 
 
 async def get_node_successors(
@@ -91,12 +200,21 @@ async def get_node_successors(
     node_id: int,
     attrs: List[str] = ["task_group_id"],
 ) -> List[Dict]:
-    return await run_in_executor(get_node_successors_sync, dispatch_id, node_id, attrs)
+    topology = _topology_cache.get(dispatch_id)
+    if topology is not None and STATIC_NODE_KEYS.issuperset(attrs):
+        return topology.get_successors(node_id, attrs)
+    return await run_in_read_executor(get_node_successors_sync, dispatch_id, node_id, attrs)
 
 
 async def get_nodes_links(dispatch_id: str) -> Dict:
-    return await run_in_executor(get_nodes_links_sync, dispatch_id)
+    topology = _topology_cache.get(dispatch_id)
+    if topology is not None:
+        return topology.get_node_link_data()
+    return await run_in_read_executor(get_nodes_links_sync, dispatch_id)
 
 
 async def get_nodes(dispatch_id: str) -> List[int]:
-    return await run_in_executor(get_nodes_sync, dispatch_id)
+    topology = _topology_cache.get(dispatch_id)
+    if topology is not None:
+        return topology.nodes
+    return await run_in_read_executor(get_nodes_sync, dispatch_id)
@@ -18,7 +18,15 @@
 
 from typing import Any, List
 
-from ..._db.jobdb import get_job_records, to_job_ids, update_job_records
+from ..._db.datastore import workflow_db
+from ..._db.jobdb import (
+    get_job_records,
+    get_job_records_async,
+    to_job_ids,
+    to_job_ids_async,
+    update_job_records,
+    update_job_records_async,
+)
 
 
 def _set_cancel_requested(job_ids: List[int]) -> None:
@@ -46,6 +54,12 @@ async def set_cancel_requested(dispatch_id: str, task_ids: List[int]):
     Return(s)
         None
     """
+    if workflow_db.supports_async_writes:
+        job_ids = await to_job_ids_async(dispatch_id, task_ids)
+        records = [{"job_id": job_id, "cancel_requested": True} for job_id in job_ids]
+        await update_job_records_async(records)
+        return
+
     job_ids = to_job_ids(dispatch_id, task_ids)
     _set_cancel_requested(job_ids)
 
@@ -61,6 +75,10 @@ async def get_jobs_metadata(dispatch_id: str, task_ids: List[int]) -> Any:
     Return(s)
         Dictionary of job metdata associated with each task
     """
+    if workflow_db.supports_async_reads:
+        job_ids = await to_job_ids_async(dispatch_id, task_ids)
+        return await get_job_records_async(job_ids)
+
     job_ids = to_job_ids(dispatch_id, task_ids)
     return get_job_records(job_ids)
 
@@ -77,6 +95,11 @@ async def _set_job_metadata(dispatch_id: str, task_id: int, **kwargs) -> None:
     Return(s)
         None
     """
+    if workflow_db.supports_async_writes:
+        job_id = (await to_job_ids_async(dispatch_id, [task_id]))[0]
+        await update_job_records_async([{**kwargs, "job_id": job_id}])
+        return
+
     job_id = to_job_ids(dispatch_id, [task_id])[0]
     update_kwargs = kwargs
     update_kwargs["job_id"] = job_id
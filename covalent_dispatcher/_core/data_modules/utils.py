@@ -21,11 +21,34 @@ Utils for the data service
 import asyncio
 from concurrent.futures import ThreadPoolExecutor
 
-# Worker thread for Datastore I/O Clamp this threadpool to one
-# thread because Sqlite only supports a single writer.
-dm_pool = ThreadPoolExecutor(max_workers=1)
+from covalent._shared_files.config import get_config
+
+from ..._db.datastore import workflow_db
+
+DB_WORKERS = get_config("dispatcher.db_workers")
+
+if workflow_db.supports_concurrent_writes:
+    # The DB backend (e.g. Postgres) handles concurrent transactions
+    dm_pool = ThreadPoolExecutor(max_workers=DB_WORKERS)
+else:
+    # Worker thread for Datastore I/O Clamp this threadpool to one
+    # thread because Sqlite only supports a single writer.
+    dm_pool = ThreadPoolExecutor(max_workers=1)
+
+# Reads only need to queue behind writes if the DB doesn't support
+# concurrent readers (Sqlite without WAL).
+if workflow_db.supports_concurrent_reads and not workflow_db.supports_concurrent_writes:
+    dm_read_pool = ThreadPoolExecutor(max_workers=DB_WORKERS)
+else:
+    dm_read_pool = dm_pool
 
 
 def run_in_executor(func, *args) -> asyncio.Future:
     loop = asyncio.get_running_loop()
     return loop.run_in_executor(dm_pool, func, *args)
+
+
+def run_in_read_executor(func, *args) -> asyncio.Future:
+    """Run a read-only DB query, possibly in parallel with writes."""
+    loop = asyncio.get_running_loop()
+    return loop.run_in_executor(dm_read_pool, func, *args)
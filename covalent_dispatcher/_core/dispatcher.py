@@ -40,6 +40,8 @@ from .runner_modules.cancel import cancel_tasks
 app_log = logger.app_log
 log_stack_info = logger.log_stack_info
 _global_status_queue = None
+
+# dispatch_id -> set of queues subscribed to the dispatch's status events
 _status_queues = {}
 _futures = {}
 
@@ -47,24 +49,17 @@ _global_event_listener = None
 
 SYNC_DISPATCHES = get_config("dispatcher.use_async_dispatcher") == "false"
 
+# Electron attributes needed to submit a task
+TASK_PLAN_KEYS = ["name", "status", "executor", "executor_data", "cache"]
 
-# Domain: dispatcher
-async def _get_abstract_task_inputs(dispatch_id: str, node_id: int, node_name: str) -> dict:
-    """Return placeholders for the required inputs for a task execution.
-
-    Args:
-        dispatch_id: id of the current dispatch
-        node_id: Node id of this task in the transport graph.
-        node_name: Name of the node.
 
-    Returns: inputs: Input dictionary to be passed to the task with
-        `node_id` placeholders for args, kwargs. These are to be
-        resolved to their values later.
-    """
+# Domain: dispatcher
+def _abstract_inputs_from_edges(edges: List[Dict]) -> dict:
+    """Compute the abstract task inputs from the in-edges of a node."""
 
     abstract_task_input = {"args": [], "kwargs": {}}
 
-    for edge in await tg_utils.get_incoming_edges(dispatch_id, node_id):
+    for edge in edges:
         parent = edge["source"]
 
         d = edge["attrs"]
@@ -82,14 +77,80 @@ async def _get_abstract_task_inputs(dispatch_id: str, node_id: int, node_name: s
     return abstract_task_input
 
 
+# Domain: dispatcher
+async def _get_abstract_task_inputs(dispatch_id: str, node_id: int, node_name: str) -> dict:
+    """Return placeholders for the required inputs for a task execution.
+
+    Args:
+        dispatch_id: id of the current dispatch
+        node_id: Node id of this task in the transport graph.
+        node_name: Name of the node.
+
+    Returns: inputs: Input dictionary to be passed to the task with
+        `node_id` placeholders for args, kwargs. These are to be
+        resolved to their values later.
+    """
+
+    edges = await tg_utils.get_incoming_edges(dispatch_id, node_id)
+    return _abstract_inputs_from_edges(edges)
+
+
+# Domain: dispatcher
+async def _plan_task_groups(dispatch_id: str, task_groups: List[List[int]]) -> List[List[Dict]]:
+    """Gather everything needed to submit several task groups at once.
+
+    The electron attributes for all nodes in all the task groups are
+    fetched in a single DB round trip; the graph structure is read
+    from the topology cache when available.
+
+    Args:
+        dispatch_id: id of the current dispatch
+        task_groups: A list of task groups, each given by its
+            topologically sorted node ids.
+
+    Returns:
+        A list of task plans for each task group, in the same order as
+        `task_groups`. Each task plan is a dictionary with keys
+        `node_id`, `abstract_inputs`, and the keys in `TASK_PLAN_KEYS`.
+    """
+
+    if not task_groups:
+        return []
+
+    node_ids = [node_id for sorted_nodes in task_groups for node_id in sorted_nodes]
+    attrs = await datasvc.electron.get_bulk(dispatch_id, node_ids, TASK_PLAN_KEYS)
+    edges = await tg_utils.get_incoming_edges_bulk(dispatch_id, node_ids)
+
+    task_plans = [
+        {
+            "node_id": node_id,
+            "abstract_inputs": _abstract_inputs_from_edges(node_edges),
+            **node_attrs,
+        }
+        for node_id, node_attrs, node_edges in zip(node_ids, attrs, edges)
+    ]
+
+    plans_by_group = []
+    start = 0
+    for sorted_nodes in task_groups:
+        plans_by_group.append(task_plans[start : start + len(sorted_nodes)])
+        start += len(sorted_nodes)
+
+    return plans_by_group
+
+
 # Domain: dispatcher
 async def _handle_completed_node(dispatch_id: str, node_id: int):
     next_task_groups = []
     app_log.debug(f"Node {node_id} completed")
 
-    parent_gid = (await datasvc.electron.get(dispatch_id, node_id, ["task_group_id"]))[
-        "task_group_id"
-    ]
+    topology = tg_utils.get_cached_topology(dispatch_id)
+    if topology is not None:
+        parent_gid = topology.task_group_ids[node_id]
+    else:
+        parent_gid = (await datasvc.electron.get(dispatch_id, node_id, ["task_group_id"]))[
+            "task_group_id"
+        ]
     for child in await tg_utils.get_node_successors(dispatch_id, node_id):
         node_id = child["node_id"]
         gid = child["task_group_id"]
@@ -130,8 +191,10 @@ async def _get_initial_tasks_and_deps(dispatch_id: str) -> Tuple[int, int, Dict]
     # Number of pending predecessor nodes for each task group
     pending_parents = {}
 
-    g_node_link = await tg_utils.get_nodes_links(dispatch_id)
-    g = nx.readwrite.node_link_graph(g_node_link)
+    # Load the graph structure once; subsequent graph queries for
+    # this dispatch are served from the cache
+    topology = await tg_utils.cache_topology(dispatch_id)
+    g = topology.graph
 
     # Topologically sort each task group
     sorted_task_groups = {}
@@ -158,10 +221,18 @@ async def _get_initial_tasks_and_deps(dispatch_id: str) -> Tuple[int, int, Dict]
 
 
 # Domain: dispatcher
-async def _submit_task_group(dispatch_id: str, sorted_nodes: List[int], task_group_id: int):
+async def _submit_task_group(
+    dispatch_id: str,
+    sorted_nodes: List[int],
+    task_group_id: int,
+    task_plans: List[Dict] = None,
+):
+    if task_plans is None:
+        task_plans = (await _plan_task_groups(dispatch_id, [sorted_nodes]))[0]
+
     # Handle parameter nodes
     # Get name of the node for the current task
-    node_name = (await datasvc.electron.get(dispatch_id, sorted_nodes[0], ["name"]))["name"]
+    node_name = task_plans[0]["name"]
     app_log.debug(f"7A: Node name: {node_name} (run_planned_workflow).")
 
     # Handle parameter nodes
@@ -188,29 +259,30 @@ async def _submit_task_group(dispatch_id: str, sorted_nodes: List[int], task_gro
 
         # Skip the group if all task outputs can be reused from a
         # previous dispatch (for redispatch).
-        statuses = await datasvc.electron.get_bulk(dispatch_id, sorted_nodes, ["status"])
         incomplete = list(
-            filter(lambda record: record["status"] != RESULT_STATUS.PENDING_REUSE, statuses)
+            filter(lambda plan: plan["status"] != RESULT_STATUS.PENDING_REUSE, task_plans)
         )
 
+        # Skip the group if all task outputs can be reused from
+        # electrons with the same function, hooks, and inputs.
+        if incomplete and all(plan.get("cache") for plan in task_plans):
+            if await datasvc.electron.load_cached_outputs(dispatch_id, task_plans):
+                incomplete = []
+
         if incomplete:
             # Gather inputs for each task and send the task spec sequence to the runner
             task_specs = []
 
             sorted_nodes_set = set(sorted_nodes)
 
-            for node_id in sorted_nodes:
+            for plan in task_plans:
+                node_id = plan["node_id"]
                 app_log.debug(f"Gathering inputs for task {node_id} (run_planned_workflow).")
 
-                abs_task_input = await _get_abstract_task_inputs(dispatch_id, node_id, node_name)
+                abs_task_input = plan["abstract_inputs"]
 
-                executor_attrs = await datasvc.electron.get(
-                    dispatch_id,
-                    node_id,
-                    ["executor", "executor_data"],
-                )
-                selected_executor = executor_attrs["executor"]
-                selected_executor_data = executor_attrs["executor_data"]
+                selected_executor = plan["executor"]
+                selected_executor_data = plan["executor_data"]
                 task_spec = {
                     "function_id": node_id,
                     "name": node_name,
@@ -317,9 +389,11 @@ async def run_workflow(dispatch_id: str, wait: bool = SYNC_DISPATCHES) -> RESULT
 
     except Exception as ex:
         dispatch_status = await _handle_dispatch_exception(dispatch_id, ex)
+        _publish_status(dispatch_id, None, dispatch_status)
 
     finally:
         if dispatch_status != RESULT_STATUS.RUNNING:
+            tg_utils.evict_topology(dispatch_id)
             datasvc.finalize_dispatch(dispatch_id)
 
     return dispatch_status
@@ -382,6 +456,41 @@ async def notify_node_status(
     await _global_status_queue.put(msg)
 
 
+def subscribe(dispatch_id: str) -> asyncio.Queue:
+    """Subscribe to terminal status transitions of a dispatch.
+
+    Each message put on the returned queue has the form
+    `{"dispatch_id": ..., "node_id": ..., "status": ...}`, where
+    `node_id` is `None` for the dispatch's own final status.
+    Subscribers must call `unsubscribe()` when done.
+
+    Args:
+        dispatch_id: The dispatch id
+
+    Returns:
+        A queue receiving the dispatch's status events
+    """
+    queue = asyncio.Queue()
+    _status_queues.setdefault(dispatch_id, set()).add(queue)
+    return queue
+
+
+def unsubscribe(dispatch_id: str, queue: asyncio.Queue):
+    """Remove a queue returned by `subscribe()`"""
+    queues = _status_queues.get(dispatch_id)
+    if queues is None:
+        return
+    queues.discard(queue)
+    if not queues:
+        del _status_queues[dispatch_id]
+
+
+def _publish_status(dispatch_id: str, node_id: int, status: RESULT_STATUS):
+    msg = {"dispatch_id": dispatch_id, "node_id": node_id, "status": str(status)}
+    for queue in _status_queues.get(dispatch_id, ()):
+        queue.put_nowait(msg)
+
+
 async def _finalize_dispatch(dispatch_id: str):
     await _clear_caches(dispatch_id)
     app_log.debug(f"Removed unresolved counter for {dispatch_id}")
@@ -444,9 +553,10 @@ async def _submit_initial_tasks(dispatch_id: str):
         app_log.debug(f"Sorted nodes group group {gid}: {sorted_nodes}")
         await _unresolved_tasks.increment(dispatch_id, len(sorted_nodes))
 
-    for gid in initial_groups:
-        sorted_nodes = sorted_task_groups[gid]
-        await _submit_task_group(dispatch_id, sorted_nodes, gid)
+    initial_sorted_nodes = [sorted_task_groups[gid] for gid in initial_groups]
+    task_plans = await _plan_task_groups(dispatch_id, initial_sorted_nodes)
+    for gid, sorted_nodes, plans in zip(initial_groups, initial_sorted_nodes, task_plans):
+        await _submit_task_group(dispatch_id, sorted_nodes, gid, plans)
 
     return RESULT_STATUS.RUNNING
 
@@ -468,10 +578,13 @@ async def _handle_node_status_update(dispatch_id, node_id, node_status, detail):
 
     if node_status == RESULT_STATUS.COMPLETED:
         next_task_groups = await _handle_completed_node(dispatch_id, node_id)
-        for gid in next_task_groups:
-            sorted_nodes = await _sorted_task_groups.get_task_group(dispatch_id, gid)
+        next_sorted_nodes = [
+            await _sorted_task_groups.get_task_group(dispatch_id, gid) for gid in next_task_groups
+        ]
+        task_plans = await _plan_task_groups(dispatch_id, next_sorted_nodes)
+        for gid, sorted_nodes, plans in zip(next_task_groups, next_sorted_nodes, task_plans):
             await _unresolved_tasks.increment(dispatch_id, len(sorted_nodes))
-            await _submit_task_group(dispatch_id, sorted_nodes, gid)
+            await _submit_task_group(dispatch_id, sorted_nodes, gid, plans)
 
     if node_status == RESULT_STATUS.FAILED:
         await _handle_failed_node(dispatch_id, node_id)
@@ -523,13 +636,18 @@ async def _handle_event(msg: Dict):
         await _handle_node_status_update(dispatch_id, node_id, node_status, detail)
 
     except Exception as ex:
+        tg_utils.evict_topology(dispatch_id)
         dispatch_status = await _handle_dispatch_exception(dispatch_id, ex)
         await datasvc.persist_result(dispatch_id)
+        _publish_status(dispatch_id, None, dispatch_status)
         fut = _futures.get(dispatch_id)
         if fut:
             fut.set_result(dispatch_status)
         return dispatch_status
 
+    if RESULT_STATUS.is_terminal(node_status):
+        _publish_status(dispatch_id, node_id, node_status)
+
     unresolved = await _unresolved_tasks.get_unresolved(dispatch_id)
     if unresolved < 1:
         app_log.debug("Finalizing dispatch")
@@ -540,6 +658,7 @@ async def _handle_event(msg: Dict):
 
         finally:
             await datasvc.persist_result(dispatch_id)
+            _publish_status(dispatch_id, None, dispatch_status)
             fut = _futures.get(dispatch_id)
             if fut:
                 fut.set_result(dispatch_status)
@@ -560,3 +679,5 @@ async def _clear_caches(dispatch_id: str):
         # Clean up no longer referenced keys
         await _pending_parents.remove(dispatch_id, gid)
         await _sorted_task_groups.remove(dispatch_id, gid)
+
+    tg_utils.evict_topology(dispatch_id)
@@ -240,8 +240,7 @@ async def _get_task_result(task_group_metadata: Dict, data: Any):
             for node_id in task_ids
         ]
 
-    for node_result in node_results:
-        await datamgr.update_node_result(dispatch_id, node_result)
+    await datamgr.update_node_results(dispatch_id, node_results)
 
 
 async def run_abstract_task_group(
@@ -327,8 +326,7 @@ async def run_abstract_task_group(
             for node_id in task_ids
         ]
 
-    for node_result in node_results:
-        await datamgr.update_node_result(dispatch_id, node_result)
+    await datamgr.update_node_results(dispatch_id, node_results)
 
     if node_results[0]["status"] == RESULT_STATUS.RUNNING:
         task_group_metadata = {
@@ -371,14 +369,16 @@ async def _listen_for_job_events():
                 task_ids = task_group_metadata["node_ids"]
                 detail = msg["detail"]
                 ts = datetime.now(timezone.utc)
-                for task_id in task_ids:
-                    node_result = datamgr.generate_node_result(
+                node_results = [
+                    datamgr.generate_node_result(
                         node_id=task_id,
                         end_time=ts,
                         status=RESULT_STATUS.FAILED,
                         error=detail,
                     )
-                    await datamgr.update_node_result(dispatch_id, node_result)
+                    for task_id in task_ids
+                ]
+                await datamgr.update_node_results(dispatch_id, node_results)
 
         except Exception as ex:
             app_log.exception("Error reading message: {ex}")
@@ -52,6 +52,7 @@ FIELDS = {
     "digest",
     "remote_uri",
     "size",
+    "codec",
 }
 
 
@@ -105,20 +106,33 @@ class Asset(Record[AssetRecord]):
     def size(self) -> int:
         return self._attrs["size"]
 
+    @property
+    def codec(self) -> str:
+        return self._attrs["codec"]
+
     def set_remote(self, session: Session, uri: str):
         self.update(session, values={"remote_uri": uri})
 
     def store_data(self, data: Any, session: Session) -> None:
-        digest, size = self.object_store.store_file(self.storage_path, self.object_key, data)
+        old_digest, old_codec = self._attrs.get("digest"), self._attrs.get("codec")
+        codec = self.object_store.codec_for(self.object_key) if data is not None else None
+        digest, size = self.object_store.store_file(
+            self.storage_path, self.object_key, data, codec=codec
+        )
         self.update(
             session,
             values={
                 "digest_alg": digest.algorithm,
                 "digest": digest.hexdigest,
                 "size": size,
+                "codec": codec,
             },
         )
 
+        # The previous contents may no longer be referenced
+        if (old_digest, old_codec) != (digest.hexdigest, codec):
+            self.object_store.release(old_digest, old_codec)
+
     def load_data(self) -> Any:
         return self.object_store.load_file(self.storage_path, self.object_key)
 
@@ -127,13 +141,22 @@ class Asset(Record[AssetRecord]):
         dest_uri = scheme + "://" + os.path.join(self.storage_path, self.object_key)
         app_log.debug(f"Downloading asset from {src_uri} to {dest_uri}")
 
+        # The file may share its data with other assets
+        self.object_store.detach_file(self.storage_path, self.object_key)
         cp(src_uri, dest_uri)
+        self.object_store.deduplicate_file(self.storage_path, self.object_key)
 
     def upload(self, dest_uri: str):
         scheme = self.storage_type.value
         src_uri = scheme + "://" + os.path.join(self.storage_path, self.object_key)
         app_log.debug(f"Uploading asset from {src_uri} to {dest_uri}")
-        cp(src_uri, dest_uri)
+
+        # Consumers of uploaded assets expect uncompressed data
+        if self.codec:
+            with self.object_store.uncompressed_copy(self.storage_path, self.object_key) as path:
+                cp(scheme + "://" + path, dest_uri)
+        else:
+            cp(src_uri, dest_uri)
 
     @classmethod
     def from_id(cls, asset_id: int, session: Session, *, keys=FIELDS) -> "Asset":
@@ -154,9 +177,16 @@ def copy_asset(src: Asset, dest: Asset):
     """
 
     if src.size > 0:
+        # Copy the data as stored; `copy_asset_meta` carries over the codec
+        if src.storage_type == dest.storage_type and dest.object_store.deduplicate:
+            # Share the stored data instead of copying it
+            dest.object_store.link_file(
+                src.storage_path, src.object_key, dest.storage_path, dest.object_key
+            )
+            return
         scheme = dest.storage_type.value
         dest_uri = scheme + "://" + os.path.join(dest.storage_path, dest.object_key)
-        src.upload(dest_uri)
+        cp(src.internal_uri, dest_uri)
     else:
         app_log.debug(f"Refusing to copy zero-sized asset {src.internal_uri}")
 
@@ -174,5 +204,6 @@ def copy_asset_meta(session: Session, src: Asset, dest: Asset):
         "digest_alg": src.digest_alg,
         "digest": src.digest,
         "size": src.size,
+        "codec": src.codec,
     }
     dest.update(session, values=update)
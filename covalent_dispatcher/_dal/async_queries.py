@@ -0,0 +1,161 @@
+# Copyright 2023 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Asyncio queries for hot metadata lookups and updates.
+
+These bypass the DB-backed Result/Electron objects and only handle
+attributes stored as columns of the `electrons` and `lattices`
+tables. Assets and computed fields must still be accessed through the
+synchronous DAL.
+"""
+
+from datetime import datetime
+from typing import Dict, List
+
+from sqlalchemy import select, update
+
+from covalent._shared_files.util_classes import RESULT_STATUS, Status
+
+from .._db import models
+from .._db.datastore import workflow_db
+from .db_interfaces import electron_utils, result_utils
+
+# Electron metadata keys which can be read directly from a column
+ELECTRON_COLUMN_KEYS = frozenset(
+    key
+    for key in electron_utils._meta_record_map
+    if key in electron_utils.get_filters and key not in electron_utils.COMPUTED_FIELDS
+)
+
+# Dispatch metadata keys which can be read directly from a column
+DISPATCH_COLUMN_KEYS = frozenset(
+    key for key in result_utils._meta_record_map if key in result_utils.get_filters
+)
+
+# Dispatch fields whose update does not involve assets
+DISPATCH_UPDATE_KEYS = frozenset({"start_time", "end_time", "status"})
+
+
+def can_get_electron_values(keys: List[str]) -> bool:
+    return workflow_db.supports_async_reads and ELECTRON_COLUMN_KEYS.issuperset(keys)
+
+
+def can_get_dispatch_values(keys: List[str]) -> bool:
+    return workflow_db.supports_async_reads and DISPATCH_COLUMN_KEYS.issuperset(keys)
+
+
+def can_update_dispatch(dispatch_result: Dict) -> bool:
+    """Whether a dispatch update only touches metadata columns.
+
+    Terminal status updates may need to copy the sublattice output to
+    its parent electron and are left to the synchronous DAL, as are all
+    updates on backends with a single writer.
+    """
+    if not workflow_db.supports_async_writes:
+        return False
+    if not DISPATCH_UPDATE_KEYS.issuperset(k for k, v in dispatch_result.items() if v is not None):
+        return False
+    status = dispatch_result.get("status")
+    return status is None or not RESULT_STATUS.is_terminal(status)
+
+
+async def get_electron_values_bulk(
+    dispatch_id: str, node_ids: List[int], keys: List[str]
+) -> List[Dict]:
+    """Query electron metadata for several nodes in one round trip.
+
+    Args:
+        dispatch_id: The dispatch id
+        node_ids: The list of nodes to query
+        keys: The list of attributes to query; must be a subset of
+            `ELECTRON_COLUMN_KEYS`
+
+    Returns:
+        A list of dictionaries {attr_key: attr_val}, one for each node
+        id, in the same order as `node_ids`
+
+    """
+    node_id_col = models.Electron.transport_graph_node_id
+    columns = [getattr(models.Electron, electron_utils._meta_record_map[k]) for k in keys]
+    stmt = (
+        select(node_id_col, *columns)
+        .join(models.Lattice, models.Electron.parent_lattice_id == models.Lattice.id)
+        .where(models.Lattice.dispatch_id == dispatch_id)
+        .where(node_id_col.in_(node_ids))
+    )
+    async with workflow_db.async_session() as session:
+        rows = (await session.execute(stmt)).all()
+
+    records = {row[0]: row[1:] for row in rows}
+    attrs = []
+    for node_id in node_ids:
+        if node_id not in records:
+            raise KeyError(f"Node {node_id} not found in dispatch {dispatch_id}")
+        values = records[node_id]
+        attrs.append({key: electron_utils.get_filters[key](val) for key, val in zip(keys, values)})
+    return attrs
+
+
+async def get_dispatch_values(dispatch_id: str, keys: List[str]) -> Dict:
+    """Query dispatch metadata.
+
+    Args:
+        dispatch_id: The dispatch id
+        keys: The list of attributes to query; must be a subset of
+            `DISPATCH_COLUMN_KEYS`
+
+    Returns:
+        A dictionary {attr_key: attr_val}
+    """
+    columns = [getattr(models.Lattice, result_utils._meta_record_map[k]) for k in keys]
+    stmt = select(*columns).where(models.Lattice.dispatch_id == dispatch_id)
+    async with workflow_db.async_session() as session:
+        row = (await session.execute(stmt)).first()
+
+    if row is None:
+        raise KeyError(f"Invalid dispatch {dispatch_id}")
+    return {key: result_utils.get_filters[key](val) for key, val in zip(keys, row)}
+
+
+async def update_dispatch(
+    dispatch_id: str,
+    start_time: datetime = None,
+    end_time: datetime = None,
+    status: Status = None,
+):
+    """Update dispatch metadata columns.
+
+    Args:
+        dispatch_id: The dispatch id
+        start_time: The start time of the lattice execution.
+        end_time: The end time of the lattice execution.
+        status: The (non-terminal) status of the lattice execution.
+    """
+    values = {}
+    if start_time is not None:
+        values[result_utils._meta_record_map["start_time"]] = start_time
+    if end_time is not None:
+        values[result_utils._meta_record_map["end_time"]] = end_time
+    if status is not None:
+        values[result_utils._meta_record_map["status"]] = result_utils.set_filters["status"](
+            status
+        )
+    if not values:
+        return
+
+    stmt = update(models.Lattice).where(models.Lattice.dispatch_id == dispatch_id).values(**values)
+    async with workflow_db.async_session() as session:
+        await session.execute(stmt)
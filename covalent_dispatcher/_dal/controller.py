@@ -17,9 +17,9 @@
 
 from __future__ import annotations
 
-from typing import Generic, Type, TypeVar
+from typing import Generic, List, Type, TypeVar
 
-from sqlalchemy import select, update
+from sqlalchemy import func, insert, select, text, update
 from sqlalchemy.orm import Session, load_only
 
 from .._db import models
@@ -104,6 +104,54 @@ class Record(Generic[T]):
             session.flush()
         return new_record
 
+    @classmethod
+    def reserve_ids(cls, session: Session, count: int) -> List[int]:
+        """Allocate primary keys for new records.
+
+        Use this to insert related records with `insert_bulk()`
+        without reading back the keys of each batch. On Sqlite, the
+        current transaction must already have written to the DB so
+        that it holds the (single) write lock.
+
+        Args:
+            session: SQLAlchemy session
+            count: The number of keys to allocate
+
+        Returns: A list of `count` unused primary keys
+
+        """
+
+        if count == 0:
+            return []
+
+        if session.get_bind().dialect.name == "postgresql":
+            stmt = text(
+                "SELECT nextval(pg_get_serial_sequence(:table, 'id')) FROM generate_series(1, :count)"
+            )
+            params = {"table": cls.model.__tablename__, "count": count}
+            return list(session.scalars(stmt, params))
+
+        # Writes are serialized, so keys past the current maximum remain
+        # free until the transaction ends
+        start = session.scalar(select(func.max(cls.model.id))) or 0
+        return list(range(start + 1, start + count + 1))
+
+    @classmethod
+    def insert_bulk(cls, session: Session, *, values: List[dict]):
+        """Bulk INSERT.
+
+        Unlike `create()`, this bypasses the ORM unit of work and
+        emits a single executemany statement.
+
+        Args:
+            session: SQLAlchemy session
+            values: List of column values for each new record; all
+                entries must have the same keys
+        """
+
+        if values:
+            session.execute(insert(cls.model), values)
+
     @classmethod
     def update_bulk(
         cls, session: Session, *, values: dict, equality_filters: dict, membership_filters: dict
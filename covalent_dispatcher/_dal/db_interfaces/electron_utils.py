@@ -36,6 +36,7 @@ _meta_record_map = {
     "executor": "executor",
     "executor_data": "executor_data",
     "qelectron_data_exists": "qelectron_data_exists",
+    "cache": "cache",
 }
 
 _db_meta_record_map = {
@@ -17,12 +17,14 @@
 """Mappings between graph attributes and DB records"""
 
 
-from typing import List
+from typing import List, Optional, Tuple
 
 from sqlalchemy import select
 from sqlalchemy.orm import Load, Session
 
+from ..._db.models import Asset as AssetRecord
 from ..._db.models import Electron as ElectronRecord
+from ..._db.models import ElectronAsset as ElectronAssetRecord
 from ..._db.models import ElectronDependency as EdgeRecord
 from ..._db.models import Lattice as LatticeRecord
 from .. import electron
@@ -84,3 +86,17 @@ def _all_edge_records(session: Session, lattice_id: int) -> List[EdgeRecord]:
     )
     records = session.execute(stmt).all()
     return list(map(lambda r: r.ElectronDependency, records))
+
+
+def _asset_digest_records(
+    session: Session, lattice_id: int, key: str
+) -> List[Tuple[int, Optional[str]]]:
+    """Select (node id, digest) pairs of an asset for all nodes in a lattice"""
+    stmt = (
+        select(ElectronRecord.transport_graph_node_id, AssetRecord.digest)
+        .join(ElectronAssetRecord, ElectronAssetRecord.meta_id == ElectronRecord.id)
+        .join(AssetRecord, AssetRecord.id == ElectronAssetRecord.asset_id)
+        .where(ElectronRecord.parent_lattice_id == lattice_id)
+        .where(ElectronAssetRecord.key == key)
+    )
+    return [tuple(r) for r in session.execute(stmt).all()]
@@ -37,6 +37,7 @@ def _export_electron_meta(e: Electron) -> ElectronMetadata:
     executor = e.get_value("executor", None, refresh=False)
     executor_data = e.get_value("executor_data", None, refresh=False)
     qelectron_data_exists = e.get_value("qelectron_data_exists", None, refresh=False)
+    cache = e.get_value("cache", None, refresh=False)
     sub_dispatch_id = e.get_value("sub_dispatch_id", None, refresh=False)
     status = e.get_value("status", None, refresh=False)
     start_time = e.get_value("start_time", None, refresh=False)
@@ -48,6 +49,7 @@ def _export_electron_meta(e: Electron) -> ElectronMetadata:
         executor=executor,
         executor_data=executor_data,
         qelectron_data_exists=qelectron_data_exists,
+        cache=cache,
         sub_dispatch_id=sub_dispatch_id,
         status=str(status),
         start_time=start_time,
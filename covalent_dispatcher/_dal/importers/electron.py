@@ -21,8 +21,6 @@ import json
 import os
 from typing import Dict, Tuple
 
-from sqlalchemy.orm import Session
-
 from covalent._shared_files import logger
 from covalent._shared_files.schemas.electron import (
     ASSET_FILENAME_MAP,
@@ -38,10 +36,7 @@ from covalent._shared_files.schemas.electron import (
     ElectronAssets,
     ElectronSchema,
 )
-from covalent_dispatcher._dal.asset import Asset
-from covalent_dispatcher._dal.electron import ElectronMeta
 from covalent_dispatcher._dal.lattice import Lattice
-from covalent_dispatcher._db import models
 from covalent_dispatcher._db.write_result_to_db import get_electron_type
 from covalent_dispatcher._object_store.base import BaseProvider
 
@@ -49,31 +44,34 @@ app_log = logger.app_log
 
 
 def import_electron(
-    session: Session,
     dispatch_id: str,
     e: ElectronSchema,
     lat: Lattice,
     object_store: BaseProvider,
     job_id: int,
-) -> Tuple[models.Electron, ElectronSchema]:
-    """Returns (electron_id, ElectronSchema)"""
+) -> Tuple[dict, Dict[str, dict], ElectronSchema]:
+    """Compute the DB records for an electron and its assets.
+
+    The records are inserted in bulk by `import_transport_graph()`.
+
+    Returns (electron_kwargs, asset_kwargs, ElectronSchema), where
+    `asset_kwargs` maps asset keys to asset record kwargs.
+    """
 
-    electron_assets, asset_recs = import_electron_assets(
-        session,
+    electron_assets, asset_kwargs = import_electron_assets(
         dispatch_id,
         e,
         object_store,
     )
 
     # Hack for legacy DB columns
-    node_storage_path = asset_recs["function"].storage_path
+    node_storage_path = asset_kwargs["function"]["storage_path"]
 
     electron_kwargs = _get_electron_meta(e, lat, node_storage_path, job_id)
-    electron_row = ElectronMeta.create(session, insert_kwargs=electron_kwargs, flush=False)
 
     return (
-        electron_row,
-        asset_recs,
+        electron_kwargs,
+        asset_kwargs,
         ElectronSchema(id=e.id, metadata=e.metadata, assets=electron_assets),
     )
 
@@ -88,6 +86,7 @@ def _get_electron_meta(
         "executor": e.metadata.executor,
         "executor_data": json.dumps(e.metadata.executor_data),
         "qelectron_data_exists": e.metadata.qelectron_data_exists,
+        "cache": e.metadata.cache,
         "status": e.metadata.status,
         "started_at": e.metadata.start_time,
         "completed_at": e.metadata.end_time,
@@ -116,21 +115,20 @@ def _get_electron_meta(
 
 
 def import_electron_assets(
-    session: Session,
     dispatch_id,
     e: ElectronSchema,
     object_store: BaseProvider,
-) -> Tuple[ElectronAssets, Dict[str, models.Asset]]:
-    """Insert asset records
+) -> Tuple[ElectronAssets, Dict[str, dict]]:
+    """Compute asset records
 
 
-    Returns pair (ElectronAssets, asset_records), where
-    `asset_records` is a mapping from asset key to asset records.
+    Returns pair (ElectronAssets, asset_kwargs), where
+    `asset_kwargs` is a mapping from asset key to asset record kwargs.
 
     """
 
-    # Maps asset keys to asset records
-    asset_recs = {}
+    # Maps asset keys to asset record kwargs
+    asset_kwargs = {}
 
     for asset_key, asset in e.assets:
         # Register these later
@@ -145,20 +143,25 @@ def import_electron_assets(
 
         object_key = ASSET_FILENAME_MAP[asset_key]
         local_uri = os.path.join(node_storage_path, object_key)
-        asset_kwargs = {
+
+        # Don't ask the client to upload data the server already has
+        is_stored = object_store.link_blob(
+            node_storage_path, object_key, asset.digest_alg, asset.digest
+        )
+
+        asset_kwargs[asset_key] = {
             "storage_type": object_store.scheme,
             "storage_path": node_storage_path,
             "object_key": object_key,
             "digest_alg": asset.digest_alg,
             "digest": asset.digest,
-            "remote_uri": asset.uri,
+            "remote_uri": "" if is_stored else asset.uri,
             "size": asset.size,
         }
-        asset_recs[asset_key] = Asset.create(session, insert_kwargs=asset_kwargs, flush=False)
 
         # Send this back to the client
         asset.digest = None
-        asset.remote_uri = f"file://{local_uri}"
+        asset.remote_uri = "" if is_stored else f"file://{local_uri}"
 
     # Register custom assets
     if e.assets._custom:
@@ -166,7 +169,7 @@ def import_electron_assets(
             object_key = f"{asset_key}.data"
             local_uri = os.path.join(node_storage_path, object_key)
 
-            asset_kwargs = {
+            asset_kwargs[asset_key] = {
                 "storage_type": object_store.scheme,
                 "storage_path": node_storage_path,
                 "object_key": object_key,
@@ -175,10 +178,9 @@ def import_electron_assets(
                 "remote_uri": asset.uri,
                 "size": asset.size,
             }
-            asset_recs[asset_key] = Asset.create(session, insert_kwargs=asset_kwargs, flush=False)
 
             # Send this back to the client
             asset.remote_uri = f"file://{local_uri}" if asset.digest else ""
             asset.digest = None
 
-    return e.assets, asset_recs
+    return e.assets, asset_kwargs
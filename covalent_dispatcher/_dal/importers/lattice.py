@@ -98,20 +98,25 @@ def import_lattice_assets(
 
         local_uri = os.path.join(storage_path, object_key)
 
+        # Don't ask the client to upload data the server already has
+        is_stored = object_store.link_blob(
+            storage_path, object_key, asset.digest_alg, asset.digest
+        )
+
         asset_kwargs = {
             "storage_type": object_store.scheme,
             "storage_path": storage_path,
             "object_key": object_key,
             "digest_alg": asset.digest_alg,
             "digest": asset.digest,
-            "remote_uri": asset.uri,
+            "remote_uri": "" if is_stored else asset.uri,
             "size": asset.size,
         }
         asset_ids[asset_key] = Asset.create(session, insert_kwargs=asset_kwargs, flush=False)
 
         # Send this back to the client
         asset.digest = None
-        asset.remote_uri = f"file://{local_uri}"
+        asset.remote_uri = "" if is_stored else f"file://{local_uri}"
 
     # Register custom assets
     if lat.assets._custom:
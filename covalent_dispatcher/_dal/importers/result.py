@@ -76,7 +76,7 @@ def import_result(
     lattice_record_kwargs = _get_result_meta(res, storage_path, electron_id)
     lattice_record_kwargs.update(_get_lattice_meta(res.lattice, storage_path))
 
-    with Result.session() as session:
+    with local_store.unlink_blobs_on_error(), Result.session() as session:
         st = datetime.now()
         lattice_row = ResultMeta.create(session, insert_kwargs=lattice_record_kwargs, flush=True)
         res_record = Result(session, lattice_row, True)
@@ -241,20 +241,25 @@ def import_result_assets(
         )
         local_uri = os.path.join(storage_path, object_key)
 
+        # Don't ask the client to upload data the server already has
+        is_stored = object_store.link_blob(
+            storage_path, object_key, asset.digest_alg, asset.digest
+        )
+
         asset_kwargs = {
             "storage_type": object_store.scheme,
             "storage_path": storage_path,
             "object_key": object_key,
             "digest_alg": asset.digest_alg,
             "digest": asset.digest,
-            "remote_uri": asset.uri,
+            "remote_uri": "" if is_stored else asset.uri,
             "size": asset.size,
         }
         asset_ids[asset_key] = Asset.create(session, insert_kwargs=asset_kwargs, flush=False)
 
         # Send this back to the client
         asset.digest = None
-        asset.remote_uri = f"file://{local_uri}"
+        asset.remote_uri = "" if is_stored else f"file://{local_uri}"
 
     # Write asset records to DB
     n_records = len(asset_ids)
@@ -18,18 +18,18 @@
 """Functions to transform ResultSchema -> Result"""
 
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Optional
 
 from sqlalchemy.orm import Session
 
 from covalent._shared_files import logger
 from covalent._shared_files.schemas.edge import EdgeSchema
 from covalent._shared_files.schemas.transport_graph import TransportGraphSchema
+from covalent_dispatcher._dal.asset import Asset
 from covalent_dispatcher._dal.edge import ElectronDependency
-from covalent_dispatcher._dal.electron import Electron
+from covalent_dispatcher._dal.electron import Electron, ElectronAsset, ElectronMeta
 from covalent_dispatcher._dal.job import Job
 from covalent_dispatcher._dal.lattice import Lattice
-from covalent_dispatcher._db import models
 from covalent_dispatcher._object_store.base import BaseProvider
 
 from .electron import import_electron
@@ -45,7 +45,13 @@ def import_transport_graph(
     object_store: BaseProvider,
     electron_id: Optional[int],
 ) -> TransportGraphSchema:
-    electron_map = {}
+    """Insert the jobs, electrons, assets, and edges of a transport graph.
+
+    Each kind of record is written with a single bulk INSERT. Primary
+    keys are allocated up front so that the records can reference
+    each other without reading back the inserted rows.
+    """
+
     output_nodes = []
 
     # Propagate parent electron id's `cancel_requested` property to the sublattice electrons
@@ -58,118 +64,77 @@ def import_transport_graph(
     else:
         cancel_requested = False
 
+    # Write any pending records before allocating primary keys
+    session.flush()
+
     # Gather nodes into task groups
-    task_groups = {i: [] for i in range(len(tg.nodes))}
+    task_groups = {}
     for node in tg.nodes:
         gid = node.metadata.task_group_id
-        task_groups[gid].append(node)
-
-    gids = {k: list(map(lambda n: n.id, v)) for k, v in task_groups.items()}
-
-    gid_job_record_map = {}
-
-    # Maps node ids to asset record dictionaries
-    electron_asset_links = {}
+        task_groups.setdefault(gid, []).append(node)
 
-    for gid in task_groups:
-        # Create a job record for each task group
-        job_kwargs = {
-            "cancel_requested": cancel_requested,
-        }
+    # Create a job record for each task group
+    job_ids = Job.reserve_ids(session, len(task_groups))
+    gid_job_id_map = dict(zip(task_groups, job_ids))
+    job_rows = [{"id": job_id, "cancel_requested": cancel_requested} for job_id in job_ids]
 
-        gid_job_record_map[gid] = Job.create(session, insert_kwargs=job_kwargs, flush=False)
-
-    # Write job records to DB and retrieve primary keys
-
-    session.flush()
+    # Maps node ids to electron primary keys
+    electron_ids = dict(
+        zip((node.id for node in tg.nodes), ElectronMeta.reserve_ids(session, len(tg.nodes)))
+    )
+    electron_rows = []
+    asset_rows = []
+    link_keys = []
 
     for gid, node_group in task_groups.items():
         for node in node_group:
-            job_record = gid_job_record_map[gid]
-            e_record, asset_records_by_key, node = import_electron(
-                session,
+            electron_kwargs, asset_kwargs, node = import_electron(
                 dispatch_id,
                 node,
                 lat,
                 object_store,
-                job_id=job_record.id,
+                job_id=gid_job_id_map[gid],
             )
             output_nodes.append(node)
-            electron_map[node.id] = e_record
-            electron_asset_links[node.id] = asset_records_by_key
-
-    # Compute asset ids, electron ids, and create associations
-
-    n_records = len(electron_map)
-    st = datetime.now()
-    session.flush()
-    et = datetime.now()
-    delta = (et - st).total_seconds()
-    app_log.debug(f"Inserting {n_records} electron records took {delta} seconds")
-
-    n_records = sum(
-        len(asset_records_by_key) for asset_records_by_key in electron_asset_links.values()
-    )
-
-    st = datetime.now()
-    session.flush()
-    et = datetime.now()
-    delta = (et - st).total_seconds()
-    app_log.debug(f"Inserting {n_records} asset records took {delta} seconds")
-
-    meta_asset_associations = []
-    for node_id, asset_records in electron_asset_links.items():
-        electron_dal = Electron(session, electron_map[node_id])
-        meta_asset_associations.extend(
-            electron_dal.associate_asset(session, key, asset_rec.id)
-            for key, asset_rec in asset_records.items()
+            electron_kwargs["id"] = electron_ids[node.id]
+            electron_rows.append(electron_kwargs)
+            for key, kwargs in asset_kwargs.items():
+                asset_rows.append(kwargs)
+                link_keys.append((electron_ids[node.id], key))
+
+    asset_ids = Asset.reserve_ids(session, len(asset_rows))
+    for asset_id, kwargs in zip(asset_ids, asset_rows):
+        kwargs["id"] = asset_id
+    link_rows = [
+        {"meta_id": meta_id, "asset_id": asset_id, "key": key}
+        for (meta_id, key), asset_id in zip(link_keys, asset_ids)
+    ]
+
+    edge_rows = [_import_edge(e, electron_ids) for e in tg.links]
+
+    for record_type, rows in [
+        (Job, job_rows),
+        (ElectronMeta, electron_rows),
+        (Asset, asset_rows),
+        (ElectronAsset, link_rows),
+        (ElectronDependency, edge_rows),
+    ]:
+        st = datetime.now()
+        record_type.insert_bulk(session, values=rows)
+        et = datetime.now()
+        delta = (et - st).total_seconds()
+        app_log.debug(
+            f"Inserting {len(rows)} {record_type.model.__tablename__} records took {delta} seconds"
         )
-    n_records = len(meta_asset_associations)
-
-    st = datetime.now()
-    session.flush()
-    et = datetime.now()
-    delta = (et - st).total_seconds()
-    app_log.debug(f"Inserting {n_records} asset record links took {delta} seconds")
-
-    # Insert edges
-    edge_records = []
-    edges = [_import_edge(session, e, electron_map, edge_records) for e in tg.links]
 
-    n_records = 0
-    n_records = len(edge_records)
+    return TransportGraphSchema(nodes=output_nodes, links=tg.links)
 
-    st = datetime.now()
-    session.flush()
-    et = datetime.now()
-    delta = (et - st).total_seconds()
-    app_log.debug(f"Inserting {n_records} edge records took {delta} seconds")
-
-    return TransportGraphSchema(nodes=output_nodes, links=edges)
 
-
-def _import_edge(
-    session: Session,
-    edge: EdgeSchema,
-    electron_map: Dict[int, models.Electron],
-    edge_records: List[models.ElectronDependency],
-) -> EdgeSchema:
-    source_electron = electron_map[edge.source]
-    target_electron = electron_map[edge.target]
-    edge_name = edge.metadata.edge_name
-    param_type = edge.metadata.param_type
-    arg_index = edge.metadata.arg_index
-    insert_kwargs = {
-        "electron_id": target_electron.id,
-        "parent_electron_id": source_electron.id,
-        "edge_name": edge_name,
-        "parameter_type": param_type,
-        "arg_index": arg_index,
+def _import_edge(edge: EdgeSchema, electron_ids: Dict[int, int]) -> dict:
+    return {
+        "electron_id": electron_ids[edge.target],
+        "parent_electron_id": electron_ids[edge.source],
+        "edge_name": edge.metadata.edge_name,
+        "parameter_type": edge.metadata.param_type,
+        "arg_index": edge.metadata.arg_index,
     }
-
-    edge_records.append(
-        ElectronDependency.create(session, insert_kwargs=insert_kwargs, flush=False)
-    )
-
-    # No filtering involved
-    return edge
@@ -19,7 +19,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 from sqlalchemy.orm import Session
 
@@ -229,53 +229,55 @@ class Result(DispatchedObject[ResultMeta, ResultAsset]):
 
         app_log.debug("Inside update node")
 
-        _start_ts = datetime.now()
-        with self.session() as session:
-            if status is not None:
-                # This acquires a lock on the electron's row to achieve atomic RMW
-                if self._can_update_node_status(session, node_id, status):
-                    self.lattice.transport_graph.set_node_value(node_id, "status", status, session)
-                    if status == RESULT_STATUS.COMPLETED:
-                        self.incr_metadata("completed_electron_num", 1, session)
-                else:
-                    # Abort the update if illegal status update
-                    session.rollback()
-                    return False
-
-            # Current node name
-            name = self.lattice.transport_graph.get_node_value(node_id, "name", session)
-
-            if node_name is not None:
-                self.lattice.transport_graph.set_node_value(node_id, "name", node_name, session)
-
-            if start_time is not None:
-                self.lattice.transport_graph.set_node_value(
-                    node_id, "start_time", start_time, session
-                )
-
-            if end_time is not None:
-                self.lattice.transport_graph.set_node_value(node_id, "end_time", end_time, session)
+        node_result = {
+            "node_id": node_id,
+            "node_name": node_name,
+            "start_time": start_time,
+            "end_time": end_time,
+            "status": status,
+            "output": output,
+            "error": error,
+            "stdout": stdout,
+            "stderr": stderr,
+            "qelectron_data_exists": qelectron_data_exists,
+        }
+        return self._update_nodes([node_result])[0]
+
+    def _update_nodes(self, node_results: List[Dict]) -> List[bool]:
+        """
+        Update several node results in a single transaction.
 
-            if output is not None:
-                self.lattice.transport_graph.set_node_value(node_id, "output", output, session)
+        The updates are applied in order, so later updates to a node
+        observe the effects of earlier ones. Each status update is
+        validated using `_can_update_node_status()`; an illegal status
+        update is skipped without affecting the other updates in the
+        batch.
 
-            if error is not None:
-                self.lattice.transport_graph.set_node_value(node_id, "error", error, session)
-
-            if stdout is not None:
-                self.lattice.transport_graph.set_node_value(node_id, "stdout", stdout, session)
+        Args:
+            node_results: A list of dictionaries, each containing the
+                keyword arguments to `_update_node()`.
 
-            if stderr is not None:
-                self.lattice.transport_graph.set_node_value(node_id, "stderr", stderr, session)
+        Returns:
+            A list of booleans indicating whether each update
+            succeeded, in the same order as `node_results`.
+        """
 
-            if qelectron_data_exists is not None:
-                self.lattice.transport_graph.set_node_value(
-                    node_id, "qelectron_data_exists", qelectron_data_exists, session
-                )
+        _start_ts = datetime.now()
+        valid_updates = []
+        postprocess_updates = []
+        with self.session() as session:
+            for node_result in node_results:
+                valid, name = self._update_node_in_session(session, **node_result)
+                valid_updates.append(valid)
+                end_time = node_result.get("end_time")
+                if valid and name.startswith(postprocess_prefix) and end_time is not None:
+                    postprocess_updates.append(node_result)
 
         # Handle postprocessing node
         tg = self.lattice.transport_graph
-        if name.startswith(postprocess_prefix) and end_time is not None:
+        for node_result in postprocess_updates:
+            node_id = node_result["node_id"]
+            status = node_result.get("status")
             app_log.debug(f"Postprocess status: {status}")
             # Copy asset metadata
             with self.session() as session:
@@ -284,12 +286,74 @@ class Result(DispatchedObject[ResultMeta, ResultAsset]):
                 copy_asset_meta(session, node_output, workflow_result)
             copy_asset(node_output, workflow_result)
 
-            self._update_dispatch(status=status, end_time=end_time)
+            self._update_dispatch(status=status, end_time=node_result["end_time"])
 
         _end_ts = datetime.now()
         dt = (_end_ts - _start_ts).total_seconds()
-        app_log.debug(f"_update_node took {dt} seconds")
-        return True
+        app_log.debug(f"_update_nodes ({len(node_results)} updates) took {dt} seconds")
+        return valid_updates
+
+    def _update_node_in_session(
+        self,
+        session: Session,
+        node_id: int,
+        node_name: str = None,
+        start_time: datetime = None,
+        end_time: datetime = None,
+        status: "Status" = None,
+        output: Any = None,
+        error: Exception = None,
+        stdout: str = None,
+        stderr: str = None,
+        qelectron_data_exists: bool = None,
+    ) -> Tuple[bool, str]:
+        """Apply a node update within an existing session.
+
+        Returns:
+            A tuple (valid, name) where `valid` indicates whether the
+            update was applied and `name` is the node's name prior to
+            the update.
+        """
+
+        tg = self.lattice.transport_graph
+        if status is not None:
+            # This acquires a lock on the electron's row to achieve atomic RMW
+            if self._can_update_node_status(session, node_id, status):
+                tg.set_node_value(node_id, "status", status, session)
+                if status == RESULT_STATUS.COMPLETED:
+                    self.incr_metadata("completed_electron_num", 1, session)
+            else:
+                # Abort the update if illegal status update
+                return False, None
+
+        # Current node name
+        name = tg.get_node_value(node_id, "name", session)
+
+        if node_name is not None:
+            tg.set_node_value(node_id, "name", node_name, session)
+
+        if start_time is not None:
+            tg.set_node_value(node_id, "start_time", start_time, session)
+
+        if end_time is not None:
+            tg.set_node_value(node_id, "end_time", end_time, session)
+
+        if output is not None:
+            tg.set_node_value(node_id, "output", output, session)
+
+        if error is not None:
+            tg.set_node_value(node_id, "error", error, session)
+
+        if stdout is not None:
+            tg.set_node_value(node_id, "stdout", stdout, session)
+
+        if stderr is not None:
+            tg.set_node_value(node_id, "stderr", stderr, session)
+
+        if qelectron_data_exists is not None:
+            tg.set_node_value(node_id, "qelectron_data_exists", qelectron_data_exists, session)
+
+        return True, name
 
     def _can_update_node_status(self, session: Session, node_id: int, new_status: Status) -> bool:
         """Checks whether a node status update is valid.
@@ -311,8 +375,9 @@ class Result(DispatchedObject[ResultMeta, ResultAsset]):
         node._refresh_metadata(session, for_update=True)
         old_status = node.get_value("status", session, refresh=False)
         if RESULT_STATUS.is_terminal(old_status) or old_status == new_status:
+            dispatch_id = self.get_value("dispatch_id", session, refresh=False)
             app_log.debug(
-                f"{self.dispatch_id}:{node_id}: illegal status update {old_status} -> {new_status}"
+                f"{dispatch_id}:{node_id}: illegal status update {old_status} -> {new_status}"
             )
             return False
 
@@ -0,0 +1,211 @@
+# Copyright 2023 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Memoization of electrons across dispatches.
+
+An electron with `cache=True` is identified by a key derived from the
+digests of its function, its hooks, and the outputs of its parents.
+Before such an electron is executed, the dispatcher looks for a
+previously completed electron with the same key and reuses its
+outputs instead.
+"""
+
+import hashlib
+import json
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from covalent._shared_files import logger
+from covalent._shared_files.util_classes import RESULT_STATUS
+
+from .._db import models
+from .asset import Asset, copy_asset, copy_asset_meta
+from .electron import Electron
+from .tg import _TransportGraph
+
+app_log = logger.app_log
+
+# Assets produced by executing an electron
+CACHED_ASSET_KEYS = ["output", "stdout", "stderr"]
+
+
+def compute_cache_key(
+    function_digest: str,
+    hooks_digest: str,
+    arg_digests: List[str],
+    kwarg_digests: Dict[str, str],
+) -> str:
+    """Compute the cache key of an electron.
+
+    Args:
+        function_digest: The digest of the serialized function
+        hooks_digest: The digest of the serialized hooks
+        arg_digests: The output digests of the positional arguments
+        kwarg_digests: The output digests of the keyword arguments
+
+    Returns:
+        The hex digest identifying the electron's computation
+    """
+    spec = {
+        "function": function_digest,
+        "hooks": hooks_digest,
+        "args": arg_digests,
+        "kwargs": kwarg_digests,
+    }
+    return hashlib.sha256(json.dumps(spec, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def _asset_digest(asset: Asset, session: Session) -> Optional[str]:
+    """The digest of an asset, computing and recording it if unknown."""
+    if asset.digest:
+        return asset.digest
+    try:
+        digest = asset.object_store.digest(asset.storage_path, asset.object_key)
+    except OSError as e:
+        app_log.debug(f"Unable to compute the digest of {asset.internal_uri}: {e}")
+        return None
+    asset.update(session, values={"digest_alg": digest.algorithm, "digest": digest.hexdigest})
+    return digest.hexdigest
+
+
+def _node_cache_key(
+    session: Session,
+    tg: _TransportGraph,
+    node: Electron,
+    abstract_inputs: Dict,
+    group_digests: Dict[int, Optional[str]],
+) -> Optional[str]:
+    """Compute the cache key of a node whose parents have completed.
+
+    Args:
+        session: SQLAlchemy session
+        tg: The transport graph containing the node
+        node: The node
+        abstract_inputs: The node ids of the positional and keyword
+            arguments of the node
+        group_digests: The output digests of the nodes in the same task
+            group, or `None` for nodes whose outputs are not known yet
+
+    Returns:
+        The cache key, or `None` if some input digest is unknown.
+    """
+
+    def _input_digest(parent_id: int) -> Optional[str]:
+        if parent_id in group_digests:
+            return group_digests[parent_id]
+        parent = tg.get_node(parent_id, session)
+        return _asset_digest(parent.get_asset("output", session), session)
+
+    arg_digests = [_input_digest(parent_id) for parent_id in abstract_inputs["args"]]
+    kwarg_digests = {k: _input_digest(v) for k, v in abstract_inputs["kwargs"].items()}
+    if None in arg_digests or None in kwarg_digests.values():
+        return None
+
+    function_digest = node.get_asset("function", session).digest
+    hooks_digest = node.get_asset("hooks", session).digest
+    if not function_digest or not hooks_digest:
+        return None
+
+    return compute_cache_key(function_digest, hooks_digest, arg_digests, kwarg_digests)
+
+
+def find_cached_electron(session: Session, cache_key: str, electron_id: int) -> Optional[Electron]:
+    """Find the most recently completed electron with a cache key.
+
+    Args:
+        session: SQLAlchemy session
+        cache_key: The cache key to look up
+        electron_id: The primary key of the electron looking for a
+            cached result, which is excluded from the search
+
+    Returns:
+        The cached electron, if any.
+    """
+    stmt = (
+        select(models.Electron)
+        .where(models.Electron.cache_key == cache_key)
+        .where(models.Electron.status == str(RESULT_STATUS.COMPLETED))
+        .where(models.Electron.is_active.is_(True))
+        .where(models.Electron.id != electron_id)
+        .order_by(models.Electron.completed_at.desc())
+    )
+    for record in session.scalars(stmt):
+        electron = Electron(session, record)
+        output = electron.get_asset("output", session)
+        # The outputs of deleted dispatches may have been removed
+        if output.object_store.size(output.storage_path, output.object_key) > 0:
+            return electron
+    return None
+
+
+def load_cached_outputs(tg: _TransportGraph, task_plans: List[Dict]) -> bool:
+    """Reuse previously computed outputs for a task group.
+
+    The outputs are reused only if every task in the group has a
+    cached result; the cache key of each task whose inputs are known is
+    recorded so that its own result can be reused once it completes.
+
+    Args:
+        tg: The transport graph of the dispatch
+        task_plans: The topologically sorted task plans of the group,
+            each containing `node_id` and `abstract_inputs`
+
+    Returns:
+        Whether the outputs of all tasks in the group were reused.
+    """
+
+    group_digests = {plan["node_id"]: None for plan in task_plans}
+    cache_hits: List[Tuple[Electron, Electron]] = []
+    assets_to_copy: List[Tuple[Asset, Asset]] = []
+    all_cached = True
+
+    with Electron.session() as session:
+        for plan in task_plans:
+            node = tg.get_node(plan["node_id"], session)
+            cache_key = _node_cache_key(session, tg, node, plan["abstract_inputs"], group_digests)
+            if cache_key is None:
+                all_cached = False
+                continue
+
+            node.metadata.update(session, values={"cache_key": cache_key})
+            if not all_cached:
+                continue
+
+            cached = find_cached_electron(session, cache_key, node._electron_id)
+            if cached is None:
+                all_cached = False
+                continue
+
+            cache_hits.append((cached, node))
+            group_digests[plan["node_id"]] = _asset_digest(
+                cached.get_asset("output", session), session
+            )
+
+        if all_cached:
+            for cached, node in cache_hits:
+                app_log.debug(f"Reusing the outputs of electron {cached._electron_id}")
+                for key in CACHED_ASSET_KEYS:
+                    src = cached.get_asset(key, session)
+                    dest = node.get_asset(key, session)
+                    copy_asset_meta(session, src, dest)
+                    assets_to_copy.append((src, dest))
+
+    for src, dest in assets_to_copy:
+        copy_asset(src, dest)
+
+    return all_cached
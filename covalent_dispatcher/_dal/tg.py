@@ -29,6 +29,7 @@ from covalent._shared_files import logger
 from .._db.models import ElectronDependency as EdgeRecord
 from .db_interfaces.tg_utils import (
     _all_edge_records,
+    _asset_digest_records,
     _child_records,
     _edge_records_for_nodes,
     _incoming_edge_records,
@@ -194,6 +195,18 @@ class _TransportGraph:
             target = self.get_node(node_key, session)
             return _get_edge_data_for_nodes(session, source, target)
 
+    def get_asset_digests(self, key: str) -> Dict[int, str]:
+        """Query the digests of an asset for all nodes in one round trip.
+
+        Args:
+            key: The asset key
+
+        Returns:
+            A dictionary {node_id: digest}
+        """
+        with Node.session() as session:
+            return dict(_asset_digest_records(session, self.lattice_id, key))
+
     def get_internal_graph_copy(self) -> nx.MultiDiGraph:
         return self._graph.copy()
 
@@ -49,12 +49,22 @@ class TransportGraphOps:
 
     @staticmethod
     def _flag_successors(A: nx.MultiDiGraph, node_statuses: dict, starting_node: int):
-        """Flag all successors of a node (including the node itself)."""
-        nodes_to_invalidate = [starting_node]
-        for node, successors in nx.bfs_successors(A, starting_node):
-            nodes_to_invalidate.extend(iter(successors))
-        for node in nodes_to_invalidate:
-            node_statuses[node] = -1
+        """Flag all successors of a node (including the node itself).
+
+        The successors of a flagged node are always flagged, so the
+        traversal stops at already flagged nodes. This bounds the total
+        work of all calls during a graph diff by the size of the graph.
+        """
+        if node_statuses[starting_node] == -1:
+            return
+        node_statuses[starting_node] = -1
+        nodes_to_visit = [starting_node]
+        while nodes_to_visit:
+            node = nodes_to_visit.pop()
+            for successor in A.adj[node]:
+                if node_statuses[successor] != -1:
+                    node_statuses[successor] = -1
+                    nodes_to_visit.append(successor)
 
     @staticmethod
     def is_same_node(A: nx.MultiDiGraph, B: nx.MultiDiGraph, node: int) -> bool:
@@ -108,7 +118,9 @@ class TransportGraphOps:
                     copy_asset_meta(session, old, new)
                     assets_to_copy.append((old, new))
 
-        # Now perform all data copy operations (this could be slow)
+        # Now perform all data copy operations (this could be slow
+        # unless assets are deduplicated, in which case files are
+        # only linked)
         if not defer_copy_objects:
             for item in assets_to_copy:
                 src, dest = item
@@ -174,8 +186,6 @@ class TransportGraphOps:
 
         A_node_status = {node_id: 0 for node_id in A.nodes}
         B_node_status = {node_id: 0 for node_id in B.nodes}
-        app_log.debug(f"A node status: {A_node_status}")
-        app_log.debug(f"B node status: {B_node_status}")
 
         virtual_root = -1
 
@@ -201,7 +211,6 @@ class TransportGraphOps:
         while nodes_to_visit:
             current_node = nodes_to_visit.pop()
 
-            app_log.debug(f"Visiting node {current_node}")
             for y in A.adj[current_node]:
                 # Don't process already failed nodes
                 if A_node_status[y] == -1:
@@ -227,9 +236,7 @@ class TransportGraphOps:
 
                 # Compare nodes
                 if not node_cmp(A, B, y):
-                    app_log.debug(f"Attributes of node {y} differ:")
-                    app_log.debug(f"A[y] = {A.nodes[y]}")
-                    app_log.debug(f"B[y] = {B.nodes[y]}")
+                    app_log.debug(f"Attributes of node {y} differ")
                     self._flag_successors(A, A_node_status, y)
                     self._flag_successors(B, B_node_status, y)
                     continue
@@ -240,7 +247,6 @@ class TransportGraphOps:
                 if A_node_status[y] == 0:
                     A_node_status[y] = 1
                     B_node_status[y] = 1
-                    app_log.debug(f"Enqueueing node {y}")
                     nodes_to_visit.appendleft(y)
 
             # Prune children of current_node in B that aren't valid children in A
@@ -258,34 +264,40 @@ class TransportGraphOps:
         A.remove_node(-1)
         B.remove_node(-1)
 
-        app_log.debug(f"A node status: {A_node_status}")
-        app_log.debug(f"B node status: {B_node_status}")
-
         for k, v in A_node_status.items():
             A_node_status[k] = self._status_map[v]
         for k, v in B_node_status.items():
             B_node_status[k] = self._status_map[v]
         return A_node_status, B_node_status
 
+    @staticmethod
+    def _diff_graph(tg: _TransportGraph) -> nx.MultiDiGraph:
+        """Copy the structure of a transport graph for diffing.
+
+        Only the node attributes compared by `_cmp_name_and_pval` are
+        copied; the parameter value checksums of all nodes are loaded
+        in a single query.
+        """
+        value_digests = tg.get_asset_digests("value")
+        g = nx.MultiDiGraph()
+        g.add_nodes_from(
+            (
+                node_id,
+                {
+                    "name": attrs["name"],
+                    "status": attrs["status"],
+                    "value": value_digests.get(node_id),
+                },
+            )
+            for node_id, attrs in tg._graph.nodes(data=True)
+        )
+        g.add_edges_from(tg._graph.edges(keys=True, data=True))
+        return g
+
     def get_reusable_nodes(self, tg_new: _TransportGraph) -> List[int]:
         """Find which nodes are common between the current graph and a new graph."""
-        A = self.tg.get_internal_graph_copy()
-        B = tg_new.get_internal_graph_copy()
-
-        # inject parameter value checksums
-        for node_id in A.nodes:
-            node = self.tg.get_node(node_id)
-            with node.session() as session:
-                value_asset = node.get_asset("value", session)
-            value_hash = value_asset.digest
-            A.nodes[node_id]["value"] = value_hash
-
-        for node_id in B.nodes:
-            node = tg_new.get_node(node_id)
-            with node.session() as session:
-                value_asset = node.get_asset("value", session)
-            value_hash = value_asset.digest
-            B.nodes[node_id]["value"] = value_hash
+        A = self._diff_graph(self.tg)
+        B = self._diff_graph(tg_new)
 
         status_A, _ = self._max_cbms(A, B, node_cmp=self._cmp_name_and_pval)
         return [k for k, v in status_A.items() if v]
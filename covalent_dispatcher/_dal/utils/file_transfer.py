@@ -22,12 +22,18 @@ from concurrent.futures import ThreadPoolExecutor
 
 from covalent._file_transfer import FileTransfer
 from covalent._shared_files import logger
+from covalent._shared_files.utils import copy_file_locally
 
 app_log = logger.app_log
 am_pool = ThreadPoolExecutor()
 
 
 def cp(src_uri: str, dest_uri: str, transfer_options: dict = {}):
+    # Assets in an asset pack are addressed by a byte range of the pack
+    if src_uri.startswith("file://") and "#" in src_uri:
+        copy_file_locally(src_uri, dest_uri)
+        return
+
     ft = FileTransfer(src_uri, dest_uri)
     pre_hook, transfer_callable = FileTransfer(src_uri, dest_uri).cp()
     transfer_callable()
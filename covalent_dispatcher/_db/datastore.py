@@ -14,40 +14,98 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from contextlib import contextmanager
+import importlib.util
+from contextlib import asynccontextmanager, contextmanager
 from os import environ, path
 from pathlib import Path
-from typing import Generator, Optional
+from typing import AsyncGenerator, Generator, Optional
 
 from alembic import command
 from alembic.config import Config
 from alembic.environment import EnvironmentContext
 from alembic.migration import MigrationContext
 from alembic.script import ScriptDirectory
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy_utils import create_database, database_exists
 
+from covalent._shared_files import logger
 from covalent._shared_files.config import get_config
 
 from . import models
 
+app_log = logger.app_log
+
 DEBUG_DB = environ.get("COVALENT_DEBUG_DB") == "1"
 
+# Asyncio DBAPI drivers for each supported backend
+ASYNC_DRIVERS = {
+    "sqlite": "aiosqlite",
+    "postgresql": "asyncpg",
+}
+
+
+def _async_db_url(db_URL: str) -> Optional[str]:
+    """Translate a DB URL to use the backend's asyncio driver.
+
+    Returns `None` if the backend has no supported asyncio driver or
+    if the driver is not installed.
+    """
+    url = make_url(db_URL)
+    backend = url.get_backend_name()
+    driver = ASYNC_DRIVERS.get(backend)
+    if not driver or importlib.util.find_spec(driver) is None:
+        return None
+    return str(url.set(drivername=f"{backend}+{driver}"))
+
+
+def _set_sqlite_wal_pragmas(dbapi_connection, connection_record):
+    """Enable write-ahead logging so that readers don't block on writers."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
 
 class DataStore:
     def __init__(
         self,
         db_URL: Optional[str] = None,
         initialize_db: bool = False,
+        concurrent: bool = False,
+        use_async: bool = False,
         **kwargs,
     ):
+        """Interface to the dispatcher's database.
+
+        Args:
+            db_URL: The SQLAlchemy database URL. Defaults to the Sqlite
+                database at `dispatcher.db_path`.
+            initialize_db: Whether to create all tables (for tests).
+            concurrent: Whether to enable concurrent access. For Sqlite,
+                this turns on WAL journaling so that reads can proceed
+                in parallel with the (single) writer. Other backends
+                such as Postgres allow concurrent reads and writes.
+            use_async: Whether to also create an asyncio engine so
+                that hot queries can be awaited directly instead of
+                being run in a worker thread. Requires the aiosqlite
+                (Sqlite) or asyncpg (Postgres) driver. Writes are only
+                awaited directly if the backend supports concurrent
+                writers; Sqlite writes stay on the single writer thread.
+        """
+
         if db_URL:
             self.db_URL = db_URL
         else:
             self.db_URL = "sqlite+pysqlite:///" + get_config("dispatcher.db_path")
 
+        self.concurrent = concurrent
         self.engine = create_engine(self.db_URL, **kwargs)
+        if self.concurrent and self.is_sqlite and not self.is_in_memory:
+            event.listen(self.engine, "connect", _set_sqlite_wal_pragmas)
+
         if not database_exists(self.engine.url):
             try:
                 create_database(self.engine.url)
@@ -59,9 +117,68 @@ class DataStore:
         if initialize_db:
             models.Base.metadata.create_all(self.engine)
 
+        self.async_engine = None
+        self.AsyncSession = None
+        if use_async:
+            self._init_async_engine(**kwargs)
+
+    def _init_async_engine(self, **kwargs):
+        async_URL = _async_db_url(self.db_URL)
+
+        # An in-memory Sqlite DB is private to its connection
+        if async_URL is None or self.is_in_memory:
+            app_log.warning(f"Asyncio DB access is not available for {self.engine.url}")
+            return
+
+        self.async_engine = create_async_engine(async_URL, **kwargs)
+        if self.concurrent and self.is_sqlite:
+            event.listen(self.async_engine.sync_engine, "connect", _set_sqlite_wal_pragmas)
+        self.AsyncSession = sessionmaker(
+            self.async_engine, class_=AsyncSession, expire_on_commit=False
+        )
+
+    @property
+    def is_sqlite(self) -> bool:
+        return self.engine.dialect.name == "sqlite"
+
+    @property
+    def is_in_memory(self) -> bool:
+        return self.is_sqlite and self.engine.url.database in (None, "", ":memory:")
+
+    @property
+    def supports_concurrent_reads(self) -> bool:
+        """Whether reads can run in parallel with each other and with writes."""
+        return self.concurrent and not self.is_in_memory
+
+    @property
+    def supports_concurrent_writes(self) -> bool:
+        """Whether several transactions can write at the same time."""
+        return self.concurrent and not self.is_sqlite
+
+    @property
+    def supports_async(self) -> bool:
+        """Whether queries can be awaited using `async_session()`."""
+        return self.async_engine is not None
+
+    @property
+    def supports_async_reads(self) -> bool:
+        """Whether reads can be awaited instead of queueing behind writes."""
+        return self.supports_async and self.supports_concurrent_reads
+
+    @property
+    def supports_async_writes(self) -> bool:
+        """Whether writes can be awaited instead of going through the
+        single DB writer thread, which Sqlite requires."""
+        return self.supports_async and self.supports_concurrent_writes
+
     @staticmethod
     def factory():
-        return DataStore(db_URL=environ.get("COVALENT_DATABASE_URL"), echo=DEBUG_DB)
+        return DataStore(
+            db_URL=environ.get("COVALENT_DATABASE_URL"),
+            concurrent=get_config("dispatcher.db_concurrency") == "true",
+            use_async=get_config("dispatcher.db_async") == "true",
+            echo=DEBUG_DB,
+        )
 
     def get_alembic_config(self, logging_enabled: bool = True):
         alembic_ini_path = Path(path.join(__file__, "./../../../covalent_migrations/alembic.ini"))
@@ -101,5 +218,10 @@ class DataStore:
         with self.Session.begin() as session:
             yield session
 
+    @asynccontextmanager
+    async def async_session(self) -> AsyncGenerator[AsyncSession, None]:
+        async with self.AsyncSession.begin() as session:
+            yield session
+
 
 workflow_db = DataStore.factory()
@@ -18,7 +18,7 @@
 
 from typing import Dict, List
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.orm import Session
 
 from covalent._shared_files import logger
@@ -29,6 +29,13 @@ from .models import Electron, Job, Lattice
 app_log = logger.app_log
 log_stack_info = logger.log_stack_info
 
+# Map `update_job_records` keyword arguments to Job columns
+_JOB_RECORD_COLUMNS = {
+    "cancel_requested": "cancel_requested",
+    "job_handle": "job_handle",
+    "job_status": "status",
+}
+
 
 class MissingJobRecordError(Exception):
     """
@@ -164,3 +171,87 @@ def to_job_ids(dispatch_id: str, task_ids: List[int]) -> List[int]:
         records = session.scalars(stmt).all()
 
         return records
+
+
+async def update_job_records_async(record_kwargs_list: list):
+    """
+    Update job records in the database using the asyncio engine
+
+    Arg(s)
+        record_kwargs_list: List of keyword arguments of the fields that need to be updated in the job records
+
+    Return(s)
+        None
+    """
+    async with workflow_db.async_session() as session:
+        for entry in record_kwargs_list:
+            job_id = entry["job_id"]
+            values = {
+                column: entry[key]
+                for key, column in _JOB_RECORD_COLUMNS.items()
+                if entry.get(key) is not None
+            }
+            if values:
+                stmt = update(Job).where(Job.id == job_id).values(**values)
+                found = (await session.execute(stmt)).rowcount > 0
+            else:
+                stmt = select(Job.id).where(Job.id == job_id)
+                found = (await session.scalars(stmt)).first() is not None
+            if not found:
+                raise MissingJobRecordError(message=f"Job {job_id} not found")
+
+
+async def get_job_records_async(job_ids: List[int]) -> List[Dict]:
+    """
+    Retrieve the job records of all jobs with `job_ids` using the asyncio engine
+
+    Arg(s)
+        job_ids: List of job ids to query the job records of
+
+    Return(s)
+        Job records of all tasks with `job_ids`
+    """
+    async with workflow_db.async_session() as session:
+        stmt = select(Job).where(Job.id.in_(job_ids))
+        job_records = {rec.id: rec for rec in (await session.scalars(stmt)).all()}
+
+    records = []
+    for job_id in job_ids:
+        if job_id not in job_records:
+            raise MissingJobRecordError(message=f"Job {job_id} not found")
+        job_record = job_records[job_id]
+        records.append(
+            {
+                "job_id": job_record.id,
+                "cancel_requested": job_record.cancel_requested,
+                "status": job_record.status,
+                "job_handle": job_record.job_handle,
+            }
+        )
+    return records
+
+
+async def to_job_ids_async(dispatch_id: str, task_ids: List[int]) -> List[int]:
+    """
+    Map all lattice task ids to their corresponding job ids using the asyncio engine
+
+    Arg(s)
+        dispatch_id: Dispatch ID of the lattice
+        task_ids: IDs of tasks in the lattice
+
+    Return(s)
+        Corresponding job ids assocated with the provided task ids
+    """
+    async with workflow_db.async_session() as session:
+        stmt = select(Lattice.id).where(Lattice.dispatch_id == dispatch_id)
+        lattice_id = (await session.scalars(stmt)).first()
+        if lattice_id is None:
+            raise KeyError(f"Invalid dispatch {dispatch_id}")
+
+        stmt = (
+            select(Electron.job_id)
+            .where(Electron.parent_lattice_id == lattice_id)
+            .where(Electron.transport_graph_node_id.in_(task_ids))
+        )
+
+        return (await session.scalars(stmt)).all()
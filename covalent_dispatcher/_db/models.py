@@ -134,7 +134,10 @@ class Lattice(Base):
 
 class Electron(Base):
     __tablename__ = "electrons"
-    __table_args__ = (Index("latid_nodeid_idx", "parent_lattice_id", "transport_graph_node_id"),)
+    __table_args__ = (
+        Index("latid_nodeid_idx", "parent_lattice_id", "transport_graph_node_id"),
+        Index("cache_key_idx", "cache_key"),
+    )
     id = Column(Integer, primary_key=True)
 
     # id of the lattice containing this electron
@@ -188,6 +191,12 @@ class Electron(Base):
     # Whether qelectron data exists or not
     qelectron_data_exists = Column(Boolean, nullable=False, default=False)
 
+    # Whether the outputs of the electron can be reused across dispatches
+    cache = Column(Boolean, nullable=False, default=False)
+
+    # Digest identifying the function, hooks, and inputs of a cached electron
+    cache_key = Column(Text)
+
     # Name of the file containing standard error generated by the task
     stderr_filename = Column(Text)
 
@@ -307,3 +316,7 @@ class Asset(Base):
 
     # Size in bytes
     size = Column(Integer, nullable=True)
+
+    # Compression codec of the stored file ("zstd", "lz4", "gzip") or
+    # NULL if the file is uncompressed
+    codec = Column(Text, nullable=True)
@@ -107,7 +107,8 @@ def _lattice_data(session: Session, result: Result, electron_id: int = None) ->
         ("result", LATTICE_RESULTS_FILENAME, result._result),
         ("hooks", LATTICE_HOOKS_FILENAME, result.lattice.metadata["hooks"]),
     ]:
-        digest, size = local_store.store_file(data_storage_path, filename, data)
+        codec = local_store.codec_for(filename) if data is not None else None
+        digest, size = local_store.store_file(data_storage_path, filename, data, codec=codec)
         asset_record_kwargs = {
             "storage_type": LATTICE_STORAGE_TYPE,
             "storage_path": str(data_storage_path),
@@ -115,6 +116,7 @@ def _lattice_data(session: Session, result: Result, electron_id: int = None) ->
             "digest_alg": digest.algorithm,
             "digest": digest.hexdigest,
             "size": size,
+            "codec": codec,
         }
 
         assets[key] = Asset.create(session, insert_kwargs=asset_record_kwargs, flush=True)
@@ -285,7 +287,8 @@ def _electron_data(
                 ("error", ELECTRON_ERROR_FILENAME, node_error),
                 ("output", ELECTRON_RESULTS_FILENAME, node_output),
             ]:
-                digest, size = local_store.store_file(node_path, filename, data)
+                codec = local_store.codec_for(filename) if data is not None else None
+                digest, size = local_store.store_file(node_path, filename, data, codec=codec)
                 asset_record_kwargs = {
                     "storage_type": ELECTRON_STORAGE_TYPE,
                     "storage_path": str(node_path),
@@ -293,6 +296,7 @@ def _electron_data(
                     "digest_alg": digest.algorithm,
                     "digest": digest.hexdigest,
                     "size": size,
+                    "codec": codec,
                 }
 
                 assets[key] = Asset.create(session, insert_kwargs=asset_record_kwargs, flush=True)
@@ -59,3 +59,40 @@ class BaseProvider:
         """
 
         raise NotImplementedError
+
+    def codec_for(self, filename: str) -> Optional[str]:
+        """Compression codec for an asset file, or `None` to store it raw."""
+        return None
+
+    @property
+    def deduplicate(self) -> bool:
+        """Whether identical asset files share their storage."""
+        return False
+
+    def link_file(
+        self, src_storage_path: str, src_filename: str, dest_storage_path: str, dest_filename: str
+    ) -> None:
+        """Make an asset file share the stored data of another one."""
+        raise NotImplementedError
+
+    def deduplicate_file(self, storage_path: str, filename: str) -> None:
+        """Share the data of a file written by another component."""
+        pass
+
+    def link_blob(
+        self, storage_path: str, filename: str, digest_alg: Optional[str], digest: Optional[str]
+    ) -> bool:
+        """Populate an asset file from already stored data with a given digest.
+
+        Returns:
+            Whether data with the digest was found.
+        """
+        return False
+
+    def detach_file(self, storage_path: str, filename: str) -> None:
+        """Unshare an asset file before it is rewritten in place."""
+        pass
+
+    def release(self, hexdigest: str, codec: Optional[str] = None) -> None:
+        """Drop the stored data for a digest once no asset references it."""
+        pass
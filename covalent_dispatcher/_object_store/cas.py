@@ -0,0 +1,141 @@
+# Copyright 2023 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Content-addressed storage of asset files.
+
+Each distinct file is stored once as a blob keyed by its digest and
+the codec of the stored bytes. Asset files are hard links to their
+blob, so the link count of a blob is the number of asset files
+referencing it plus one. Asset files must therefore always be
+replaced, never modified in place.
+"""
+
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Optional, Union
+
+from covalent._shared_files import logger
+
+app_log = logger.app_log
+
+
+def _tmp_path(path: Path) -> Path:
+    return path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+
+def _link(src: Union[str, Path], dest: Union[str, Path]) -> None:
+    tmp_path = _tmp_path(Path(dest))
+    os.link(src, tmp_path)
+    os.replace(tmp_path, dest)
+
+
+def link_or_copy(src: Union[str, Path], dest: Union[str, Path]) -> None:
+    """Atomically make `dest` a hard link to `src`.
+
+    Falls back to copying if `src` and `dest` are on different
+    filesystems or the filesystem does not support hard links.
+    """
+    try:
+        _link(src, dest)
+    except OSError:
+        tmp_path = _tmp_path(Path(dest))
+        shutil.copyfile(src, tmp_path)
+        os.replace(tmp_path, dest)
+
+
+class ContentAddressedStore:
+    """Blobs keyed by digest, shared between asset files by hard links.
+
+    Args:
+        root: The directory containing the blobs
+    """
+
+    def __init__(self, root: Union[str, Path]):
+        self.root = Path(root)
+
+    def blob_path(self, hexdigest: str, codec: Optional[str] = None) -> Path:
+        """The path of the blob for a digest and codec."""
+        return self.root / hexdigest[:2] / f"{hexdigest}.{codec or 'raw'}"
+
+    def link(self, path: Union[str, Path], hexdigest: str, codec: Optional[str] = None) -> bool:
+        """Deduplicate a freshly written asset file.
+
+        If a blob with the same digest already exists, the asset file
+        is replaced by a link to the blob. Otherwise the asset file
+        becomes the blob.
+
+        Args:
+            path: The path of the asset file
+            hexdigest: The digest of the uncompressed file contents
+            codec: The compression codec of the stored bytes
+
+        Returns:
+            Whether the file was replaced by an existing blob.
+        """
+        blob = self.blob_path(hexdigest, codec)
+        try:
+            if blob.exists():
+                if not os.path.samefile(blob, path):
+                    _link(blob, path)
+                return True
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            _link(path, blob)
+        except OSError as e:
+            # Deduplication is an optimization; keep the private copy
+            app_log.warning(f"Unable to deduplicate {path}: {e}")
+        return False
+
+    def refcount(self, hexdigest: str, codec: Optional[str] = None) -> int:
+        """The number of asset files referencing a blob."""
+        try:
+            return os.stat(self.blob_path(hexdigest, codec)).st_nlink - 1
+        except FileNotFoundError:
+            return 0
+
+    def release(self, hexdigest: str, codec: Optional[str] = None) -> bool:
+        """Remove a blob if no asset file references it anymore.
+
+        Returns:
+            Whether the blob was removed.
+        """
+        blob = self.blob_path(hexdigest, codec)
+        try:
+            if os.stat(blob).st_nlink == 1:
+                os.unlink(blob)
+                return True
+        except FileNotFoundError:
+            pass
+        return False
+
+    def collect_garbage(self) -> int:
+        """Remove all unreferenced blobs.
+
+        Returns:
+            The number of blobs removed.
+        """
+        removed = 0
+        if not self.root.exists():
+            return removed
+        for prefix in self.root.iterdir():
+            for blob in prefix.iterdir():
+                if blob.name.endswith(".tmp"):
+                    continue
+                hexdigest, codec = blob.name.rsplit(".", maxsplit=1)
+                if self.release(hexdigest, None if codec == "raw" else codec):
+                    removed += 1
+        return removed
@@ -0,0 +1,126 @@
+# Copyright 2023 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Streaming compression codecs for stored assets.
+
+Compressed files are self-describing: each codec writes a standard
+frame format whose magic number is checked when reading, so files
+written without compression remain readable as-is.
+"""
+
+import gzip
+import importlib
+from typing import BinaryIO, Optional, Union
+
+from covalent._shared_files import logger
+
+app_log = logger.app_log
+
+# Frame magic numbers of the supported formats
+_MAGIC = {
+    "zstd": b"\x28\xb5\x2f\xfd",
+    "lz4": b"\x04\x22\x4d\x18",
+    "gzip": b"\x1f\x8b",
+}
+_MAGIC_LENGTH = max(len(magic) for magic in _MAGIC.values())
+
+# Module providing each codec; only gzip is always available
+_CODEC_MODULES = {
+    "zstd": "zstandard",
+    "lz4": "lz4.frame",
+    "gzip": "gzip",
+}
+
+
+class UnsupportedCodecError(Exception):
+    """Raised when a compression codec is unknown or not installed."""
+
+    pass
+
+
+def _codec_module(codec: str):
+    try:
+        module_name = _CODEC_MODULES[codec]
+    except KeyError:
+        raise UnsupportedCodecError(f"Unknown compression codec {codec}")
+    try:
+        return importlib.import_module(module_name)
+    except ImportError:
+        raise UnsupportedCodecError(
+            f"Compression codec {codec} requires the {module_name.split('.')[0]} package"
+        )
+
+
+def is_available(codec: str) -> bool:
+    """Whether a codec can be used in this environment."""
+    try:
+        _codec_module(codec)
+        return True
+    except UnsupportedCodecError:
+        return False
+
+
+def open_file(path: str, mode: str = "rb", codec: Optional[str] = None) -> BinaryIO:
+    """Open a binary file, compressing or decompressing as a stream.
+
+    Args:
+        path: The path of the file
+        mode: "rb" or "wb"
+        codec: The compression codec, or `None` for an uncompressed file
+
+    Returns:
+        A binary file object
+    """
+    if not codec:
+        return open(path, mode)
+    module = _codec_module(codec)
+    if codec == "gzip":
+        # Favor throughput over compression ratio
+        return gzip.open(path, mode, compresslevel=1)
+    return module.open(path, mode)
+
+
+def detect_codec(path: str) -> Optional[str]:
+    """Detect the codec of a stored file from its magic number.
+
+    Returns:
+        The codec name or `None` if the file is not compressed.
+    """
+    with open(path, "rb") as f:
+        prefix = f.read(_MAGIC_LENGTH)
+    for codec, magic in _MAGIC.items():
+        if prefix.startswith(magic):
+            return codec
+    return None
+
+
+def open_for_reading(path: str) -> BinaryIO:
+    """Open a possibly compressed file for streaming reads."""
+    return open_file(path, "rb", detect_codec(path))
+
+
+def read_exactly(f: BinaryIO, size: int) -> Union[bytes, bytearray]:
+    """Read up to `size` bytes, retrying on short reads from streams."""
+    buf = f.read(size)
+    if len(buf) == size or not buf:
+        return buf
+    buf = bytearray(buf)
+    while len(buf) < size:
+        chunk = f.read(size - len(buf))
+        if not chunk:
+            break
+        buf.extend(chunk)
+    return buf
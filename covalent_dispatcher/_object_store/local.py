@@ -16,18 +16,33 @@
 
 
 import hashlib
+import io
 import json
 import os
+import shutil
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Optional, Tuple
+from typing import Any, Generator, Optional, Tuple
 
 import cloudpickle
 
+from covalent._serialize.common import (
+    AssetType,
+    deserialize_asset,
+    read_asset_file,
+    serialize_asset_segments,
+    write_asset_file,
+)
+from covalent._shared_files import logger
 from covalent._shared_files.config import get_config
 from covalent._shared_files.schemas import electron, lattice, result
-from covalent._workflow.transport import TransportableObject
 
+from . import compression
 from .base import BaseProvider, Digest
+from .cas import ContentAddressedStore, _tmp_path, link_or_copy
+
+app_log = logger.app_log
 
 BLOCK_SIZE = 65536
 ALGORITHM = "sha1"
@@ -48,11 +63,37 @@ class InvalidFileExtension(Exception):
     pass
 
 
+class _DigestWriter:
+    """Computes the digest and size of the data written to a stream."""
+
+    def __init__(self, f):
+        self._f = f
+        self._hash = hashlib.new(ALGORITHM)
+        self.size = 0
+
+    def write(self, data) -> int:
+        self._hash.update(data)
+        self.size += memoryview(data).nbytes
+        return self._f.write(data)
+
+    @property
+    def digest(self) -> Digest:
+        return Digest(algorithm=ALGORITHM, hexdigest=self._hash.hexdigest())
+
+
 class LocalProvider(BaseProvider):
     scheme = "file"
 
     def __init__(self):
         self.base_path = get_config("dispatcher.results_dir")
+        self.cas = ContentAddressedStore(os.path.join(self.base_path, ".objects"))
+        # Asset files linked by `link_blob` in each thread; see `unlink_blobs_on_error`
+        self._linked = threading.local()
+
+    @property
+    def deduplicate(self) -> bool:
+        """Whether identical asset files share their storage."""
+        return get_config("dispatcher.asset_dedup") == "true"
 
     def digest(self, bucket_name: str, object_key: str) -> Digest:
         path = os.path.join(bucket_name, object_key)
@@ -104,46 +145,118 @@ class LocalProvider(BaseProvider):
 
         return storage_path, object_key
 
-    def store_file(self, storage_path: str, filename: str, data: Any = None) -> Tuple[Digest, int]:
-        """This function writes data corresponding to the filepaths in the DB."""
+    def codec_for(self, filename: str) -> Optional[str]:
+        """Compression codec configured for an asset file.
+
+        Returns:
+            The codec name, or `None` if the file should be stored
+            uncompressed.
+        """
+        ext = filename.rsplit(".", maxsplit=1)[-1]
+        codec = get_config("dispatcher.asset_compression").get(ext, "none")
+        if codec in ("none", "", None):
+            return None
+        if not compression.is_available(codec):
+            app_log.warning(f"Compression codec {codec} is unavailable; storing {filename} raw")
+            return None
+        return codec
+
+    def store_file(
+        self, storage_path: str, filename: str, data: Any = None, codec: Optional[str] = None
+    ) -> Tuple[Digest, int]:
+        """This function writes data corresponding to the filepaths in the DB.
+
+        If `codec` is set, the file is compressed while it is written. The
+        returned digest and size always describe the uncompressed data.
+        """
 
         if data is None:
             return Digest(algorithm="sha1", hexdigest=""), 0
 
-        if filename.endswith(".pkl"):
-            with open(Path(storage_path) / filename, "wb") as f:
-                cloudpickle.dump(data, f)
+        path = Path(storage_path) / filename
+        if codec and not filename.endswith(".mdb"):
+            digest, size = self._store_compressed(path, data, codec)
+        else:
+            digest, size = self._store_raw(path, data)
 
-        elif filename.endswith(".log") or filename.endswith(".txt"):
-            if data is None:
-                data = ""
+        if size > 0 and self.deduplicate:
+            self.cas.link(path, digest.hexdigest, codec)
 
+        return digest, size
+
+    def _store_raw(self, path: Path, data: Any) -> Tuple[Digest, int]:
+        filename = path.name
+        if filename.endswith(".log") or filename.endswith(".txt"):
             if not isinstance(data, str):
                 raise InvalidFileExtension("Data must be string type.")
+        elif not filename.endswith((".pkl", ".tobj", ".json", ".mdb")):
+            raise InvalidFileExtension("The file extension is not supported.")
 
-            with open(Path(storage_path) / filename, "w+") as f:
+        # Replace files instead of truncating them: previously loaded
+        # objects may still be memory-mapped from the existing file,
+        # and deduplicated files share their data with other assets.
+        tmp_path = _tmp_path(path)
+
+        if filename.endswith(".pkl"):
+            with open(tmp_path, "wb") as f:
+                cloudpickle.dump(data, f)
+
+        elif filename.endswith(".log") or filename.endswith(".txt"):
+            with open(tmp_path, "w+") as f:
                 f.write(data)
 
         elif filename.endswith(".tobj"):
-            with open(Path(storage_path) / filename, "wb") as f:
-                f.write(data.serialize())
+            write_asset_file(data, AssetType.TRANSPORTABLE, tmp_path)
 
         elif filename.endswith(".json"):
-            with open(Path(storage_path) / filename, "w") as f:
+            with open(tmp_path, "w") as f:
                 json.dump(data, f)
 
-        elif filename.endswith(".mdb"):
-            with open(Path(storage_path) / filename, "wb") as f:
-                f.write(data)
         else:
-            raise InvalidFileExtension("The file extension is not supported.")
+            with open(tmp_path, "wb") as f:
+                f.write(data)
 
-        digest = self.digest(bucket_name=storage_path, object_key=filename)
-        size = self.size(bucket_name=storage_path, object_key=filename)
+        os.replace(tmp_path, path)
+
+        digest = self.digest(bucket_name=str(path.parent), object_key=filename)
+        size = self.size(bucket_name=str(path.parent), object_key=filename)
         return digest, size
 
+    def _store_compressed(self, path: Path, data: Any, codec: str) -> Tuple[Digest, int]:
+        filename = path.name
+        if filename.endswith(".log") or filename.endswith(".txt"):
+            if not isinstance(data, str):
+                raise InvalidFileExtension("Data must be string type.")
+        elif not filename.endswith((".pkl", ".tobj", ".json")):
+            raise InvalidFileExtension("The file extension is not supported.")
+
+        tmp_path = _tmp_path(path)
+        with compression.open_file(tmp_path, "wb", codec) as f:
+            writer = _DigestWriter(f)
+            if filename.endswith(".pkl"):
+                cloudpickle.dump(data, writer)
+            elif filename.endswith(".tobj"):
+                for segment in serialize_asset_segments(data, AssetType.TRANSPORTABLE):
+                    writer.write(segment)
+            elif filename.endswith(".json"):
+                writer.write(json.dumps(data).encode("utf-8"))
+            else:
+                writer.write(data.encode("utf-8"))
+        os.replace(tmp_path, path)
+
+        return writer.digest, writer.size
+
     def load_file(self, storage_path: str, filename: str) -> Any:
-        """This function loads data for the filenames in the DB."""
+        """This function loads data for the filenames in the DB.
+
+        Compressed files are detected from their contents and
+        decompressed while they are read.
+        """
+
+        path = Path(storage_path) / filename
+        codec = compression.detect_codec(path) if not filename.endswith(".mdb") else None
+        if codec:
+            return self._load_compressed(path, codec)
 
         if filename.endswith(".pkl"):
             with open(Path(storage_path) / filename, "rb") as f:
@@ -154,8 +267,8 @@ class LocalProvider(BaseProvider):
                 data = f.read()
 
         elif filename.endswith(".tobj"):
-            with open(Path(storage_path) / filename, "rb") as f:
-                data = TransportableObject.deserialize(f.read())
+            # Out-of-band buffers are mapped from the file
+            data = read_asset_file(Path(storage_path) / filename, AssetType.TRANSPORTABLE)
 
         elif filename.endswith(".json"):
             with open(Path(storage_path) / filename, "r") as f:
@@ -167,5 +280,114 @@ class LocalProvider(BaseProvider):
 
         return data
 
+    def _load_compressed(self, path: Path, codec: str) -> Any:
+        filename = path.name
+        with compression.open_file(path, "rb", codec) as f:
+            if filename.endswith(".pkl"):
+                return cloudpickle.load(f)
+            elif filename.endswith(".tobj"):
+                # Decompressed data cannot be memory-mapped
+                return deserialize_asset(f.read(), AssetType.TRANSPORTABLE)
+            elif filename.endswith(".json"):
+                return json.load(io.TextIOWrapper(f, encoding="utf-8"))
+            else:
+                return io.TextIOWrapper(f, encoding="utf-8").read()
+
+    def link_file(
+        self, src_storage_path: str, src_filename: str, dest_storage_path: str, dest_filename: str
+    ) -> None:
+        """Hard link an asset file to another, copying it if linking fails."""
+        link_or_copy(
+            Path(src_storage_path) / src_filename, Path(dest_storage_path) / dest_filename
+        )
+
+    def deduplicate_file(self, storage_path: str, filename: str) -> None:
+        """Link a file written outside of `store_file` into the content-addressed store."""
+        if not self.deduplicate or self.size(storage_path, filename) == 0:
+            return
+        digest = self.digest(storage_path, filename)
+        self.cas.link(Path(storage_path) / filename, digest.hexdigest)
+
+    def link_blob(
+        self, storage_path: str, filename: str, digest_alg: Optional[str], digest: Optional[str]
+    ) -> bool:
+        """Link an asset file to an existing uncompressed blob with the given digest.
+
+        Returns:
+            Whether a blob with the digest was found and linked.
+        """
+        # The SDK labels its sha1 digests "sha"
+        if not digest or digest_alg not in (ALGORITHM, "sha") or not self.deduplicate:
+            return False
+        blob = self.cas.blob_path(digest)
+        if not blob.exists():
+            return False
+        path = Path(storage_path) / filename
+        try:
+            link_or_copy(blob, path)
+        except OSError as e:
+            app_log.warning(f"Unable to reuse blob {digest}: {e}")
+            return False
+
+        linked_paths = getattr(self._linked, "paths", None)
+        if linked_paths is not None:
+            linked_paths.append(path)
+        return True
+
+    @contextmanager
+    def unlink_blobs_on_error(self) -> Generator[None, None, None]:
+        """Remove the asset files linked by `link_blob` in this thread if the block fails.
+
+        Asset records are imported in a transaction; if it is rolled
+        back, no record refers to the linked files, which would
+        otherwise keep their blobs from being collected.
+        """
+        outer_paths = getattr(self._linked, "paths", None)
+        linked_paths = self._linked.paths = []
+        try:
+            yield
+        except BaseException:
+            for path in linked_paths:
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    pass
+            raise
+        finally:
+            self._linked.paths = outer_paths
+            if outer_paths is not None:
+                outer_paths.extend(linked_paths)
+
+    def detach_file(self, storage_path: str, filename: str) -> None:
+        """Remove an asset file linked to other assets so it can be rewritten in place."""
+        path = Path(storage_path) / filename
+        try:
+            if os.stat(path).st_nlink > 1:
+                os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+    def release(self, hexdigest: str, codec: Optional[str] = None) -> None:
+        """Remove the blob for a digest if no asset file links to it anymore."""
+        if hexdigest and self.cas.release(hexdigest, codec):
+            app_log.debug(f"Removed unreferenced blob {hexdigest}")
+
+    @contextmanager
+    def uncompressed_copy(self, storage_path: str, filename: str):
+        """Decompress a stored file to a temporary path.
+
+        Yields:
+            The path of the uncompressed copy, which is removed on exit.
+        """
+        path = Path(storage_path) / filename
+        tmp_path = _tmp_path(path)
+        try:
+            with compression.open_for_reading(path) as src, open(tmp_path, "wb") as dest:
+                shutil.copyfileobj(src, dest, BLOCK_SIZE)
+            yield str(tmp_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+
 
 local_store = LocalProvider()
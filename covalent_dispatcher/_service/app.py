@@ -24,12 +24,12 @@ from typing import List, Optional, Union
 from uuid import UUID
 
 from fastapi import APIRouter, FastAPI, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 
 import covalent_dispatcher.entry_point as dispatcher
 from covalent._shared_files import logger
 from covalent._shared_files.schemas.result import ResultSchema
-from covalent._shared_files.util_classes import RESULT_STATUS
+from covalent._shared_files.util_classes import RESULT_STATUS, TERMINAL_STATUSES
 from covalent_dispatcher._core import dispatcher as core_dispatcher
 from covalent_dispatcher._core import runner_ng as core_runner
 
@@ -37,6 +37,7 @@ from .._dal.exporters.result import export_result_manifest
 from .._dal.result import Result, get_result_object
 from .._db.datastore import workflow_db
 from .._db.dispatchdb import DispatchDB
+from .._object_store.local import local_store
 from .heartbeat import Heartbeat
 from .models import DispatchStatusSetSchema, ExportResponseSchema, TargetDispatchStatus
 
@@ -45,6 +46,9 @@ log_stack_info = logger.log_stack_info
 
 router: APIRouter = APIRouter()
 
+# Seconds after which an idle event stream is closed; clients reconnect
+EVENT_STREAM_TIMEOUT = 30
+
 _background_tasks = set()
 
 
@@ -57,6 +61,11 @@ async def lifespan(app: FastAPI):
     _background_tasks.add(fut)
     fut.add_done_callback(_background_tasks.discard)
 
+    # Reclaim the storage of assets removed while the server was down
+    fut = asyncio.get_running_loop().run_in_executor(None, collect_asset_garbage)
+    _background_tasks.add(fut)
+    fut.add_done_callback(_background_tasks.discard)
+
     # Runner event queue and listener
     core_runner._job_events = asyncio.Queue()
     core_runner._job_event_listener = asyncio.create_task(core_runner._listen_for_job_events())
@@ -82,6 +91,19 @@ async def lifespan(app: FastAPI):
     Heartbeat.stop()
 
 
+def collect_asset_garbage() -> None:
+    """Remove deduplicated asset blobs which no asset file references anymore."""
+
+    try:
+        removed = local_store.cas.collect_garbage()
+    except OSError as e:
+        app_log.warning(f"Unable to collect unreferenced asset blobs: {e}")
+        return
+
+    if removed:
+        app_log.debug(f"Removed {removed} unreferenced asset blobs")
+
+
 async def cancel_all_with_status(status: RESULT_STATUS):
     """Cancel all dispatches with the specified status."""
 
@@ -329,6 +351,65 @@ def _export_result_sync(
     return response
 
 
+@router.get("/dispatches/{dispatch_id}/events")
+async def stream_events(dispatch_id: str, timeout: Optional[float] = EVENT_STREAM_TIMEOUT):
+    """Stream terminal status transitions of a dispatch as server-sent events
+
+    Each node reaching a terminal status produces a `node` event, and
+    the dispatch reaching a terminal status produces a final
+    `dispatch` event after which the stream closes. If the dispatch
+    is already finished, the `dispatch` event is sent immediately.
+    The stream is also closed after `timeout` seconds without any
+    events, in which case clients are expected to reconnect.
+
+    Args:
+        `dispatch_id`: The dispatch's unique id.
+        `timeout`: Seconds to wait for each event.
+
+    """
+    loop = asyncio.get_running_loop()
+    result_object = await loop.run_in_executor(None, _try_get_result_object, dispatch_id)
+    if not result_object:
+        return JSONResponse(
+            status_code=404,
+            content={"message": f"The requested dispatch ID {dispatch_id} was not found."},
+        )
+
+    return StreamingResponse(
+        _generate_events(dispatch_id, timeout),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+async def _generate_events(dispatch_id: str, timeout: float):
+    # Subscribe before reading the status so that no transition is missed
+    queue = core_dispatcher.subscribe(dispatch_id)
+    try:
+        loop = asyncio.get_running_loop()
+        result_object = await loop.run_in_executor(None, _try_get_result_object, dispatch_id)
+        status = str(result_object.get_value("status", refresh=False))
+        if status in TERMINAL_STATUSES:
+            yield _format_event({"dispatch_id": dispatch_id, "node_id": None, "status": status})
+            return
+
+        while True:
+            try:
+                msg = await asyncio.wait_for(queue.get(), timeout)
+            except asyncio.TimeoutError:
+                return
+            yield _format_event(msg)
+            if msg["node_id"] is None:
+                return
+    finally:
+        core_dispatcher.unsubscribe(dispatch_id, queue)
+
+
+def _format_event(msg: dict) -> str:
+    event = "dispatch" if msg["node_id"] is None else "node"
+    return f"event: {event}\ndata: {json.dumps(msg)}\n\n"
+
+
 def _try_get_result_object(dispatch_id: str) -> Union[Result, None]:
     try:
         res = get_result_object(
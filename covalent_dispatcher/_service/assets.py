@@ -17,14 +17,15 @@
 """Endpoints for uploading and downloading workflow assets"""
 
 import asyncio
-import mmap
+import hashlib
+import json
 import os
 from functools import lru_cache
-from typing import Tuple, Union
+from typing import Dict, Iterator, Tuple, Union
 
 import aiofiles
 import aiofiles.os
-from fastapi import APIRouter, Header, HTTPException, Request
+from fastapi import APIRouter, Header, HTTPException, Request, Response
 from fastapi.responses import StreamingResponse
 from furl import furl
 
@@ -34,10 +35,20 @@ from covalent._serialize.result import ASSET_TYPES as RESULT_ASSET_TYPES
 from covalent._serialize.result import AssetType
 from covalent._shared_files import logger
 from covalent._shared_files.config import get_config
-from covalent._workflow.transportable_object import TOArchiveUtils
+from covalent._workflow.transportable_object import (
+    BUFFER_LAYOUT_KEY,
+    DATA_FORMAT_BUFFERS,
+    DATA_FORMAT_KEY,
+    HEADER_OFFSET,
+    TOArchiveUtils,
+    _inband_pickle_segments,
+)
 
+from .._dal.asset import Asset
 from .._dal.result import get_result_object
 from .._db.datastore import workflow_db
+from .._object_store.compression import open_for_reading, read_exactly
+from .._object_store.local import local_store
 from .models import (
     AssetRepresentation,
     DispatchAssetKey,
@@ -61,6 +72,10 @@ _background_tasks = set()
 
 LRU_CACHE_SIZE = get_config("dispatcher.asset_cache_size")
 
+# Number of bytes of an interrupted upload received so far; uploads
+# sending this header resume from the given offset
+UPLOAD_OFFSET_HEADER = "Upload-Offset"
+
 
 @router.get("/dispatches/{dispatch_id}/electrons/{node_id}/assets/{key}")
 def get_node_asset(
@@ -112,7 +127,8 @@ def get_node_asset(
         elif representation == AssetRepresentation.string:
             start_byte, end_byte = _get_tobj_string_offsets(asset.internal_uri)
         else:
-            start_byte, end_byte = _get_tobj_pickle_offsets(asset.internal_uri)
+            app_log.debug(f"Serving picklebytes of {asset.internal_uri}")
+            return StreamingResponse(_generate_tobj_pickle(asset.internal_uri))
 
         app_log.debug(f"Serving byte range {start_byte}:{end_byte} of {asset.internal_uri}")
         generator = _generate_file_slice(asset.internal_uri, start_byte, end_byte)
@@ -169,7 +185,8 @@ def get_dispatch_asset(
         elif representation == AssetRepresentation.string:
             start_byte, end_byte = _get_tobj_string_offsets(asset.internal_uri)
         else:
-            start_byte, end_byte = _get_tobj_pickle_offsets(asset.internal_uri)
+            app_log.debug(f"Serving picklebytes of {asset.internal_uri}")
+            return StreamingResponse(_generate_tobj_pickle(asset.internal_uri))
 
         app_log.debug(f"Serving byte range {start_byte}:{end_byte} of {asset.internal_uri}")
         generator = _generate_file_slice(asset.internal_uri, start_byte, end_byte)
@@ -225,7 +242,8 @@ def get_lattice_asset(
         elif representation == AssetRepresentation.string:
             start_byte, end_byte = _get_tobj_string_offsets(asset.internal_uri)
         else:
-            start_byte, end_byte = _get_tobj_pickle_offsets(asset.internal_uri)
+            app_log.debug(f"Serving picklebytes of {asset.internal_uri}")
+            return StreamingResponse(_generate_tobj_pickle(asset.internal_uri))
 
         app_log.debug(f"Serving byte range {start_byte}:{end_byte} of {asset.internal_uri}")
         generator = _generate_file_slice(asset.internal_uri, start_byte, end_byte)
@@ -245,6 +263,7 @@ async def upload_node_asset(
     content_length: int = Header(default=0),
     digest_alg: Union[str, None] = Header(default=None),
     digest: Union[str, None] = Header(default=None),
+    upload_offset: int = Header(default=0),
 ):
     """Upload an electron asset.
 
@@ -255,11 +274,13 @@ async def upload_node_asset(
         asset_file: (body) The file to be uploaded
         content_length: (header)
         digest: (header)
+        upload_offset: (header) The offset at which to resume an
+            interrupted upload
     """
     app_log.debug(f"Uploading node asset {dispatch_id}:{node_id}:{key} ({content_length} bytes) ")
 
     try:
-        metadata = {"size": content_length, "digest_alg": digest_alg, "digest": digest}
+        metadata = {"size": upload_offset + content_length}
         internal_uri = await _run_in_executor(
             _update_node_asset_metadata,
             dispatch_id,
@@ -268,7 +289,15 @@ async def upload_node_asset(
             metadata,
         )
         # Stream the request body to object store
-        await _transfer_data(req, internal_uri)
+        checksum = await _transfer_data(req, internal_uri, upload_offset)
+
+        await _run_in_executor(
+            _update_node_asset_metadata,
+            dispatch_id,
+            node_id,
+            key,
+            _stored_digest(digest_alg, digest, checksum),
+        )
 
         return f"Uploaded file to {internal_uri}"
     except Exception as e:
@@ -284,6 +313,7 @@ async def upload_dispatch_asset(
     content_length: int = Header(default=0),
     digest_alg: Union[str, None] = Header(default=None),
     digest: Union[str, None] = Header(default=None),
+    upload_offset: int = Header(default=0),
 ):
     """Upload a dispatch asset.
 
@@ -293,10 +323,12 @@ async def upload_dispatch_asset(
         asset_file: (body) The file to be uploaded
         content_length: (header)
         digest: (header)
+        upload_offset: (header) The offset at which to resume an
+            interrupted upload
     """
     app_log.debug(f"Uploading dispatch asset {dispatch_id}:{key} ({content_length} bytes) ")
     try:
-        metadata = {"size": content_length, "digest_alg": digest_alg, "digest": digest}
+        metadata = {"size": upload_offset + content_length}
         internal_uri = await _run_in_executor(
             _update_dispatch_asset_metadata,
             dispatch_id,
@@ -304,7 +336,14 @@ async def upload_dispatch_asset(
             metadata,
         )
         # Stream the request body to object store
-        await _transfer_data(req, internal_uri)
+        checksum = await _transfer_data(req, internal_uri, upload_offset)
+
+        await _run_in_executor(
+            _update_dispatch_asset_metadata,
+            dispatch_id,
+            key,
+            _stored_digest(digest_alg, digest, checksum),
+        )
         return f"Uploaded file to {internal_uri}"
     except Exception as e:
         app_log.debug(e)
@@ -319,6 +358,7 @@ async def upload_lattice_asset(
     content_length: int = Header(default=0),
     digest_alg: Union[str, None] = Header(default=None),
     digest: Union[str, None] = Header(default=None),
+    upload_offset: int = Header(default=0),
 ):
     """Upload a lattice asset.
 
@@ -328,10 +368,12 @@ async def upload_lattice_asset(
         asset_file: (body) The file to be uploaded
         content_length: (header)
         digest: (header)
+        upload_offset: (header) The offset at which to resume an
+            interrupted upload
     """
     try:
         app_log.debug(f"Uploading lattice asset {dispatch_id}:{key} ({content_length} bytes) ")
-        metadata = {"size": content_length, "digest_alg": digest_alg, "digest": digest}
+        metadata = {"size": upload_offset + content_length}
         internal_uri = await _run_in_executor(
             _update_lattice_asset_metadata,
             dispatch_id,
@@ -339,16 +381,66 @@ async def upload_lattice_asset(
             metadata,
         )
         # Stream the request body to object store
-        await _transfer_data(req, internal_uri)
+        checksum = await _transfer_data(req, internal_uri, upload_offset)
+
+        await _run_in_executor(
+            _update_lattice_asset_metadata,
+            dispatch_id,
+            key,
+            _stored_digest(digest_alg, digest, checksum),
+        )
         return f"Uploaded file to {internal_uri}"
     except Exception as e:
         app_log.debug(e)
         raise
 
 
+@router.head("/dispatches/{dispatch_id}/electrons/{node_id}/assets/{key}")
+async def get_node_asset_upload_state(dispatch_id: str, node_id: int, key: ElectronAssetKey):
+    """Report the stored digest and upload progress of an electron asset.
+
+    Args:
+        dispatch_id: The dispatch's unique id.
+        node_id: The electron id.
+        key: The name of the asset
+    """
+    asset = await _run_in_executor(_get_node_asset, dispatch_id, node_id, key)
+    headers = await _run_in_executor(_get_upload_state, asset)
+    return Response(headers=headers)
+
+
+@router.head("/dispatches/{dispatch_id}/assets/{key}")
+async def get_dispatch_asset_upload_state(dispatch_id: str, key: DispatchAssetKey):
+    """Report the stored digest and upload progress of a dispatch asset.
+
+    Args:
+        dispatch_id: The dispatch's unique id.
+        key: The name of the asset
+    """
+    asset = await _run_in_executor(_get_dispatch_asset, dispatch_id, key)
+    headers = await _run_in_executor(_get_upload_state, asset)
+    return Response(headers=headers)
+
+
+@router.head("/dispatches/{dispatch_id}/lattice/assets/{key}")
+async def get_lattice_asset_upload_state(dispatch_id: str, key: LatticeAssetKey):
+    """Report the stored digest and upload progress of a lattice asset.
+
+    Args:
+        dispatch_id: The dispatch's unique id.
+        key: The name of the asset
+    """
+    asset = await _run_in_executor(_get_lattice_asset, dispatch_id, key)
+    headers = await _run_in_executor(_get_upload_state, asset)
+    return Response(headers=headers)
+
+
 def _generate_file_slice(file_url: str, start_byte: int, end_byte: int, chunk_size: int = 65536):
     """Generator of a byte slice from a file.
 
+    Compressed files are decompressed while streaming, so byte ranges
+    always refer to the uncompressed data.
+
     Args:
         file_url: A file:/// type URL pointing to the file
         start_byte: The beginning of the byte range
@@ -358,18 +450,19 @@ def _generate_file_slice(file_url: str, start_byte: int, end_byte: int, chunk_si
     Returns:
         Yields chunks of size <= chunk_size
     """
-    byte_pos = start_byte
     file_path = str(furl(file_url).path)
-    with open(file_path, "rb") as f:
+    with open_for_reading(file_path) as f:
+        # Seeking a decompression stream skips forward by decompressing
         f.seek(start_byte)
-        if end_byte < 0:
-            for chunk in f:
-                yield chunk
-        else:
-            while byte_pos + chunk_size < end_byte:
-                byte_pos += chunk_size
-                yield f.read(chunk_size)
-            yield f.read(end_byte - byte_pos)
+        remaining = end_byte - start_byte if end_byte >= 0 else None
+        while remaining is None or remaining > 0:
+            size = chunk_size if remaining is None else min(chunk_size, remaining)
+            chunk = f.read(size)
+            if not chunk:
+                break
+            if remaining is not None:
+                remaining -= len(chunk)
+            yield chunk
 
 
 def _extract_byte_range(byte_range_header: str) -> Tuple[int, int]:
@@ -389,6 +482,24 @@ def _extract_byte_range(byte_range_header: str) -> Tuple[int, int]:
 # Helpers for TransportableObject
 
 
+def _read_tobj_offsets(file_url: str) -> bytes:
+    """Read the fixed-size offsets preceding a stored TObj's header."""
+
+    file_path = str(furl(file_url).path)
+    with open_for_reading(file_path) as f:
+        return read_exactly(f, HEADER_OFFSET)
+
+
+def _read_tobj_header(file_url: str) -> dict:
+    """Read the header of a stored TObj."""
+
+    file_path = str(furl(file_url).path)
+    with open_for_reading(file_path) as f:
+        offsets = read_exactly(f, HEADER_OFFSET)
+        string_offset = TOArchiveUtils.string_offset(offsets)
+        return json.loads(read_exactly(f, string_offset - HEADER_OFFSET))
+
+
 def _get_tobj_string_offsets(file_url: str) -> Tuple[int, int]:
     """Get the byte range for the str rep of a stored TObj.
 
@@ -401,12 +512,8 @@ def _get_tobj_string_offsets(file_url: str) -> Tuple[int, int]:
         (start_byte, end_byte)
     """
 
-    file_path = str(furl(file_url).path)
-    filelen = os.path.getsize(file_path)
-    with open(file_path, "rb+") as f:
-        with mmap.mmap(f.fileno(), filelen) as mm:
-            # TOArchiveUtils operates on byte arrays
-            return TOArchiveUtils.string_byte_range(mm)
+    # TOArchiveUtils operates on byte arrays
+    return TOArchiveUtils.string_byte_range(_read_tobj_offsets(file_url))
 
 
 def _get_tobj_pickle_offsets(file_url: str) -> Tuple[int, int]:
@@ -421,12 +528,40 @@ def _get_tobj_pickle_offsets(file_url: str) -> Tuple[int, int]:
         (start_byte, -1)
     """
 
-    file_path = str(furl(file_url).path)
-    filelen = os.path.getsize(file_path)
-    with open(file_path, "rb+") as f:
-        with mmap.mmap(f.fileno(), filelen) as mm:
-            # TOArchiveUtils operates on byte arrays
-            return TOArchiveUtils.data_byte_range(mm)
+    # TOArchiveUtils operates on byte arrays
+    return TOArchiveUtils.data_byte_range(_read_tobj_offsets(file_url))
+
+
+def _generate_tobj_pickle(file_url: str) -> Iterator[bytes]:
+    """Generator of the picklebytes of a stored TObj.
+
+    Out-of-band buffers are written in band, so that the picklebytes
+    can be loaded on their own. The object is never unpickled.
+
+    Args:
+        file_url: A file:/// URL pointing to the TransportableObject
+
+    Returns:
+        Yields chunks of the picklebytes
+    """
+
+    start_byte, end_byte = _get_tobj_pickle_offsets(file_url)
+    header = _read_tobj_header(file_url)
+    if header.get(DATA_FORMAT_KEY) != DATA_FORMAT_BUFFERS:
+        yield from _generate_file_slice(file_url, start_byte, end_byte)
+        return
+
+    def _segment_slice(offset: int, size: int) -> Iterator[bytes]:
+        return _generate_file_slice(file_url, start_byte + offset, start_byte + offset + size)
+
+    (pickle_offset, pickle_size), *buffer_layout = header[BUFFER_LAYOUT_KEY]
+    picklebytes = b"".join(_segment_slice(pickle_offset, pickle_size))
+    buffer_sizes = [size for _, size in buffer_layout]
+    for segment in _inband_pickle_segments(picklebytes, buffer_sizes):
+        if isinstance(segment, int):
+            yield from _segment_slice(*buffer_layout[segment])
+        else:
+            yield segment
 
 
 # This must only be used for static data as we don't have yet any
@@ -473,6 +608,8 @@ def _update_node_asset_metadata(dispatch_id, node_id, key, metadata) -> str:
 
         # Update asset metadata
         update = _filter_null_metadata(metadata)
+        # Uploaded files are stored as received
+        update["codec"] = None
         node.update_assets(updates={key: update}, session=session)
         app_log.debug(f"Updated node asset {dispatch_id}:{node_id}:{key}")
 
@@ -488,6 +625,8 @@ def _update_lattice_asset_metadata(dispatch_id, key, metadata) -> str:
 
         # Update asset metadata
         update = _filter_null_metadata(metadata)
+        # Uploaded files are stored as received
+        update["codec"] = None
         result_object.lattice.update_assets(updates={key: update}, session=session)
         app_log.debug(f"Updated size for lattice asset {dispatch_id}:{key}")
 
@@ -503,26 +642,113 @@ def _update_dispatch_asset_metadata(dispatch_id, key, metadata) -> str:
 
         # Update asset metadata
         update = _filter_null_metadata(metadata)
+        # Uploaded files are stored as received
+        update["codec"] = None
         result_object.update_assets(updates={key: update}, session=session)
         app_log.debug(f"Updated size for dispatch asset {dispatch_id}:{key}")
         return asset.internal_uri
 
 
-async def _transfer_data(req: Request, destination_url: str):
+def _get_node_asset(dispatch_id, node_id, key) -> Asset:
+    result_object = get_cached_result_object(dispatch_id)
+    node = result_object.lattice.transport_graph.get_node(node_id)
+    with workflow_db.session() as session:
+        return node.get_asset(key=key.value, session=session)
+
+
+def _get_lattice_asset(dispatch_id, key) -> Asset:
+    result_object = get_cached_result_object(dispatch_id)
+    with workflow_db.session() as session:
+        return result_object.lattice.get_asset(key=key.value, session=session)
+
+
+def _get_dispatch_asset(dispatch_id, key) -> Asset:
+    result_object = get_cached_result_object(dispatch_id)
+    with workflow_db.session() as session:
+        return result_object.get_asset(key=key.value, session=session)
+
+
+def _stored_digest(digest_alg: Union[str, None], digest: Union[str, None], checksum: str) -> dict:
+    """Digest metadata of an uploaded asset file.
+
+    The digest is only recorded once the file is stored, so that the
+    recorded digest always describes the stored file. Executors upload
+    task outputs without a digest; these are described by the sha1
+    checksum computed while receiving them.
+    """
+    if digest is None:
+        return {"digest_alg": "sha1", "digest": checksum}
+    return {"digest_alg": digest_alg, "digest": digest}
+
+
+def _partial_upload_path(dest_path: str) -> str:
+    return f"{dest_path}.tmp"
+
+
+def _get_upload_state(asset: Asset) -> Dict[str, str]:
+    """Headers describing the stored data and any interrupted upload of an asset file."""
+    dest_path = str(furl(asset.internal_uri).path)
+    try:
+        partial_size = os.path.getsize(_partial_upload_path(dest_path))
+    except OSError:
+        partial_size = 0
+    headers = {UPLOAD_OFFSET_HEADER: str(partial_size)}
+
+    # Use the recorded digest; hashing the stored file would read all of it
+    if asset.digest and local_store.size(os.path.dirname(dest_path), os.path.basename(dest_path)):
+        headers["Digest-Alg"] = asset.digest_alg
+        headers["Digest"] = asset.digest
+    return headers
+
+
+def _resume_partial_upload(tmp_path: str, offset: int, checksum) -> None:
+    """Discard any data past `offset` and hash the data received so far."""
+    if not os.path.exists(tmp_path) or os.path.getsize(tmp_path) < offset:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Fewer than {offset} bytes of the upload were received",
+        )
+    with open(tmp_path, "r+b") as f:
+        f.truncate(offset)
+        chunk = f.read(65536)
+        while chunk:
+            checksum.update(chunk)
+            chunk = f.read(65536)
+
+
+async def _transfer_data(req: Request, destination_url: str, offset: int = 0) -> str:
+    """Stream a request body to a file and return its sha1 checksum.
+
+    If `offset` is positive, the body is appended to the first
+    `offset` bytes of a previously interrupted upload.
+    """
     dest_url = furl(destination_url)
     dest_path = str(dest_url.path)
 
     # Stream data to a temporary file, then replace the destination
-    # file atomically
-    tmp_path = f"{dest_path}.tmp"
-    app_log.debug(f"Streaming file upload to {tmp_path}")
-
-    async with aiofiles.open(tmp_path, "wb") as f:
+    # file atomically. The temporary file is kept if the upload is
+    # interrupted so that it can be resumed.
+    tmp_path = _partial_upload_path(dest_path)
+    app_log.debug(f"Streaming file upload to {tmp_path} from offset {offset}")
+
+    checksum = hashlib.sha1()
+    mode = "wb"
+    if offset > 0:
+        await _run_in_executor(_resume_partial_upload, tmp_path, offset, checksum)
+        mode = "ab"
+
+    async with aiofiles.open(tmp_path, mode) as f:
         async for chunk in req.stream():
+            checksum.update(chunk)
             await f.write(chunk)
 
     await aiofiles.os.replace(tmp_path, dest_path)
 
+    if local_store.deduplicate and os.path.getsize(dest_path) > 0:
+        await _run_in_executor(local_store.cas.link, dest_path, checksum.hexdigest())
+
+    return checksum.hexdigest()
+
 
 def _run_in_executor(function, *args) -> asyncio.Future:
     loop = asyncio.get_running_loop()
@@ -19,6 +19,7 @@ import pickle
 import uuid
 from datetime import timedelta
 from pathlib import Path
+from typing import Optional
 
 from fastapi import HTTPException
 from fastapi.responses import JSONResponse
@@ -194,11 +195,7 @@ class Electrons:
                 "circuit": {
                     "total_qbits": None,
                     "depth": None,
-                    "circuit_diagram": (
-                        selected_job["circuit_diagram"]
-                        if "circuit_diagram" in selected_job
-                        else None
-                    ),
+                    "circuit_diagram": self._get_circuit_diagram(selected_job),
                 },
                 "executor": {
                     "name": (
@@ -330,6 +327,20 @@ class Electrons:
         )
         return validate_data(inputs)
 
+    def _get_circuit_diagram(self, circuit_info: dict) -> Optional[str]:
+        """Return the diagram of a QElectron circuit, drawing it if needed."""
+
+        try:
+            from covalent.quantum.qserver.utils import get_circuit_diagram
+
+            return get_circuit_diagram(circuit_info)
+        except ImportError:
+            app_log.debug("QElectron not installed.")
+        except Exception as exc:
+            # e.g. the tape was pickled with an incompatible PennyLane version
+            app_log.debug(f"Unable to draw circuit diagram \n {exc}")
+        return circuit_info.get("circuit_diagram")
+
     def _get_qelectron_db_dict(self, dispatch_id: str, node_id: int) -> dict:
         """Return the QElectron DB for a given node."""
 
@@ -49,6 +49,8 @@ class Electron(Base):
         is_active: Status of the record, 1: active and 0: inactive
         job_id: ID for circuit_info
         qelectron_data_exists: Flag that indicates if qelectron data exists in the electron
+        cache: Flag that indicates if the outputs of the electron can be reused across dispatches
+        cache_key: Digest identifying the function, hooks, and inputs of a cached electron
         created_at: created timestamp
         updated_at: updated timestamp
         started_at: started timestamp
@@ -121,6 +123,12 @@ class Electron(Base):
     # Flag that indicates if qelectron data exists in the electron
     qelectron_data_exists = Column(Boolean, nullable=False, default=False)
 
+    # Flag that indicates if the outputs of the electron can be reused across dispatches
+    cache = Column(Boolean, nullable=False, default=False)
+
+    # Digest identifying the function, hooks, and inputs of a cached electron
+    cache_key = Column(Text)
+
     # Timestamps
     created_at = Column(DateTime, nullable=False, server_default=func.now())
     updated_at = Column(DateTime, nullable=False, onupdate=func.now(), server_default=func.now())
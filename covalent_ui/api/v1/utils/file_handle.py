@@ -17,12 +17,14 @@
 """File handlers"""
 
 import base64
+import io
 import json
 
 import cloudpickle as pickle
 
 from covalent._workflow.transport import TransportableObject, _TransportGraph
 from covalent_dispatcher._dal.asset import local_store
+from covalent_dispatcher._object_store.compression import open_for_reading
 
 
 def transportable_object(obj):
@@ -33,7 +35,7 @@ def transportable_object(obj):
         Decoded transportable object
     """
     if obj:
-        load_pickle = base64.b64decode(obj._object.encode("utf-8"))
+        load_pickle = base64.b64decode(obj.get_serialized().encode("utf-8"))
         return f"\npickle.loads({load_pickle})"
     return None
 
@@ -115,7 +117,8 @@ class FileHandler:
     def read_from_text(self, path):
         """Return data from text file"""
         try:
-            with open(self.location + "/" + path, "r", encoding="utf-8") as read_file:
+            with open_for_reading(self.location + "/" + path) as f:
+                read_file = io.TextIOWrapper(f, encoding="utf-8")
                 text_object = read_file.read()
                 read_file.close()
                 return text_object if text_object is not None else ""
@@ -124,7 +127,7 @@ class FileHandler:
 
     def __unpickle_file(self, path):
         try:
-            with open(self.location + "/" + path, "rb") as read_file:
+            with open_for_reading(self.location + "/" + path) as read_file:
                 unpickled_object = pickle.load(read_file)
                 read_file.close()
                 return unpickled_object
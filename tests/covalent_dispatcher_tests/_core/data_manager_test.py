@@ -19,7 +19,7 @@ Tests for the core functionality of the dispatcher.
 """
 
 
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, call
 
 import pytest
 
@@ -39,6 +39,7 @@ from covalent_dispatcher._core.data_manager import (
     make_dispatch,
     persist_result,
     update_node_result,
+    update_node_results,
 )
 from covalent_dispatcher._db.datastore import DataStore
 
@@ -247,6 +248,84 @@ async def test_update_node_result_handles_db_exceptions(mocker):
     mock_notify.assert_awaited_with(result_object.dispatch_id, 0, Result.FAILED, {})
 
 
+@pytest.mark.asyncio
+async def test_update_node_results(mocker):
+    """Check that update_node_results persists updates in bulk and notifies valid ones"""
+
+    dispatch_id = "test_update_node_results"
+    node_results = [
+        {"node_id": 0, "status": Result.COMPLETED},
+        {"node_id": 1, "status": Result.COMPLETED},
+        {"node_id": 2, "status": Result.COMPLETED},
+    ]
+    node_infos = [
+        {"type": "function", "sub_dispatch_id": None},
+        {"type": "function", "sub_dispatch_id": None},
+        {"type": "sublattice", "sub_dispatch_id": None},
+    ]
+    mocker.patch(
+        "covalent_dispatcher._core.data_manager.electron.get_bulk", return_value=node_infos
+    )
+    mock_update_bulk = mocker.patch(
+        "covalent_dispatcher._core.data_manager.electron.update_bulk",
+        return_value=[True, False, True],
+    )
+    mock_make_dispatch = mocker.patch(
+        "covalent_dispatcher._core.data_manager._make_sublattice_dispatch",
+        return_value="sub_dispatch",
+    )
+    mock_notify = mocker.patch(
+        "covalent_dispatcher._core.dispatcher.notify_node_status",
+    )
+
+    await update_node_results(dispatch_id, node_results)
+
+    mock_update_bulk.assert_awaited_once_with(dispatch_id, node_results)
+    mock_make_dispatch.assert_awaited_once()
+    assert mock_notify.await_args_list == [
+        call(dispatch_id, 0, Result.COMPLETED, {}),
+        call(dispatch_id, 2, RESULT_STATUS.DISPATCHING, {"sub_dispatch_id": "sub_dispatch"}),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_update_node_results_handles_db_exceptions(mocker):
+    """Check that update_node_results marks nodes failed if their updates could not be persisted"""
+
+    dispatch_id = "test_update_node_results_handles_db_exceptions"
+    node_results = [{"node_id": 0, "status": Result.COMPLETED}]
+    mocker.patch(
+        "covalent_dispatcher._core.data_manager.electron.get_bulk",
+        return_value=[{"type": "function", "sub_dispatch_id": None}],
+    )
+    mocker.patch(
+        "covalent_dispatcher._core.data_manager.electron.update_bulk",
+        return_value=[RuntimeError()],
+    )
+    mock_notify = mocker.patch(
+        "covalent_dispatcher._core.dispatcher.notify_node_status",
+    )
+
+    await update_node_results(dispatch_id, node_results)
+
+    mock_notify.assert_awaited_once_with(dispatch_id, 0, Result.FAILED, {})
+
+
+@pytest.mark.asyncio
+async def test_update_node_results_falls_back_on_query_errors(mocker):
+    """Check that update_node_results reverts to single updates if the bulk query fails"""
+
+    node_results = [{"node_id": 0, "status": Result.COMPLETED}]
+    mocker.patch(
+        "covalent_dispatcher._core.data_manager.electron.get_bulk", side_effect=KeyError()
+    )
+    mock_update = mocker.patch("covalent_dispatcher._core.data_manager.update_node_result")
+
+    await update_node_results("dispatch", node_results)
+
+    mock_update.assert_awaited_once_with("dispatch", node_results[0])
+
+
 @pytest.mark.asyncio
 async def test_make_dispatch(mocker):
     res = MagicMock()
@@ -0,0 +1,117 @@
+# Copyright 2023 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Tests for the electron querying and update functions
+"""
+
+import asyncio
+
+import pytest
+
+from covalent_dispatcher._core.data_modules import electron
+
+
+@pytest.mark.asyncio
+async def test_coalesced_node_updates(mocker):
+    """Check that concurrent updates for a dispatch are persisted in one transaction"""
+
+    dispatch_id = "test_coalesced_node_updates"
+    mock_update_bulk = mocker.patch(
+        "covalent_dispatcher._core.data_modules.electron.update_bulk_sync",
+        return_value=[True, False, True],
+    )
+    coalescer = electron._NodeUpdateCoalescer(0.01)
+
+    first = [{"node_id": 0, "status": "COMPLETED"}, {"node_id": 1, "status": "COMPLETED"}]
+    second = [{"node_id": 2, "status": "COMPLETED"}]
+
+    outcomes = await asyncio.gather(
+        coalescer.submit(dispatch_id, first),
+        coalescer.submit(dispatch_id, second),
+    )
+
+    mock_update_bulk.assert_called_once_with(dispatch_id, first + second)
+    assert outcomes == [[True, False], [True]]
+
+
+@pytest.mark.asyncio
+async def test_coalesced_node_updates_isolate_failures(mocker):
+    """Check that a failed batch is retried one update at a time"""
+
+    dispatch_id = "test_coalesced_node_updates_isolate_failures"
+    error = RuntimeError("bad update")
+
+    def update_bulk_sync(dispatch_id, node_results):
+        if len(node_results) > 1 or node_results[0]["node_id"] == 1:
+            raise error
+        return [True]
+
+    mocker.patch(
+        "covalent_dispatcher._core.data_modules.electron.update_bulk_sync",
+        side_effect=update_bulk_sync,
+    )
+    coalescer = electron._NodeUpdateCoalescer(0)
+
+    node_results = [{"node_id": 0}, {"node_id": 1}, {"node_id": 2}]
+    outcomes = await coalescer.submit(dispatch_id, node_results)
+
+    assert outcomes == [True, error, True]
+
+
+@pytest.mark.asyncio
+async def test_coalesced_node_updates_preserve_batch_order(mocker):
+    """Check that batches for a dispatch are persisted in order with a concurrent DB pool"""
+
+    dispatch_id = "test_coalesced_node_updates_preserve_batch_order"
+    persisted = []
+
+    async def run_in_executor(func, dispatch_id, node_results):
+        # Simulate a slower first transaction on a multi-worker pool
+        await asyncio.sleep(0.05 if node_results[0]["node_id"] == 0 else 0)
+        persisted.extend(node_results)
+        return [True] * len(node_results)
+
+    mocker.patch(
+        "covalent_dispatcher._core.data_modules.electron.run_in_executor",
+        side_effect=run_in_executor,
+    )
+    coalescer = electron._NodeUpdateCoalescer(0)
+
+    first = asyncio.create_task(coalescer.submit(dispatch_id, [{"node_id": 0}]))
+    await asyncio.sleep(0.01)
+    second = asyncio.create_task(coalescer.submit(dispatch_id, [{"node_id": 1}]))
+
+    assert await asyncio.gather(first, second) == [[True], [True]]
+    assert persisted == [{"node_id": 0}, {"node_id": 1}]
+
+
+@pytest.mark.asyncio
+async def test_coalesced_node_updates_keep_flush_task(mocker):
+    """Check that pending flushes are referenced until they are done"""
+
+    mocker.patch(
+        "covalent_dispatcher._core.data_modules.electron.update_bulk_sync", return_value=[True]
+    )
+    coalescer = electron._NodeUpdateCoalescer(0.01)
+
+    submitted = asyncio.create_task(coalescer.submit("dispatch", [{"node_id": 0}]))
+    await asyncio.sleep(0)
+    assert len(electron._background_tasks) == 1
+
+    assert await submitted == [True]
+    await asyncio.sleep(0)
+    assert len(electron._background_tasks) == 0
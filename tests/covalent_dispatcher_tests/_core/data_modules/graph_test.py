@@ -92,3 +92,64 @@ async def test_get_nodes(mocker):
     )
 
     assert [1, 2, 3] == await graph.get_nodes(dispatch_id)
+
+
+def _make_test_graph():
+    import networkx as nx
+
+    g = nx.MultiDiGraph()
+    g.add_node(0, task_group_id=0, name="task_0", type="function", status="NEW_OBJECT")
+    g.add_node(1, task_group_id=1, name="task_1", type="function", status="NEW_OBJECT")
+    g.add_node(2, task_group_id=1, name="task_2", type="function", status="NEW_OBJECT")
+    g.add_edge(0, 1, edge_name="x", param_type="arg", arg_index=0)
+    g.add_edge(0, 1, edge_name="y", param_type="kwarg", arg_index=None)
+    g.add_edge(1, 2, edge_name="z", param_type="arg", arg_index=0)
+    return g
+
+
+@pytest.mark.asyncio
+async def test_cache_topology(mocker):
+    import networkx as nx
+
+    dispatch_id = "test_cache_topology"
+    node_link = nx.readwrite.node_link_data(_make_test_graph())
+
+    mock_get_nodes_links = mocker.patch(
+        "covalent_dispatcher._core.data_modules.graph.get_nodes_links_sync",
+        return_value=node_link,
+    )
+    mock_get_result_object = mocker.patch(
+        "covalent_dispatcher._core.data_modules.graph.get_result_object",
+    )
+
+    topology = await graph.cache_topology(dispatch_id)
+    assert graph.get_cached_topology(dispatch_id) is topology
+    assert await graph.cache_topology(dispatch_id) is topology
+    mock_get_nodes_links.assert_called_once_with(dispatch_id)
+
+    assert topology.task_group_ids == {0: 0, 1: 1, 2: 1}
+    assert topology.names[2] == "task_2"
+
+    edges = await graph.get_incoming_edges(dispatch_id, 1)
+    assert sorted(e["attrs"]["edge_name"] for e in edges) == ["x", "y"]
+    assert all(e["source"] == 0 and e["target"] == 1 for e in edges)
+
+    # Returned edges must not alias the cached snapshot
+    edges[0]["attrs"]["edge_name"] = "modified"
+    edges = await graph.get_incoming_edges(dispatch_id, 1)
+    assert sorted(e["attrs"]["edge_name"] for e in edges) == ["x", "y"]
+
+    successors = await graph.get_node_successors(dispatch_id, 0)
+    assert successors == [{"node_id": 1, "task_group_id": 1}, {"node_id": 1, "task_group_id": 1}]
+
+    assert await graph.get_nodes(dispatch_id) == [0, 1, 2]
+    assert len((await graph.get_nodes_links(dispatch_id))["nodes"]) == 3
+    mock_get_result_object.assert_not_called()
+
+    # Non-static attributes are still read from the DB
+    await graph.get_node_successors(dispatch_id, 0, ["status"])
+    mock_get_result_object.assert_called_once()
+
+    graph.evict_topology(dispatch_id)
+    assert graph.get_cached_topology(dispatch_id) is None
+    graph.evict_topology(dispatch_id)
@@ -111,3 +111,48 @@ async def test_set_job_status(mocker):
     )
     await set_job_status("dispatch", 0, status="COMPLETED")
     mock_update.assert_called_with([{"job_id": 1, "status": "COMPLEtED"}])
+
+
+@pytest.mark.asyncio
+async def test_get_jobs_metadata_async_engine(mocker):
+    """
+    Test retrieving jobs metadata using the asyncio DB engine
+    """
+    mock_db = mocker.patch("covalent_dispatcher._core.data_modules.job_manager.workflow_db")
+    mock_db.supports_async_reads = True
+    mock_to_job_ids = mocker.patch(
+        "covalent_dispatcher._core.data_modules.job_manager.to_job_ids_async", return_value=[1, 2]
+    )
+    mock_get = mocker.patch(
+        "covalent_dispatcher._core.data_modules.job_manager.get_job_records_async",
+        return_value=[{"job_id": 1}, {"job_id": 2}],
+    )
+
+    assert await get_jobs_metadata("dispatch", [0, 1]) == [{"job_id": 1}, {"job_id": 2}]
+
+    mock_to_job_ids.assert_awaited_with("dispatch", [0, 1])
+    mock_get.assert_awaited_with([1, 2])
+
+
+@pytest.mark.asyncio
+async def test_set_cancel_requested_single_writer(mocker):
+    """
+    Test that job records aren't written with the asyncio engine if the DB has a single writer
+    """
+    mock_db = mocker.patch("covalent_dispatcher._core.data_modules.job_manager.workflow_db")
+    mock_db.supports_async_reads = True
+    mock_db.supports_async_writes = False
+    mocker.patch(
+        "covalent_dispatcher._core.data_modules.job_manager.to_job_ids", return_value=[0, 1]
+    )
+    mock_update = mocker.patch(
+        "covalent_dispatcher._core.data_modules.job_manager.update_job_records"
+    )
+    mock_update_async = mocker.patch(
+        "covalent_dispatcher._core.data_modules.job_manager.update_job_records_async"
+    )
+
+    await set_cancel_requested("dispatch", [0, 1])
+
+    mock_update.assert_called_once()
+    mock_update_async.assert_not_called()
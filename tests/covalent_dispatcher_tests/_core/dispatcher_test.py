@@ -35,11 +35,14 @@ from covalent_dispatcher._core.dispatcher import (
     _handle_event,
     _handle_failed_node,
     _handle_node_status_update,
+    _plan_task_groups,
     _submit_initial_tasks,
     _submit_task_group,
     cancel_dispatch,
     run_dispatch,
     run_workflow,
+    subscribe,
+    unsubscribe,
 )
 from covalent_dispatcher._db.datastore import DataStore
 
@@ -232,11 +235,16 @@ async def test_handle_completed_node_update(mocker):
     mock_submit_task_group = mocker.patch(
         "covalent_dispatcher._core.dispatcher._submit_task_group"
     )
+    mock_plan = mocker.patch(
+        "covalent_dispatcher._core.dispatcher._plan_task_groups",
+        return_value=[[], []],
+    )
 
     await _handle_node_status_update(dispatch_id, node_id, status, detail)
     mock_decrement.assert_awaited()
     assert mock_increment.await_count == 2
     assert mock_submit_task_group.await_count == 2
+    mock_plan.assert_awaited_once_with(dispatch_id, [[0], [1]])
 
 
 @pytest.mark.asyncio
@@ -338,6 +346,38 @@ async def test_handle_event(mocker, unresolved_count):
         mock_finalize.assert_not_awaited()
 
 
+@pytest.mark.asyncio
+async def test_handle_event_notifies_subscribers(mocker):
+    mocker.patch("covalent_dispatcher._core.dispatcher._handle_node_status_update")
+    mocker.patch("covalent_dispatcher._core.dispatcher.datasvc.persist_result")
+    mocker.patch(
+        "covalent_dispatcher._core.dispatcher._finalize_dispatch",
+        return_value=Result.COMPLETED,
+    )
+    mocker.patch(
+        "covalent_dispatcher._core.dispatcher._unresolved_tasks.get_unresolved",
+        return_value=0,
+    )
+
+    dispatch_id = "mock_dispatch_subscribers"
+    queue = subscribe(dispatch_id)
+    msg = {"dispatch_id": dispatch_id, "node_id": 2, "status": Result.COMPLETED, "detail": {}}
+    await _handle_event(msg)
+    unsubscribe(dispatch_id, queue)
+
+    assert queue.get_nowait() == {"dispatch_id": dispatch_id, "node_id": 2, "status": "COMPLETED"}
+    assert queue.get_nowait() == {
+        "dispatch_id": dispatch_id,
+        "node_id": None,
+        "status": "COMPLETED",
+    }
+    assert queue.empty()
+
+    # Unsubscribed queues no longer receive events
+    await _handle_event(msg)
+    assert queue.empty()
+
+
 @pytest.mark.asyncio
 async def test_handle_event_exception(mocker):
     import asyncio
@@ -496,6 +536,10 @@ async def test_submit_initial_tasks(mocker):
     mocker.patch(
         "covalent_dispatcher._core.dispatcher._initialize_caches",
     )
+    mock_plan = mocker.patch(
+        "covalent_dispatcher._core.dispatcher._plan_task_groups",
+        return_value=[[], []],
+    )
 
     mock_inc = mocker.patch("covalent_dispatcher._core.dispatcher._unresolved_tasks.increment")
     mock_submit_task_group = mocker.patch(
@@ -509,6 +553,7 @@ async def test_submit_initial_tasks(mocker):
 
     assert mock_submit_task_group.await_count == 2
     assert mock_inc.await_count == 2
+    mock_plan.assert_awaited_once_with(dispatch_id, [[1], [2]])
 
 
 @pytest.mark.asyncio
@@ -517,35 +562,25 @@ async def test_submit_task_group(mocker):
     gid = 2
     nodes = [4, 3, 2]
 
-    mock_get_abs_input = mocker.patch(
-        "covalent_dispatcher._core.dispatcher._get_abstract_task_inputs",
-        return_value={"args": [], "kwargs": {}},
-    )
-
     mock_attrs = {
         "name": "task",
         "value": 5,
+        "status": Result.NEW_OBJ,
         "executor": "local",
         "executor_data": {},
+        "cache": False,
     }
 
-    mock_statuses = [
-        {"status": Result.NEW_OBJ},
-        {"status": Result.NEW_OBJ},
-        {"status": Result.NEW_OBJ},
-    ]
-
-    async def get_electron_attrs(dispatch_id, node_id, keys):
-        return {key: mock_attrs[key] for key in keys}
-
-    mocker.patch(
-        "covalent_dispatcher._core.dispatcher.datasvc.electron.get",
-        get_electron_attrs,
-    )
+    async def get_electron_attrs_bulk(dispatch_id, node_ids, keys):
+        return [{key: mock_attrs[key] for key in keys} for _ in node_ids]
 
-    mocker.patch(
+    mock_get_bulk = mocker.patch(
         "covalent_dispatcher._core.dispatcher.datasvc.electron.get_bulk",
-        return_value=mock_statuses,
+        side_effect=get_electron_attrs_bulk,
+    )
+    mock_get_edges = mocker.patch(
+        "covalent_dispatcher._core.dispatcher.tg_utils.get_incoming_edges_bulk",
+        return_value=[[], [], []],
     )
 
     mocker.patch(
@@ -558,7 +593,9 @@ async def test_submit_task_group(mocker):
 
     await _submit_task_group(dispatch_id, nodes, gid)
     mock_run_abs_task.assert_called()
-    assert mock_get_abs_input.await_count == len(nodes)
+    mock_get_bulk.assert_awaited_once()
+    mock_get_edges.assert_awaited_once_with(dispatch_id, nodes)
+    assert len(mock_run_abs_task.call_args.kwargs["task_seq"]) == len(nodes)
 
 
 @pytest.mark.asyncio
@@ -568,35 +605,25 @@ async def test_submit_task_group_skips_reusable(mocker):
     gid = 2
     nodes = [4, 3, 2]
 
-    mock_get_abs_input = mocker.patch(
-        "covalent_dispatcher._core.dispatcher._get_abstract_task_inputs",
-        return_value={"args": [], "kwargs": {}},
-    )
-
     mock_attrs = {
         "name": "task",
         "value": 5,
+        "status": Result.PENDING_REUSE,
         "executor": "local",
         "executor_data": {},
+        "cache": False,
     }
 
-    mock_statuses = [
-        {"status": Result.PENDING_REUSE},
-        {"status": Result.PENDING_REUSE},
-        {"status": Result.PENDING_REUSE},
-    ]
-
-    async def get_electron_attrs(dispatch_id, node_id, keys):
-        return {key: mock_attrs[key] for key in keys}
+    async def get_electron_attrs_bulk(dispatch_id, node_ids, keys):
+        return [{key: mock_attrs[key] for key in keys} for _ in node_ids]
 
     mocker.patch(
-        "covalent_dispatcher._core.dispatcher.datasvc.electron.get",
-        get_electron_attrs,
+        "covalent_dispatcher._core.dispatcher.datasvc.electron.get_bulk",
+        get_electron_attrs_bulk,
     )
-
     mocker.patch(
-        "covalent_dispatcher._core.dispatcher.datasvc.electron.get_bulk",
-        return_value=mock_statuses,
+        "covalent_dispatcher._core.dispatcher.tg_utils.get_incoming_edges_bulk",
+        return_value=[[], [], []],
     )
 
     mock_update = mocker.patch(
@@ -609,10 +636,61 @@ async def test_submit_task_group_skips_reusable(mocker):
 
     await _submit_task_group(dispatch_id, nodes, gid)
     mock_run_abs_task.assert_not_called()
-    mock_get_abs_input.assert_not_awaited()
     assert mock_update.await_count == len(nodes)
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cache_hit", [True, False])
+async def test_submit_task_group_reuses_cached_outputs(mocker, cache_hit):
+    """Check that submit_task_group skips groups whose outputs are cached"""
+    dispatch_id = "dispatch_1"
+    gid = 2
+    nodes = [4, 3, 2]
+
+    mock_attrs = {
+        "name": "task",
+        "status": Result.NEW_OBJ,
+        "executor": "local",
+        "executor_data": {},
+        "cache": True,
+    }
+
+    async def get_electron_attrs_bulk(dispatch_id, node_ids, keys):
+        return [{key: mock_attrs[key] for key in keys} for _ in node_ids]
+
+    mocker.patch(
+        "covalent_dispatcher._core.dispatcher.datasvc.electron.get_bulk",
+        get_electron_attrs_bulk,
+    )
+    mocker.patch(
+        "covalent_dispatcher._core.dispatcher.tg_utils.get_incoming_edges_bulk",
+        return_value=[[], [], []],
+    )
+    mock_load_cached = mocker.patch(
+        "covalent_dispatcher._core.dispatcher.datasvc.electron.load_cached_outputs",
+        return_value=cache_hit,
+    )
+    mock_update = mocker.patch(
+        "covalent_dispatcher._core.dispatcher.datasvc.update_node_result",
+    )
+    mock_run_abs_task = mocker.patch(
+        "covalent_dispatcher._core.dispatcher.runner_ng.run_abstract_task_group",
+    )
+
+    await _submit_task_group(dispatch_id, nodes, gid)
+
+    task_plans = mock_load_cached.await_args.args[1]
+    assert [plan["node_id"] for plan in task_plans] == nodes
+    if cache_hit:
+        mock_run_abs_task.assert_not_called()
+        assert mock_update.await_count == len(nodes)
+        for awaited in mock_update.await_args_list:
+            assert awaited.args[1]["status"] == Result.COMPLETED
+    else:
+        mock_run_abs_task.assert_called()
+        mock_update.assert_not_awaited()
+
+
 @pytest.mark.asyncio
 async def test_submit_parameter(mocker):
     from covalent._shared_files.defaults import parameter_prefix
@@ -623,16 +701,22 @@ async def test_submit_parameter(mocker):
     mock_attrs = {
         "name": parameter_prefix,
         "value": 5,
+        "status": Result.NEW_OBJ,
         "executor": "local",
         "executor_data": {},
+        "cache": False,
     }
 
-    async def get_electron_attrs(dispatch_id, node_id, keys):
-        return {key: mock_attrs[key] for key in keys}
+    async def get_electron_attrs_bulk(dispatch_id, node_ids, keys):
+        return [{key: mock_attrs[key] for key in keys} for _ in node_ids]
 
     mocker.patch(
-        "covalent_dispatcher._core.dispatcher.datasvc.electron.get",
-        get_electron_attrs,
+        "covalent_dispatcher._core.dispatcher.datasvc.electron.get_bulk",
+        get_electron_attrs_bulk,
+    )
+    mocker.patch(
+        "covalent_dispatcher._core.dispatcher.tg_utils.get_incoming_edges_bulk",
+        return_value=[[]],
     )
 
     mock_update = mocker.patch(
@@ -649,6 +733,45 @@ async def test_submit_parameter(mocker):
     mock_update.assert_awaited()
 
 
+@pytest.mark.asyncio
+async def test_plan_task_groups(mocker):
+    """Check that task groups are planned in one DB round trip"""
+    dispatch_id = "dispatch_1"
+    task_groups = [[0, 1], [2]]
+
+    async def get_electron_attrs_bulk(dispatch_id, node_ids, keys):
+        return [{key: f"{key}_{node_id}" for key in keys} for node_id in node_ids]
+
+    mock_get_bulk = mocker.patch(
+        "covalent_dispatcher._core.dispatcher.datasvc.electron.get_bulk",
+        side_effect=get_electron_attrs_bulk,
+    )
+    edges = [
+        [],
+        [
+            {"source": 0, "target": 1, "attrs": {"edge_name": "y", "param_type": "kwarg"}},
+            {
+                "source": 3,
+                "target": 1,
+                "attrs": {"edge_name": "x", "param_type": "arg", "arg_index": 0},
+            },
+        ],
+        [],
+    ]
+    mocker.patch(
+        "covalent_dispatcher._core.dispatcher.tg_utils.get_incoming_edges_bulk",
+        return_value=edges,
+    )
+
+    plans = await _plan_task_groups(dispatch_id, task_groups)
+
+    mock_get_bulk.assert_awaited_once()
+    assert [[p["node_id"] for p in group] for group in plans] == task_groups
+    assert plans[0][1]["abstract_inputs"] == {"args": [3], "kwargs": {"y": 0}}
+    assert plans[1][0]["executor"] == "executor_2"
+    assert await _plan_task_groups(dispatch_id, []) == []
+
+
 @pytest.mark.asyncio
 async def test_clear_caches(mocker):
     import networkx as nx
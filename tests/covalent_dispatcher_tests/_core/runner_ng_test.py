@@ -342,7 +342,7 @@ async def test_get_task_result(mocker):
     )
 
     mock_update = mocker.patch(
-        "covalent_dispatcher._core.runner_ng.datamgr.update_node_result",
+        "covalent_dispatcher._core.runner_ng.datamgr.update_node_results",
     )
     mock_download = mocker.patch(
         "covalent_dispatcher._core.data_modules.asset_manager.download_assets_for_node",
@@ -363,7 +363,7 @@ async def test_get_task_result(mocker):
 
     me.receive.assert_awaited_with(task_group_metadata, job_meta)
 
-    mock_update.assert_awaited_with(dispatch_id, expected_node_result)
+    mock_update.assert_awaited_with(dispatch_id, [expected_node_result])
     mock_download.assert_awaited()
     # Test exception during get
     me.receive = AsyncMock(side_effect=RuntimeError())
@@ -439,7 +439,7 @@ async def test_event_listener(mocker):
     )
 
     mock_update = mocker.patch(
-        "covalent_dispatcher._core.runner_ng.datamgr.update_node_result",
+        "covalent_dispatcher._core.runner_ng.datamgr.update_node_results",
     )
 
     mock_get = mocker.patch("covalent_dispatcher._core.runner_ng._get_task_result")
@@ -472,7 +472,7 @@ async def test_event_listener(mocker):
 
     await asyncio.wait_for(fut, 1)
 
-    mock_update.assert_awaited_with(task_group_metadata["dispatch_id"], node_result)
+    mock_update.assert_awaited_with(task_group_metadata["dispatch_id"], [node_result])
 
     await mock_event_queue.put({"BAD_EVENT": "asdf"})
     await mock_event_queue.put({"event": "BYE"})
@@ -514,7 +514,7 @@ async def test_run_abstract_task_group(mocker):
     )
 
     mock_update = mocker.patch(
-        "covalent_dispatcher._core.runner_ng.datamgr.update_node_result",
+        "covalent_dispatcher._core.runner_ng.datamgr.update_node_results",
     )
 
     dispatch_id = "dispatch"
@@ -607,7 +607,7 @@ async def test_run_abstract_task_group_handles_bad_executors(mocker):
     mocker.patch("covalent_dispatcher._core.runner_ng.get_executor", side_effect=RuntimeError())
 
     mock_update = mocker.patch(
-        "covalent_dispatcher._core.runner_ng.datamgr.update_node_result",
+        "covalent_dispatcher._core.runner_ng.datamgr.update_node_results",
     )
     dispatch_id = "dispatch"
     node_id = 0
@@ -659,7 +659,7 @@ async def test_run_abstract_task_group_handles_cancelled_tasks(mocker):
     )
 
     mock_update = mocker.patch(
-        "covalent_dispatcher._core.runner_ng.datamgr.update_node_result",
+        "covalent_dispatcher._core.runner_ng.datamgr.update_node_results",
     )
     mock_mark_ready = mocker.patch(
         "covalent_dispatcher._core.runner_ng.mark_task_ready",
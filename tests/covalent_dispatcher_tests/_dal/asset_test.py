@@ -150,6 +150,25 @@ def test_copy_asset():
     assert dest_asset.load_data() == "Hello\n"
 
 
+def test_copy_asset_links_deduplicated_data(tmp_path, mocker):
+    """Test that copying assets only links the data when deduplicating"""
+    mocker.patch(
+        "covalent_dispatcher._object_store.local.LocalProvider.deduplicate",
+        new_callable=mocker.PropertyMock,
+        return_value=True,
+    )
+    mock_cp = mocker.patch("covalent_dispatcher._dal.asset.cp")
+    (tmp_path / "src.txt").write_text("Hello\n")
+
+    src_asset = Asset(None, get_asset_record(str(tmp_path), "src.txt"))
+    dest_asset = Asset(None, get_asset_record(str(tmp_path), "dest.txt"))
+    copy_asset(src_asset, dest_asset)
+
+    mock_cp.assert_not_called()
+    assert os.path.samefile(tmp_path / "src.txt", tmp_path / "dest.txt")
+    assert dest_asset.load_data() == "Hello\n"
+
+
 def test_copy_asset_metadata(test_db):
     src_rec = get_asset_record("/tmp", "src_key", "sha", "srcdigest", 256)
     dest_rec = get_asset_record("/tmp", "dest_key")
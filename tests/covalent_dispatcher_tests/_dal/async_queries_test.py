@@ -0,0 +1,171 @@
+# Copyright 2023 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the asyncio DAL queries"""
+
+from datetime import datetime as dt
+from datetime import timezone
+from unittest.mock import PropertyMock
+
+import pytest
+
+from covalent._shared_files.util_classes import RESULT_STATUS
+from covalent_dispatcher._dal import async_queries
+from covalent_dispatcher._db import jobdb
+from covalent_dispatcher._db.datastore import DataStore
+from covalent_dispatcher._db.write_result_to_db import (
+    insert_electrons_data,
+    insert_lattices_data,
+    transaction_insert_job_record,
+)
+from tests.covalent_dispatcher_tests._db.write_result_to_db_test import (
+    get_electron_kwargs,
+    get_lattice_kwargs,
+)
+
+pytest.importorskip("aiosqlite")
+
+DISPATCH_ID = "test_async_dispatch"
+
+
+@pytest.fixture
+def test_db(tmp_path, mocker):
+    """Instantiate a file-backed database with an asyncio engine"""
+    db = DataStore(
+        db_URL=f"sqlite+pysqlite:///{tmp_path / 'workflows.db'}",
+        initialize_db=True,
+        concurrent=True,
+        use_async=True,
+    )
+    mocker.patch("covalent_dispatcher._dal.async_queries.workflow_db", db)
+    mocker.patch("covalent_dispatcher._db.jobdb.workflow_db", db)
+    mocker.patch("covalent_dispatcher._db.write_result_to_db.workflow_db", db)
+
+    cur_time = dt.now(timezone.utc)
+    insert_lattices_data(
+        **get_lattice_kwargs(
+            dispatch_id=DISPATCH_ID, created_at=cur_time, updated_at=cur_time, started_at=cur_time
+        )
+    )
+    for node_id in range(3):
+        with db.session() as session:
+            job_id = transaction_insert_job_record(session, False).id
+        insert_electrons_data(
+            **get_electron_kwargs(
+                parent_dispatch_id=DISPATCH_ID,
+                transport_graph_node_id=node_id,
+                name=f"task_{node_id}",
+                status="COMPLETED",
+                job_id=job_id,
+                created_at=cur_time,
+                updated_at=cur_time,
+            )
+        )
+    return db
+
+
+def test_async_engine_unavailable_in_memory():
+    """Test that in-memory Sqlite databases fall back to the sync DAL"""
+    db = DataStore(db_URL="sqlite+pysqlite:///:memory:", use_async=True)
+    assert not db.supports_async
+
+
+def test_can_use_async_queries(test_db):
+    """Test which queries can bypass the sync DAL"""
+    assert async_queries.can_get_electron_values(["name", "status", "executor_data"])
+    assert not async_queries.can_get_electron_values(["name", "output"])
+    assert not async_queries.can_get_electron_values(["sub_dispatch_id"])
+    assert async_queries.can_get_dispatch_values(["status", "electron_id", "end_time"])
+    assert not async_queries.can_get_dispatch_values(["result"])
+
+    # Sqlite only supports a single writer
+    assert not async_queries.can_update_dispatch({"status": RESULT_STATUS.RUNNING})
+
+
+def test_can_update_dispatch_concurrent_writes(test_db, mocker):
+    """Test which updates can bypass the sync DAL on backends with concurrent writers"""
+    mocker.patch.object(
+        DataStore, "supports_concurrent_writes", new_callable=PropertyMock, return_value=True
+    )
+    assert async_queries.can_update_dispatch({"status": RESULT_STATUS.RUNNING})
+    assert not async_queries.can_update_dispatch({"status": RESULT_STATUS.COMPLETED})
+    assert not async_queries.can_update_dispatch({"status": RESULT_STATUS.RUNNING, "error": "x"})
+
+
+def test_async_reads_need_concurrent_reads(tmp_path, mocker):
+    """Test that reads queue behind writes unless Sqlite uses WAL"""
+    db = DataStore(db_URL=f"sqlite+pysqlite:///{tmp_path / 'workflows.db'}", use_async=True)
+    mocker.patch("covalent_dispatcher._dal.async_queries.workflow_db", db)
+    assert db.supports_async
+    assert not async_queries.can_get_dispatch_values(["status"])
+
+
+@pytest.mark.asyncio
+async def test_get_electron_values_bulk(test_db):
+    """Test querying electron metadata with the asyncio engine"""
+    attrs = await async_queries.get_electron_values_bulk(
+        DISPATCH_ID, [2, 0], ["name", "status", "executor_data"]
+    )
+    assert attrs == [
+        {"name": "task_2", "status": RESULT_STATUS.COMPLETED, "executor_data": {}},
+        {"name": "task_0", "status": RESULT_STATUS.COMPLETED, "executor_data": {}},
+    ]
+
+    with pytest.raises(KeyError):
+        await async_queries.get_electron_values_bulk(DISPATCH_ID, [5], ["name"])
+
+
+@pytest.mark.asyncio
+async def test_get_and_update_dispatch(test_db):
+    """Test reading and updating dispatch metadata with the asyncio engine"""
+    end_time = dt(2023, 1, 1)
+    await async_queries.update_dispatch(
+        DISPATCH_ID, end_time=end_time, status=RESULT_STATUS.POSTPROCESSING
+    )
+
+    attrs = await async_queries.get_dispatch_values(DISPATCH_ID, ["status", "end_time"])
+    assert attrs == {"status": RESULT_STATUS.POSTPROCESSING, "end_time": end_time}
+
+    with pytest.raises(KeyError):
+        await async_queries.get_dispatch_values("missing", ["status"])
+
+
+@pytest.mark.asyncio
+async def test_job_records_async(test_db):
+    """Test the asyncio job record queries"""
+    job_ids = await jobdb.to_job_ids_async(DISPATCH_ID, [0, 2])
+    assert job_ids == [1, 3]
+
+    await jobdb.update_job_records_async(
+        [
+            {"job_id": 1, "cancel_requested": True},
+            {"job_id": 3, "job_handle": "42", "job_status": "RUNNING"},
+        ]
+    )
+    records = await jobdb.get_job_records_async(job_ids)
+    assert records[0]["cancel_requested"] is True
+    assert records[1]["job_handle"] == "42"
+    assert records[1]["status"] == "RUNNING"
+    assert records == jobdb.get_job_records(job_ids)
+
+    with pytest.raises(jobdb.MissingJobRecordError):
+        await jobdb.update_job_records_async([{"job_id": 42, "cancel_requested": True}])
+
+    with pytest.raises(jobdb.MissingJobRecordError):
+        await jobdb.get_job_records_async([42])
+
+    with pytest.raises(KeyError):
+        await jobdb.to_job_ids_async("missing", [0])
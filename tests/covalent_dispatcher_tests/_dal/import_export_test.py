@@ -120,3 +120,44 @@ def test_import_export_manifest(test_db, mocker):
                 assert sub_node["assets"][key] == exp_node["assets"][key]
 
         assert sub_tg["links"] == exp_tg["links"]
+
+
+def test_import_manifest_pull_assets(test_db, mocker):
+    """Check that assets in the node asset pack are pulled by byte range"""
+
+    import tempfile
+
+    from covalent._serialize.common import parse_asset_uri
+    from covalent_dispatcher._core.data_modules.importer import _pull_assets
+    from covalent_dispatcher._dal.result import Result as SRVResult
+
+    res = get_mock_result()
+    dispatch_id = "test_import_manifest_pull_assets"
+    res._dispatch_id = dispatch_id
+    res._root_dispatch_id = dispatch_id
+    mocker.patch("covalent_dispatcher._dal.base.workflow_db", test_db)
+
+    with tempfile.TemporaryDirectory() as sdk_tmp_dir, tempfile.TemporaryDirectory() as srv_tmp_dir:
+        manifest = serialize_result(res, sdk_tmp_dir)
+        packed_assets = [
+            asset
+            for node in manifest.lattice.transport_graph.nodes
+            for asset in dict(node.assets).values()
+            if asset.uri and parse_asset_uri(asset.uri)[2] is not None
+        ]
+        assert packed_assets
+
+        # Without push_assets, the manifest keeps the local uris
+        received_manifest = manifest.copy(deep=True)
+        _pull_assets(import_result(received_manifest, srv_tmp_dir, None))
+
+        srv_res = SRVResult.from_dispatch_id(dispatch_id, bare=False)
+        tg = res.lattice.transport_graph
+        for node_id in tg._graph.nodes:
+            srv_node = srv_res.lattice.transport_graph.get_node(node_id)
+            function = srv_node.get_value("function")
+            assert (
+                function.get_serialized()
+                == tg.get_node_value(node_id, "function").get_serialized()
+            )
+            assert srv_node.get_value("name") == tg.get_node_value(node_id, "name")
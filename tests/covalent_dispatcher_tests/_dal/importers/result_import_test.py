@@ -17,6 +17,7 @@
 """Tests for importing ResultSchema into the DB"""
 
 import copy
+import os
 import tempfile
 
 import pytest
@@ -29,6 +30,7 @@ from covalent._shared_files.util_classes import RESULT_STATUS
 from covalent_dispatcher._dal.importers.result import SERVER_URL, handle_redispatch, import_result
 from covalent_dispatcher._dal.job import Job
 from covalent_dispatcher._dal.result import get_result_object
+from covalent_dispatcher._db import models
 from covalent_dispatcher._db.datastore import DataStore
 
 TEMP_RESULTS_DIR = "/tmp/covalent_result_import_test"
@@ -121,6 +123,113 @@ def test_import_result(mocker, test_db):
         assert edge == filtered_tg.links[i]
 
 
+def test_import_result_links_records(mocker, test_db):
+    """Test that bulk-inserted electrons, assets, jobs, and edges reference each other"""
+
+    mocker.patch("covalent_dispatcher._dal.base.workflow_db", test_db)
+
+    with tempfile.TemporaryDirectory(prefix="covalent-") as sdk_dir, tempfile.TemporaryDirectory(
+        prefix="covalent-"
+    ) as srv_dir:
+        # Import two dispatches so that primary keys don't start at 1
+        for dispatch_id in ["test_import_links_1", "test_import_links_2"]:
+            res = get_mock_result(dispatch_id, sdk_dir)
+            tg = res.lattice.transport_graph
+            digests = {node.id: node.assets.function.digest for node in tg.nodes}
+            import_result(res, srv_dir, None)
+
+    srv_tg = get_result_object("test_import_links_2", bare=True).lattice.transport_graph
+
+    with test_db.session() as session:
+        for node in tg.nodes:
+            srv_node = srv_tg.get_node(node.id, session)
+            assert srv_node.get_value("name", session=session) == node.metadata.name
+            asset = srv_node.get_asset("function", session)
+            assert asset.digest == digests[node.id]
+            assert asset.storage_path.endswith(f"node_{node.id}")
+
+        records = session.query(models.Electron).filter(
+            models.Electron.parent_lattice_id == srv_tg.lattice_id
+        )
+        job_ids = {rec.job_id for rec in records}
+        assert len(job_ids) == len(tg.nodes)
+        assert all(Job.get_by_primary_key(session, job_id) for job_id in job_ids)
+
+    srv_edges = [
+        (e["source"], e["target"]) for node in tg.nodes for e in srv_tg.get_incoming_edges(node.id)
+    ]
+    assert sorted(srv_edges) == sorted((e.source, e.target) for e in tg.links)
+
+
+def test_import_result_skips_stored_assets(mocker, test_db):
+    """Test that the client isn't asked to upload assets already stored by the server"""
+    dispatch_id = "test_import_result_skips_stored_assets"
+
+    mocker.patch("covalent_dispatcher._dal.base.workflow_db", test_db)
+    mock_link_blob = mocker.patch(
+        "covalent_dispatcher._dal.importers.result.local_store.link_blob",
+        side_effect=lambda storage_path, object_key, digest_alg, digest: (
+            storage_path.endswith("node_0") and object_key == "function.tobj"
+        ),
+    )
+
+    with tempfile.TemporaryDirectory(prefix="covalent-") as sdk_dir, tempfile.TemporaryDirectory(
+        prefix="covalent-"
+    ) as srv_dir:
+        res = get_mock_result(dispatch_id, sdk_dir)
+        function_digest = res.lattice.transport_graph.nodes[0].assets.function.digest
+        filtered_res = import_result(res, srv_dir, None)
+
+    mock_link_blob.assert_any_call(mocker.ANY, "function.tobj", "sha", function_digest)
+
+    node = filtered_res.lattice.transport_graph.nodes[0]
+    assert node.assets.function.remote_uri == ""
+    assert node.assets.value.remote_uri.startswith(SERVER_URL)
+    assert filtered_res.lattice.assets.workflow_function.remote_uri.startswith(SERVER_URL)
+
+    srv_res = get_result_object(dispatch_id, bare=True)
+    with test_db.session() as session:
+        asset = srv_res.lattice.transport_graph.get_node(0).get_asset("function", session)
+        assert asset.remote_uri == ""
+
+
+def test_import_result_unlinks_blobs_on_error(mocker, test_db, tmp_path):
+    """Test that asset files linked to stored blobs are removed if the import fails"""
+    from covalent_dispatcher._object_store.local import LocalProvider
+
+    dispatch_id = "test_import_result_unlinks_blobs_on_error"
+
+    config = {
+        "dispatcher.results_dir": str(tmp_path),
+        "dispatcher.asset_dedup": "true",
+        "dispatcher.asset_compression": {},
+    }
+    mocker.patch("covalent_dispatcher._object_store.local.get_config", config.get)
+    store = LocalProvider()
+    mocker.patch("covalent_dispatcher._dal.importers.result.local_store", store)
+    mocker.patch("covalent_dispatcher._dal.base.workflow_db", test_db)
+    mocker.patch(
+        "covalent_dispatcher._dal.importers.result.import_transport_graph",
+        side_effect=RuntimeError("Import failed"),
+    )
+
+    with tempfile.TemporaryDirectory(prefix="covalent-") as sdk_dir:
+        res = get_mock_result(dispatch_id, sdk_dir)
+
+    # The server already stores the workflow function
+    digest = res.lattice.assets.workflow_function.digest
+    stored_path = tmp_path / "stored.tobj"
+    stored_path.write_bytes(b"workflow function")
+    store.cas.link(stored_path, digest)
+
+    with pytest.raises(RuntimeError):
+        import_result(res, str(tmp_path), None)
+
+    storage_path, object_key = store.get_uri_components(dispatch_id, None, "workflow_function")
+    assert not os.path.exists(os.path.join(storage_path, object_key))
+    assert store.cas.refcount(digest) == 1
+
+
 def test_import_previously_imported_result(mocker, test_db):
     dispatch_id = "test_import_previous_result"
     sub_dispatch_id = "test_import_previous_result_sub"
@@ -496,6 +496,44 @@ def test_result_filters_illegal_status_updates(test_db, mocker):
     assert not third_update
 
 
+def test_result_update_nodes_in_one_transaction(test_db, mocker):
+    """Check that batched node updates are applied in order and validated individually"""
+    res = get_mock_result()
+    res._initialize_nodes()
+
+    mocker.patch("covalent_dispatcher._db.write_result_to_db.workflow_db", test_db)
+    mocker.patch("covalent_dispatcher._db.upsert.workflow_db", test_db)
+    mocker.patch("covalent_dispatcher._dal.base.workflow_db", test_db)
+
+    update.persist(res)
+
+    with test_db.session() as session:
+        record = (
+            session.query(models.Lattice)
+            .where(models.Lattice.dispatch_id == "mock_dispatch")
+            .first()
+        )
+        srvres = Result(session, record)
+
+    spy_session = mocker.patch.object(srvres, "session", wraps=srvres.session)
+    timestamp = datetime.now()
+    node_results = [
+        {"node_id": 0, "status": RESULT_STATUS.RUNNING, "start_time": timestamp},
+        {"node_id": 0, "status": RESULT_STATUS.COMPLETED, "end_time": timestamp},
+        {"node_id": 0, "status": RESULT_STATUS.FAILED},
+        {"node_id": 1, "status": RESULT_STATUS.RUNNING},
+    ]
+
+    assert srvres._update_nodes(node_results) == [True, True, False, True]
+    assert spy_session.call_count == 1
+
+    tg = srvres.lattice.transport_graph
+    assert tg.get_node_value(0, "status") == RESULT_STATUS.COMPLETED
+    assert tg.get_node_value(0, "end_time") == timestamp
+    assert tg.get_node_value(1, "status") == RESULT_STATUS.RUNNING
+    assert srvres.get_value("completed_electron_num") == 1
+
+
 def test_result_filters_parent_electron_updates(test_db, mocker):
     """Check filtering of status updates for sublattice electrons"""
 
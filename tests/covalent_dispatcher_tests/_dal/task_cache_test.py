@@ -0,0 +1,107 @@
+# Copyright 2023 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the cross-dispatch electron cache"""
+
+
+import pytest
+
+import covalent as ct
+from covalent._results_manager import Result as SDKResult
+from covalent._shared_files.util_classes import RESULT_STATUS
+from covalent._workflow.lattice import Lattice as SDKLattice
+from covalent._workflow.transportable_object import TransportableObject
+from covalent_dispatcher._dal import task_cache
+from covalent_dispatcher._dal.result import get_result_object
+from covalent_dispatcher._db import update
+from covalent_dispatcher._db.datastore import DataStore
+
+
+@pytest.fixture
+def test_db():
+    """Instantiate and return an in-memory database."""
+
+    return DataStore(
+        db_URL="sqlite+pysqlite:///:memory:",
+        initialize_db=True,
+    )
+
+
+@ct.electron(executor="local", cache=True)
+def task(x):
+    return x
+
+
+@ct.lattice
+def workflow(x):
+    return task(x)
+
+
+def get_mock_result(dispatch_id: str, x: int) -> SDKResult:
+    """Construct a mock result object corresponding to a lattice."""
+
+    workflow.build_graph(x=x)
+    received_workflow = SDKLattice.deserialize_from_json(workflow.serialize_to_json())
+    result_object = SDKResult(received_workflow, dispatch_id)
+    result_object._initialize_nodes()
+    return result_object
+
+
+def get_task_plan(tg, node_id: int) -> dict:
+    parents = [edge["source"] for edge in tg.get_incoming_edges(node_id)]
+    return {"node_id": node_id, "abstract_inputs": {"args": parents, "kwargs": {}}}
+
+
+def test_compute_cache_key():
+    """Test that cache keys depend on the function, hooks, and inputs"""
+    key = task_cache.compute_cache_key("f", "h", ["a", "b"], {"y": "c"})
+    assert key == task_cache.compute_cache_key("f", "h", ["a", "b"], {"y": "c"})
+    assert key != task_cache.compute_cache_key("f", "h", ["b", "a"], {"y": "c"})
+    assert key != task_cache.compute_cache_key("f", "h", ["a", "b"], {"z": "c"})
+    assert key != task_cache.compute_cache_key("g", "h", ["a", "b"], {"y": "c"})
+    assert key != task_cache.compute_cache_key("f", "i", ["a", "b"], {"y": "c"})
+
+
+def test_load_cached_outputs(test_db, mocker):
+    """Test reusing the outputs of an electron from a previous dispatch"""
+    mocker.patch("covalent_dispatcher._db.write_result_to_db.workflow_db", test_db)
+    mocker.patch("covalent_dispatcher._db.upsert.workflow_db", test_db)
+    mocker.patch("covalent_dispatcher._dal.base.workflow_db", test_db)
+
+    for dispatch_id, x in [("cache_1", 1), ("cache_2", 1), ("cache_3", 2)]:
+        update.persist(get_mock_result(dispatch_id, x))
+
+    # Nothing has been computed yet
+    tg_1 = get_result_object("cache_1", bare=True).lattice.transport_graph
+    assert not task_cache.load_cached_outputs(tg_1, [get_task_plan(tg_1, 0)])
+
+    with test_db.session() as session:
+        node = tg_1.get_node(0, session)
+        node.get_asset("output", session).store_data(TransportableObject(42), session)
+        node.get_asset("stdout", session).store_data("hello", session)
+    tg_1.set_node_value(0, "status", RESULT_STATUS.COMPLETED)
+
+    # Same function and inputs
+    tg_2 = get_result_object("cache_2", bare=True).lattice.transport_graph
+    assert task_cache.load_cached_outputs(tg_2, [get_task_plan(tg_2, 0)])
+    with test_db.session() as session:
+        node = tg_2.get_node(0, session)
+        assert node.get_asset("output", session).load_data().get_deserialized() == 42
+        assert node.get_asset("stdout", session).load_data() == "hello"
+
+    # Different inputs
+    tg_3 = get_result_object("cache_3", bare=True).lattice.transport_graph
+    assert not task_cache.load_cached_outputs(tg_3, [get_task_plan(tg_3, 0)])
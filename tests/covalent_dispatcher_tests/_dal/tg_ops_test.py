@@ -362,58 +362,70 @@ def test_get_reusable_nodes(mocker, tg, tg_2):
         "covalent_dispatcher._dal.tg_ops.TransportGraphOps._max_cbms",
         return_value=({"mock-key-A": "mock-value-A"}, {"mock-key-B": "mock-value-B"}),
     )
-    mock_old_asset = MagicMock()
-    mock_new_asset = MagicMock()
-    mock_old_asset.storage_type = StorageType.LOCAL
-    mock_old_asset.storage_path = "/tmp"
-    mock_old_asset.object_key = "value.pkl"
-    mock_old_asset.meta = {"digest": "24af"}
-    mock_new_asset.storage_type = StorageType.LOCAL
-    mock_new_asset.storage_path = "/tmp"
-    mock_new_asset.object_key = "value.pkl"
-    mock_new_asset.meta = {"digest": "24af"}
-
-    mock_old_node = MagicMock()
-    mock_new_node = MagicMock()
-    mock_old_node.get_asset = MagicMock(return_value=mock_old_asset)
-    mock_new_node.get_asset = MagicMock(return_value=mock_new_asset)
-
-    tg.get_node = MagicMock(return_value=mock_old_node)
-    tg_2.get_node = MagicMock(return_value=mock_new_node)
+    tg.get_asset_digests = MagicMock(return_value={0: "24af", 1: "24af", 2: "24af"})
+    tg_2.get_asset_digests = MagicMock(return_value={0: "24af", 1: "24af", 2: "24af"})
+    tg.get_node = MagicMock()
+    tg_2.get_node = MagicMock()
 
     tg_ops = TransportGraphOps(tg)
     reusable_nodes = tg_ops.get_reusable_nodes(tg_2)
     assert reusable_nodes == ["mock-key-A"]
     max_cbms_mock.assert_called_once()
 
+    # Parameter value checksums are loaded in bulk
+    tg.get_asset_digests.assert_called_once_with("value")
+    tg_2.get_asset_digests.assert_called_once_with("value")
+    tg.get_node.assert_not_called()
+    tg_2.get_node.assert_not_called()
 
-def test_get_diff_nodes_integration_test(tg, tg_2):
-    """Test the get reusable nodes method."""
+    A, B = max_cbms_mock.call_args.args
+    assert A.nodes[0] == {"name": "add", "status": RESULT_STATUS.NEW_OBJECT, "value": "24af"}
+    assert B.nodes[0] == {"name": "not-add", "status": RESULT_STATUS.NEW_OBJECT, "value": "24af"}
 
-    mock_old_asset = MagicMock()
-    mock_new_asset = MagicMock()
-    mock_old_asset.storage_type = StorageType.LOCAL
-    mock_old_asset.storage_path = "/tmp"
-    mock_old_asset.object_key = "value.pkl"
-    mock_old_asset.__dict__.update({"digest": "24af"})
-    mock_new_asset.storage_type = StorageType.LOCAL
-    mock_new_asset.storage_path = "/tmp"
-    mock_new_asset.object_key = "value.pkl"
-    mock_new_asset.__dict__.update({"digest": "24af"})
 
-    mock_old_node = MagicMock()
-    mock_new_node = MagicMock()
-    mock_old_node.get_asset = MagicMock(return_value=mock_old_asset)
-    mock_new_node.get_asset = MagicMock(return_value=mock_new_asset)
+def test_get_diff_nodes_integration_test(tg, tg_2):
+    """Test the get reusable nodes method."""
 
-    tg.get_node = MagicMock(return_value=mock_old_node)
-    tg_2.get_node = MagicMock(return_value=mock_new_node)
+    tg.get_asset_digests = MagicMock(return_value={0: "24af", 1: "24af", 2: "24af"})
+    tg_2.get_asset_digests = MagicMock(return_value={0: "24af", 1: "24af", 2: "24af"})
 
     tg_ops = TransportGraphOps(tg)
 
     reusable_nodes = tg_ops.get_reusable_nodes(tg_2)
     assert reusable_nodes == [1, 2]
 
+    # Different parameter values
+    tg_2.get_asset_digests = MagicMock(return_value={0: "24af", 1: "24af", 2: "0bf"})
+    reusable_nodes = tg_ops.get_reusable_nodes(tg_2)
+    assert reusable_nodes == [1]
+
+
+def test_flag_successors_linear_time(tg_ops):
+    """Test that flagging stops at already flagged nodes."""
+    import networkx as nx
+
+    # Each node is connected to all later nodes
+    n = 200
+    A = nx.MultiDiGraph()
+    A.add_edges_from((i, j) for i in range(n) for j in range(i + 1, n))
+    node_statuses = {node: 1 for node in A.nodes}
+
+    visited = []
+    adj = A.adj
+
+    class CountingAdj:
+        def __getitem__(self, node):
+            visited.append(node)
+            return adj[node]
+
+    B = MagicMock()
+    B.adj = CountingAdj()
+    for start in reversed(range(n)):
+        tg_ops._flag_successors(B, node_statuses, start)
+
+    assert set(node_statuses.values()) == {-1}
+    assert len(visited) == n
+
 
 def test_reset_node(tg):
     tg.set_node_value(0, "status", RESULT_STATUS.PENDING_REPLACEMENT)
@@ -163,6 +163,39 @@ def test_transport_graph_get_internal_graph_copy(test_db, mocker):
     assert g.edges == tg._graph.edges
 
 
+@pytest.mark.parametrize("bare_mode", [False, True])
+def test_transport_graph_get_asset_digests(bare_mode, test_db, mocker):
+    res = get_mock_result()
+    res._initialize_nodes()
+
+    mocker.patch("covalent_dispatcher._db.write_result_to_db.workflow_db", test_db)
+    mocker.patch("covalent_dispatcher._db.upsert.workflow_db", test_db)
+    mocker.patch("covalent_dispatcher._dal.base.workflow_db", test_db)
+
+    update.persist(res)
+
+    with test_db.session() as session:
+        record = (
+            session.query(models.Lattice)
+            .where(models.Lattice.dispatch_id == "mock_dispatch")
+            .first()
+        )
+        lat_id = record.id
+
+        tg = _TransportGraph.get_compute_graph(session, lat_id, bare_mode)
+
+    digests = tg.get_asset_digests("value")
+
+    with test_db.session() as session:
+        node_ids = _TransportGraph.get_compute_graph(session, lat_id)._graph.nodes
+        expected = {}
+        for node_id in node_ids:
+            node = tg.get_node(node_id, session)
+            expected[node_id] = node.get_asset("value", session).digest
+
+    assert digests == expected
+
+
 @pytest.mark.parametrize("bare_mode", [False, True])
 def test_transport_graph_get_incoming_edges(bare_mode, test_db, mocker):
     @ct.electron(executor="local")
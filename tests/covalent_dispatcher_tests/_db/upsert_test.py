@@ -104,9 +104,9 @@ def test_upsert_electron_data_handles_missing_keys(test_db, result_1, mocker):
         _electron_data(session, 1, result_1)
 
     node_path = Path(TEMP_RESULTS_DIR) / result_1.dispatch_id / "node_0"
-    mock_store_file.assert_any_call(node_path, ELECTRON_ERROR_FILENAME, None)
-    mock_store_file.assert_any_call(node_path, ELECTRON_STDOUT_FILENAME, None)
-    mock_store_file.assert_any_call(node_path, ELECTRON_STDERR_FILENAME, None)
+    mock_store_file.assert_any_call(node_path, ELECTRON_ERROR_FILENAME, None, codec=None)
+    mock_store_file.assert_any_call(node_path, ELECTRON_STDOUT_FILENAME, None, codec=None)
+    mock_store_file.assert_any_call(node_path, ELECTRON_STDERR_FILENAME, None, codec=None)
     mock_store_file.assert_any_call(
-        node_path, ELECTRON_RESULTS_FILENAME, TransportableObject(None)
+        node_path, ELECTRON_RESULTS_FILENAME, TransportableObject(None), codec=None
     )
@@ -0,0 +1,124 @@
+# Copyright 2023 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the content-addressed store"""
+
+import os
+
+import pytest
+
+from covalent_dispatcher._object_store.cas import ContentAddressedStore
+from covalent_dispatcher._object_store.local import LocalProvider
+
+
+@pytest.fixture
+def dedup_store(tmp_path, mocker):
+    """A local store with deduplication enabled"""
+
+    def get_config(key):
+        return {
+            "dispatcher.results_dir": str(tmp_path),
+            "dispatcher.asset_dedup": "true",
+            "dispatcher.asset_compression": {},
+        }[key]
+
+    mocker.patch("covalent_dispatcher._object_store.local.get_config", get_config)
+    return LocalProvider()
+
+
+def test_link_and_release(tmp_path):
+    """Test that identical files share a blob until they are released"""
+    cas = ContentAddressedStore(tmp_path / "objects")
+    paths = [tmp_path / f"file_{i}" for i in range(3)]
+    for path in paths:
+        path.write_bytes(b"hello")
+
+    assert not cas.link(paths[0], "abcd")
+    assert cas.link(paths[1], "abcd")
+    assert cas.link(paths[1], "abcd")
+    assert cas.refcount("abcd") == 2
+    assert os.path.samefile(paths[0], paths[1])
+
+    # A different codec is a different blob
+    assert not cas.link(paths[2], "abcd", "gzip")
+    assert cas.refcount("abcd", "gzip") == 1
+
+    for path in paths:
+        path.unlink()
+    assert cas.release("abcd")
+    assert cas.refcount("abcd") == 0
+    assert cas.collect_garbage() == 1
+    assert cas.collect_garbage() == 0
+
+
+def test_store_file_deduplicates(dedup_store, tmp_path):
+    """Test that storing identical data reuses the same file"""
+    for node_id in range(2):
+        os.makedirs(tmp_path / f"node_{node_id}")
+        digest, size = dedup_store.store_file(str(tmp_path / f"node_{node_id}"), "value.pkl", [1])
+
+    assert os.path.samefile(tmp_path / "node_0" / "value.pkl", tmp_path / "node_1" / "value.pkl")
+    assert dedup_store.cas.refcount(digest.hexdigest) == 2
+
+    # Overwriting one asset must not affect the other
+    dedup_store.store_file(str(tmp_path / "node_1"), "value.pkl", [2])
+    assert dedup_store.load_file(str(tmp_path / "node_0"), "value.pkl") == [1]
+    assert dedup_store.load_file(str(tmp_path / "node_1"), "value.pkl") == [2]
+    assert dedup_store.cas.refcount(digest.hexdigest) == 1
+
+    # Files rewritten in place must first be detached
+    dedup_store.detach_file(str(tmp_path / "node_0"), "value.pkl")
+    assert not os.path.exists(tmp_path / "node_0" / "value.pkl")
+    dedup_store.release(digest.hexdigest)
+    assert dedup_store.cas.refcount(digest.hexdigest) == 0
+
+
+def test_link_blob(dedup_store, tmp_path):
+    """Test populating an asset file from a blob with a known digest"""
+    os.makedirs(tmp_path / "node_0")
+    os.makedirs(tmp_path / "node_1")
+    digest, size = dedup_store.store_file(str(tmp_path / "node_0"), "value.pkl", [1])
+
+    assert dedup_store.link_blob(str(tmp_path / "node_1"), "value.pkl", "sha", digest.hexdigest)
+    assert dedup_store.load_file(str(tmp_path / "node_1"), "value.pkl") == [1]
+    assert dedup_store.cas.refcount(digest.hexdigest) == 2
+
+    assert not dedup_store.link_blob(str(tmp_path / "node_1"), "output.pkl", "sha1", "0" * 40)
+    assert not dedup_store.link_blob(
+        str(tmp_path / "node_1"), "output.pkl", "md5", digest.hexdigest
+    )
+    assert not dedup_store.link_blob(str(tmp_path / "node_1"), "output.pkl", None, None)
+
+
+def test_unlink_blobs_on_error(dedup_store, tmp_path):
+    """Test that files linked to blobs are removed if the import linking them fails"""
+    os.makedirs(tmp_path / "node_0")
+    os.makedirs(tmp_path / "node_1")
+    digest, size = dedup_store.store_file(str(tmp_path / "node_0"), "value.pkl", [1])
+
+    with pytest.raises(RuntimeError):
+        with dedup_store.unlink_blobs_on_error():
+            assert dedup_store.link_blob(
+                str(tmp_path / "node_1"), "value.pkl", "sha1", digest.hexdigest
+            )
+            raise RuntimeError("Import failed")
+
+    assert not os.path.exists(tmp_path / "node_1" / "value.pkl")
+    assert dedup_store.cas.refcount(digest.hexdigest) == 1
+
+    with dedup_store.unlink_blobs_on_error():
+        dedup_store.link_blob(str(tmp_path / "node_1"), "value.pkl", "sha1", digest.hexdigest)
+    assert dedup_store.load_file(str(tmp_path / "node_1"), "value.pkl") == [1]
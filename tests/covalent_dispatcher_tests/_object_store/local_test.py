@@ -16,6 +16,8 @@
 
 """Tests for local object store provider"""
 
+import hashlib
+import os
 import tempfile
 
 import pytest
@@ -68,3 +70,71 @@ def test_store_and_load_file():
         data = b"test"
         local_store.store_file(storage_path=temp_dir, filename="pickle.mdb", data=data)
         assert local_store.load_file(storage_path=temp_dir, filename="pickle.mdb") == data
+
+
+def test_store_and_load_tobj_with_buffers():
+    """Test that TObj buffers are mapped from the file and survive overwrites."""
+    import os
+
+    import numpy as np
+
+    from covalent._workflow.transportable_object import TransportableObject
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        array = np.arange(10000, dtype=np.float64)
+        tobj = TransportableObject(array)
+        digest, size = local_store.store_file(temp_dir, "value.tobj", tobj)
+        assert size == len(tobj.serialize())
+        assert digest.hexdigest == local_store.digest(temp_dir, "value.tobj").hexdigest
+
+        loaded = local_store.load_file(storage_path=temp_dir, filename="value.tobj")
+        assert loaded == tobj
+        loaded_array = loaded.get_deserialized()
+        assert np.array_equal(loaded_array, array)
+
+        # Overwriting the asset must not affect the previously loaded object
+        local_store.store_file(temp_dir, "value.tobj", TransportableObject(None))
+        assert local_store.load_file(temp_dir, "value.tobj").get_deserialized() is None
+        assert np.array_equal(loaded_array, array)
+        assert os.listdir(temp_dir) == ["value.tobj"]
+
+
+@pytest.mark.parametrize("codec", ["gzip", "zstd", "lz4"])
+def test_store_and_load_compressed_files(codec, mocker):
+    """Test that compressed assets are transparently decompressed."""
+    from covalent._workflow.transportable_object import TransportableObject
+    from covalent_dispatcher._object_store import compression
+
+    if not compression.is_available(codec):
+        pytest.skip(f"{codec} is not installed")
+
+    mocker.patch(
+        "covalent_dispatcher._object_store.local.get_config",
+        return_value={"pkl": codec, "log": codec, "json": "none"},
+    )
+    assert local_store.codec_for("value.pkl") == codec
+    assert local_store.codec_for("stdout.log") == codec
+    assert local_store.codec_for("metadata.json") is None
+    assert local_store.codec_for("qelectron.mdb") is None
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for filename, data in [
+            ("value.pkl", list(range(1000))),
+            ("stdout.log", "Hello\n" * 1000),
+            ("metadata.json", {"a": [1, 2, 3]}),
+            ("output.tobj", TransportableObject([1, 2, 3])),
+        ]:
+            digest, size = local_store.store_file(temp_dir, filename, data)
+            raw_digest = local_store.digest(temp_dir, filename)
+
+            # Digest and size describe the uncompressed data
+            c_digest, c_size = local_store.store_file(temp_dir, filename, data, codec=codec)
+            assert (c_digest, c_size) == (digest, size)
+            assert compression.detect_codec(f"{temp_dir}/{filename}") == codec
+            assert local_store.digest(temp_dir, filename) != raw_digest
+            assert local_store.load_file(temp_dir, filename) == data
+
+            with local_store.uncompressed_copy(temp_dir, filename) as path:
+                with open(path, "rb") as f:
+                    assert hashlib.sha1(f.read()).hexdigest() == digest.hexdigest
+            assert os.listdir(temp_dir).count(filename) == 1
@@ -16,8 +16,10 @@
 
 """Unit tests for the FastAPI app."""
 
+import asyncio
 import json
 import tempfile
+import threading
 from contextlib import contextmanager
 from typing import Generator
 from unittest.mock import MagicMock
@@ -30,8 +32,14 @@ from sqlalchemy.orm import Session, declarative_base, sessionmaker
 import covalent as ct
 from covalent._dispatcher_plugins.local import LocalDispatcher
 from covalent._shared_files.util_classes import RESULT_STATUS
+from covalent_dispatcher._core import dispatcher as core_dispatcher
 from covalent_dispatcher._db.dispatchdb import DispatchDB
-from covalent_dispatcher._service.app import _try_get_result_object, cancel_all_with_status
+from covalent_dispatcher._service.app import (
+    _generate_events,
+    _try_get_result_object,
+    cancel_all_with_status,
+    collect_asset_garbage,
+)
 from covalent_ui.app import fastapi_app as fast_app
 
 DISPATCH_ID = "f34671d1-48f2-41ce-89d9-9a8cb5c60e5d"
@@ -171,6 +179,28 @@ async def test_cancel_exception(mocker, client):
         cancel_running_dispatch_mock.assert_called_once_with(DISPATCH_ID, [])
 
 
+def test_lifespan_collects_asset_garbage(mocker):
+    """Test that unreferenced asset blobs are removed when the server starts."""
+
+    collected = threading.Event()
+    mock_store = mocker.patch("covalent_dispatcher._service.app.local_store")
+    mock_store.cas.collect_garbage.side_effect = lambda: collected.set() or 0
+
+    with TestClient(fast_app):
+        assert collected.wait(timeout=10)
+
+
+def test_collect_asset_garbage(mocker):
+    """Test that failing to collect asset blobs doesn't raise."""
+
+    mock_store = mocker.patch("covalent_dispatcher._service.app.local_store")
+    collect_asset_garbage()
+    mock_store.cas.collect_garbage.assert_called_once_with()
+
+    mock_store.cas.collect_garbage.side_effect = PermissionError("denied")
+    collect_asset_garbage()
+
+
 def test_db_path_get_config(mocker):
     """Test that the db path is retrieved from the config.""" ""
     get_config_mock = mocker.patch("covalent_dispatcher._db.dispatchdb.get_config")
@@ -305,6 +335,69 @@ def test_export_result_bad_dispatch_id(mocker, app, client, mock_manifest):
     assert resp.status_code == 404
 
 
+def test_stream_events_completed_dispatch(mocker, app, client):
+    dispatch_id = "test_stream_events"
+    mock_result_object = MagicMock()
+    mock_result_object.get_value = MagicMock(return_value=str(RESULT_STATUS.COMPLETED))
+    mocker.patch(
+        "covalent_dispatcher._service.app._try_get_result_object", return_value=mock_result_object
+    )
+    mocker.patch("covalent_dispatcher._service.app.cancel_all_with_status")
+    resp = client.get(f"/api/v2/dispatches/{dispatch_id}/events")
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    assert resp.text == (
+        "event: dispatch\n"
+        'data: {"dispatch_id": "test_stream_events", "node_id": null, "status": "COMPLETED"}\n\n'
+    )
+
+
+def test_stream_events_timeout(mocker, app, client):
+    dispatch_id = "test_stream_events"
+    mock_result_object = MagicMock()
+    mock_result_object.get_value = MagicMock(return_value=str(RESULT_STATUS.RUNNING))
+    mocker.patch(
+        "covalent_dispatcher._service.app._try_get_result_object", return_value=mock_result_object
+    )
+    mocker.patch("covalent_dispatcher._service.app.cancel_all_with_status")
+    resp = client.get(f"/api/v2/dispatches/{dispatch_id}/events", params={"timeout": 0.1})
+    assert resp.status_code == 200
+    assert resp.text == ""
+
+
+def test_stream_events_bad_dispatch_id(mocker, app, client):
+    dispatch_id = "test_stream_events"
+    mocker.patch("covalent_dispatcher._service.app._try_get_result_object", return_value=None)
+    mocker.patch("covalent_dispatcher._service.app.cancel_all_with_status")
+    resp = client.get(f"/api/v2/dispatches/{dispatch_id}/events")
+    assert resp.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_generate_events(mocker):
+    dispatch_id = "test_generate_events"
+    mock_result_object = MagicMock()
+    mock_result_object.get_value = MagicMock(return_value=str(RESULT_STATUS.RUNNING))
+    mocker.patch(
+        "covalent_dispatcher._service.app._try_get_result_object", return_value=mock_result_object
+    )
+
+    events = _generate_events(dispatch_id, 10)
+    first_event = asyncio.create_task(events.__anext__())
+    while dispatch_id not in core_dispatcher._status_queues:
+        await asyncio.sleep(0.01)
+
+    core_dispatcher._publish_status(dispatch_id, 1, RESULT_STATUS.COMPLETED)
+    core_dispatcher._publish_status(dispatch_id, None, RESULT_STATUS.COMPLETED)
+
+    assert (await first_event).startswith("event: node\n")
+    assert [event async for event in events] == [
+        "event: dispatch\n"
+        'data: {"dispatch_id": "test_generate_events", "node_id": null, "status": "COMPLETED"}\n\n'
+    ]
+    assert dispatch_id not in core_dispatcher._status_queues
+
+
 def test_try_get_result_object(mocker, app, client, mock_manifest):
     dispatch_id = "test_try_get_result_object"
     mock_result_object = MagicMock()
@@ -16,11 +16,13 @@
 
 """Unit tests for the FastAPI asset endpoints"""
 
+import hashlib
 import tempfile
 from contextlib import contextmanager
 from typing import Generator
 from unittest.mock import MagicMock
 
+import cloudpickle
 import pytest
 from fastapi import HTTPException
 from fastapi.testclient import TestClient
@@ -28,8 +30,10 @@ from sqlalchemy import Column, Integer, String, create_engine
 from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
 from covalent._workflow.transportable_object import TransportableObject
+from covalent_dispatcher._object_store.local import local_store
 from covalent_dispatcher._service.assets import (
     _generate_file_slice,
+    _generate_tobj_pickle,
     _get_tobj_pickle_offsets,
     _get_tobj_string_offsets,
     get_cached_result_object,
@@ -219,6 +223,7 @@ def test_get_node_asset_rep(
     mocker.patch(
         "covalent_dispatcher._service.assets._get_tobj_pickle_offsets", return_value=(6, 12)
     )
+    mocker.patch("covalent_dispatcher._service.assets._read_tobj_header", return_value={})
 
     params = {"representation": rep}
     mocker.patch("covalent_dispatcher._service.app.cancel_all_with_status")
@@ -358,6 +363,7 @@ def test_get_lattice_asset_rep(
     mocker.patch(
         "covalent_dispatcher._service.assets._get_tobj_pickle_offsets", return_value=(6, 12)
     )
+    mocker.patch("covalent_dispatcher._service.assets._read_tobj_header", return_value={})
     mocker.patch("covalent_dispatcher._service.app.cancel_all_with_status")
 
     params = {"representation": rep}
@@ -497,6 +503,7 @@ def test_get_dispatch_asset_rep(
     mocker.patch(
         "covalent_dispatcher._service.assets._get_tobj_pickle_offsets", return_value=(6, 12)
     )
+    mocker.patch("covalent_dispatcher._service.assets._read_tobj_header", return_value={})
     mocker.patch("covalent_dispatcher._service.app.cancel_all_with_status")
 
     params = {"representation": rep}
@@ -553,9 +560,100 @@ def test_put_node_asset(test_db, mocker, client, mock_result_object):
                 headers=headers,
             )
         mock_node = mock_result_object.lattice.transport_graph.get_node(node_id)
-        mock_node.update_assets.assert_called()
         assert resp.status_code == 200
 
+        # The digest is recorded once the data is stored
+        updates = mock_node.update_assets.call_args_list[0].kwargs["updates"]
+        assert "digest" not in updates[key]
+        updates = mock_node.update_assets.call_args_list[-1].kwargs["updates"]
+        assert updates[key]["digest"] == "0bf"
+
+
+def test_put_node_asset_records_digest(test_db, mocker, client, mock_result_object):
+    """
+    Test that node assets uploaded without a digest record their checksum
+    """
+
+    key = "output"
+    node_id = 0
+    dispatch_id = "test_put_node_asset_records_digest"
+
+    mocker.patch("covalent_dispatcher._service.assets.workflow_db", test_db)
+    mocker.patch(
+        "covalent_dispatcher._service.assets.get_result_object", return_value=mock_result_object
+    )
+
+    with tempfile.NamedTemporaryFile("w") as writer:
+        writer.write(f"{dispatch_id}")
+        writer.flush()
+
+        with open(writer.name, "rb") as reader:
+            resp = client.put(
+                f"/api/v2/dispatches/{dispatch_id}/electrons/{node_id}/assets/{key}",
+                data=reader,
+            )
+        assert resp.status_code == 200
+
+        mock_node = mock_result_object.lattice.transport_graph.get_node(node_id)
+        updates = mock_node.update_assets.call_args.kwargs["updates"]
+        assert updates[key]["digest"] == hashlib.sha1(dispatch_id.encode()).hexdigest()
+
+
+def test_resume_node_asset_upload(test_db, mocker, client, mock_result_object, tmp_path):
+    """
+    Test resuming an interrupted upload of a node asset
+    """
+
+    key = "output"
+    node_id = 0
+    dispatch_id = "test_resume_node_asset_upload"
+    url = f"/api/v2/dispatches/{dispatch_id}/electrons/{node_id}/assets/{key}"
+
+    dest_path = tmp_path / "output.tobj"
+    mock_node = mock_result_object.lattice.transport_graph.get_node(node_id)
+    mock_asset = mock_node.get_asset.return_value
+    mock_asset.internal_uri = f"file://{dest_path}"
+    mock_asset.digest_alg = mock_asset.digest = None
+
+    def update_assets(updates, session):
+        for attr, value in updates[key].items():
+            setattr(mock_asset, attr, value)
+
+    mock_node.update_assets.side_effect = update_assets
+    mock_digest = mocker.spy(local_store, "digest")
+
+    mocker.patch("covalent_dispatcher._service.assets.workflow_db", test_db)
+    mocker.patch(
+        "covalent_dispatcher._service.assets.get_result_object", return_value=mock_result_object
+    )
+
+    # Part of the upload was received before it was interrupted
+    (tmp_path / "output.tobj.tmp").write_bytes(b"hello wor")
+
+    resp = client.head(url)
+    assert resp.status_code == 200
+    assert resp.headers["Upload-Offset"] == "9"
+    assert "Digest" not in resp.headers
+
+    resp = client.put(url, content=b"world", headers={"Upload-Offset": "6"})
+    assert resp.status_code == 200
+    assert dest_path.read_bytes() == b"hello world"
+
+    updates = mock_node.update_assets.call_args_list[0].kwargs["updates"]
+    assert updates[key]["size"] == 11
+    updates = mock_node.update_assets.call_args_list[-1].kwargs["updates"]
+    assert updates[key]["digest"] == hashlib.sha1(b"hello world").hexdigest()
+
+    resp = client.head(url)
+    assert resp.headers["Upload-Offset"] == "0"
+    assert resp.headers["Digest-Alg"] == "sha1"
+    assert resp.headers["Digest"] == hashlib.sha1(b"hello world").hexdigest()
+    mock_digest.assert_not_called()
+
+    # Resuming past the received data fails
+    resp = client.put(url, content=b"world", headers={"Upload-Offset": "6"})
+    assert resp.status_code == 400
+
 
 def test_put_node_asset_bad_dispatch_id(mocker, client):
     """
@@ -704,7 +802,31 @@ def test_get_pickle_offsets():
 
         start, end = _get_tobj_pickle_offsets(f"file://{write_file.name}")
 
-        assert data[start:].decode("utf-8") == tobj.get_serialized()
+        assert data[start:] == tobj._object
+
+
+def test_generate_tobj_pickle_with_buffers(mocker):
+    """Test that the picklebytes of archives with out-of-band buffers are self-contained."""
+    import pickle
+
+    import numpy as np
+
+    arr = np.arange(1000, dtype=float)
+    tobj = TransportableObject({"x": arr, "y": "test_generate_tobj_pickle_with_buffers"})
+    assert tobj._buffers
+
+    data = tobj.serialize()
+    with tempfile.NamedTemporaryFile("wb") as write_file:
+        write_file.write(data)
+        write_file.flush()
+
+        mock_loads = mocker.spy(cloudpickle, "loads")
+        picklebytes = b"".join(_generate_tobj_pickle(f"file://{write_file.name}"))
+        mock_loads.assert_not_called()
+
+    obj = pickle.loads(picklebytes)
+    assert np.array_equal(obj["x"], arr)
+    assert obj["y"] == "test_generate_tobj_pickle_with_buffers"
 
 
 def test_generate_partial_file_slice():
@@ -732,6 +854,26 @@ def test_generate_whole_file_slice():
         assert next(gen) == data
 
 
+def test_serve_compressed_tobj_ranges():
+    """Test that byte ranges refer to the uncompressed TObj."""
+    import gzip
+
+    tobj = TransportableObject("test_serve_compressed_tobj_ranges")
+
+    data = tobj.serialize()
+    with tempfile.NamedTemporaryFile("wb") as write_file:
+        write_file.write(gzip.compress(data))
+        write_file.flush()
+        file_url = f"file://{write_file.name}"
+
+        start, end = _get_tobj_string_offsets(file_url)
+        string_bytes = b"".join(_generate_file_slice(file_url, start, end, 4))
+        assert string_bytes.decode("utf-8") == tobj.object_string
+
+        start, end = _get_tobj_pickle_offsets(file_url)
+        assert b"".join(_generate_file_slice(file_url, start, end)) == tobj._object
+
+
 def test_get_cached_result_obj(mocker, test_db):
     mocker.patch("covalent_dispatcher._service.assets.workflow_db", test_db)
     mocker.patch("covalent_dispatcher._service.assets.get_result_object", side_effect=KeyError())
@@ -27,6 +27,7 @@ from requests.exceptions import ConnectionError, HTTPError
 import covalent as ct
 from covalent._dispatcher_plugins.local import LocalDispatcher, get_redispatch_request_body_v2
 from covalent._results_manager.result import Result
+from covalent._shared_files.schemas.asset import AssetSchema
 from covalent._shared_files.utils import format_server_url
 
 
@@ -429,6 +430,91 @@ def test_upload_assets(mocker):
         assert mock_put.call_count == num_assets
 
 
+def test_upload_assets_resumes_interrupted_upload(mocker, tmp_path):
+    """Test that interrupted uploads resume from the offset received by the server"""
+
+    path = tmp_path / "asset.pkl"
+    path.write_bytes(b"0123456789" * 10)
+    asset = AssetSchema(
+        size=100,
+        uri=f"file://{path}",
+        remote_uri="http://localhost:48008/api/v2/dispatches/test/lattice/assets/dummy",
+    )
+
+    head_resp = Response()
+    head_resp.status_code = 200
+    head_resp.headers["Upload-Offset"] = "60"
+    put_resp = Response()
+    put_resp.status_code = 200
+
+    mock_head = mocker.patch(
+        "covalent._api.apiclient.requests.Session.head", return_value=head_resp
+    )
+    mock_put = mocker.patch(
+        "covalent._api.apiclient.requests.Session.put",
+        side_effect=[ConnectionError(), put_resp],
+    )
+
+    LocalDispatcher._upload([asset])
+
+    mock_head.assert_called_once_with(asset.remote_uri)
+    assert mock_put.call_count == 2
+    headers = mock_put.call_args.kwargs["headers"]
+    assert headers["Upload-Offset"] == "60"
+    assert headers["Content-Length"] == "40"
+
+
+def test_upload_packed_asset(mocker, tmp_path):
+    """Test that only the byte range of a packed asset is uploaded"""
+
+    path = tmp_path / "node_assets.pack"
+    path.write_bytes(b"0123456789" * 10)
+    asset = AssetSchema(
+        size=60,
+        uri=f"file://{path}#offset=20&size=60",
+        remote_uri="http://localhost:48008/api/v2/dispatches/test/lattice/assets/dummy",
+    )
+    put_resp = Response()
+    put_resp.status_code = 200
+    mock_put = mocker.patch("covalent._api.apiclient.requests.Session.put", return_value=put_resp)
+
+    LocalDispatcher._upload([asset])
+
+    assert mock_put.call_args.kwargs["headers"]["Content-Length"] == "60"
+    assert mock_put.call_args.kwargs["data"] == (b"0123456789" * 10)[20:80]
+
+    # Local servers receive a copy of the asset
+    dest_path = tmp_path / "value.tobj"
+    asset.remote_uri = f"file://{dest_path}"
+    LocalDispatcher._upload([asset])
+    assert dest_path.read_bytes() == (b"0123456789" * 10)[20:80]
+
+
+def test_upload_assets_skips_uploaded_assets(mocker, tmp_path):
+    """Test that resumed uploads skip assets already stored by the server"""
+
+    path = tmp_path / "asset.pkl"
+    path.write_bytes(b"0123456789" * 10)
+    asset = AssetSchema(
+        digest_alg="sha",
+        digest="abcdef",
+        size=100,
+        uri=f"file://{path}",
+        remote_uri="http://localhost:48008/api/v2/dispatches/test/lattice/assets/dummy",
+    )
+
+    head_resp = Response()
+    head_resp.status_code = 200
+    head_resp.headers.update({"Upload-Offset": "0", "Digest-Alg": "sha1", "Digest": "abcdef"})
+
+    mocker.patch("covalent._api.apiclient.requests.Session.head", return_value=head_resp)
+    mock_put = mocker.patch("covalent._api.apiclient.requests.Session.put")
+
+    LocalDispatcher._upload([asset], resume=True)
+
+    mock_put.assert_not_called()
+
+
 def test_get_redispatch_request_body_norebuild(mocker):
     """Test constructing the request body for redispatch"""
 
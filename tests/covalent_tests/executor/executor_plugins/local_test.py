@@ -316,12 +316,10 @@ def test_run_task_group(mocker):
         mock_resp.content = resources[url]
         return mock_resp
 
-    def mock_req_post(url, files):
-        resources[url] = files["asset_file"].read()
-
-    mocker.patch("requests.get", mock_req_get)
-    mocker.patch("requests.post", mock_req_post)
-    mock_put = mocker.patch("requests.put")
+    mock_session = MagicMock()
+    mock_session.get = mock_req_get
+    mocker.patch("covalent.executor.utils.wrappers._get_session", return_value=mock_session)
+    mock_put = mock_session.put
     task_group_metadata = {
         "dispatch_id": dispatch_id,
         "node_ids": [node_id],
@@ -436,12 +434,9 @@ def test_run_task_group_exception(mocker):
         mock_resp.content = resources[url]
         return mock_resp
 
-    def mock_req_post(url, files):
-        resources[url] = files["asset_file"].read()
-
-    mocker.patch("requests.get", mock_req_get)
-    mocker.patch("requests.post", mock_req_post)
-    mocker.patch("requests.put")
+    mock_session = MagicMock()
+    mock_session.get = mock_req_get
+    mocker.patch("covalent.executor.utils.wrappers._get_session", return_value=mock_session)
     task_group_metadata = {
         "dispatch_id": dispatch_id,
         "node_ids": [node_id],
@@ -472,6 +467,66 @@ def test_run_task_group_exception(mocker):
         assert summary["exception_occurred"] is True
 
 
+def test_run_task_group_in_memory_handoff(mocker, tmp_path):
+    """Test that outputs are passed between tasks of a group without downloads"""
+
+    def task(x, y):
+        return x + y
+
+    dispatch_id = "test_run_task_group_in_memory_handoff"
+    server_url = "http://localhost:48008"
+    base_url = f"{server_url}/api/v2/dispatches/{dispatch_id}/electrons"
+
+    ser_task = serialize_node_asset(TransportableObject(task), "function")
+    ser_hooks = serialize_node_asset({"deps": {}, "call_before": [], "call_after": []}, "hooks")
+    resources = {
+        f"{base_url}/1/assets/function": ser_task,
+        f"{base_url}/1/assets/hooks": ser_hooks,
+        f"{base_url}/2/assets/function": ser_task,
+        f"{base_url}/2/assets/hooks": ser_hooks,
+        f"{base_url}/0/assets/output": serialize_node_asset(TransportableObject(1), "output"),
+    }
+    requested = []
+
+    def mock_req_get(url, stream):
+        requested.append(url)
+        mock_resp = MagicMock()
+        mock_resp.content = resources[url]
+        return mock_resp
+
+    mock_session = MagicMock()
+    mock_session.get = mock_req_get
+    mocker.patch("covalent.executor.utils.wrappers._get_session", return_value=mock_session)
+    mock_put = mock_session.put
+
+    output_uris = [
+        tuple(str(tmp_path / f"{name}_{node_id}") for name in ("result", "out", "err", "qdb"))
+        for node_id in (1, 2)
+    ]
+    run_task_group(
+        task_specs=[
+            TaskSpec(function_id=1, args_ids=[0, 0], kwargs_ids={}).model_dump(),
+            TaskSpec(function_id=2, args_ids=[1], kwargs_ids={"y": 0}).model_dump(),
+        ],
+        output_uris=output_uris,
+        results_dir=str(tmp_path),
+        task_group_metadata={"dispatch_id": dispatch_id, "node_ids": [1, 2], "task_group_id": 1},
+        server_url=server_url,
+    )
+
+    with open(output_uris[1][0], "rb") as f:
+        assert TransportableObject.deserialize(f.read()).get_deserialized() == 3
+    assert f"{base_url}/1/assets/output" not in requested
+
+    # The terminal status of each task is reported after its artifacts
+    put_urls = [c.args[0] for c in mock_put.call_args_list]
+    for node_id in (1, 2):
+        job_index = put_urls.index(f"{base_url}/{node_id}/job")
+        for key in ("output", "stdout", "stderr"):
+            assert put_urls.index(f"{base_url}/{node_id}/assets/{key}") < job_index
+    assert put_urls[-1] == f"{base_url}/2/job"
+
+
 # Mocks for external dependencies
 @pytest.fixture
 def mock_os_path_join():
@@ -708,3 +763,114 @@ async def test_receive(mocker):
         task_group_metadata,
         test_data,
     )
+
+
+def test_wrapper_session_is_per_process(mocker):
+    """Test that the keep-alive session is reused until the process forks"""
+    from covalent.executor.utils import wrappers
+
+    session = wrappers._get_session()
+    pool = wrappers._get_transfer_pool()
+    assert wrappers._get_session() is session
+    assert wrappers._get_transfer_pool() is pool
+
+    mocker.patch("covalent.executor.utils.wrappers.os.getpid", return_value=-1)
+    assert wrappers._get_session() is not session
+    assert wrappers._get_transfer_pool() is not pool
+
+
+def test_wrapper_transfers_init_once_across_threads(mocker):
+    """Test that concurrent task groups in one process share a single transfer pool"""
+    from concurrent.futures import ThreadPoolExecutor as Pool
+
+    from covalent.executor.utils import wrappers
+
+    mocker.patch("covalent.executor.utils.wrappers.os.getpid", return_value=-2)
+    mock_pool = mocker.patch("covalent.executor.utils.wrappers.ThreadPoolExecutor")
+
+    with Pool(max_workers=8) as threads:
+        pools = list(threads.map(lambda _: wrappers._get_transfer_pool(), range(32)))
+
+    mock_pool.assert_called_once()
+    assert all(pool is pools[0] for pool in pools)
+
+
+def test_run_task_group_caches_functions_and_deps(mocker, tmp_path):
+    """Test that tasks sharing a function reuse it and only install deps once"""
+    from covalent.executor.utils import wrappers
+
+    def task(x):
+        return x + 1
+
+    dispatch_id = "test_run_task_group_caches_functions_and_deps"
+    server_url = "http://localhost:48008"
+    base_url = f"{server_url}/api/v2/dispatches/{dispatch_id}/electrons"
+
+    deps_file = tmp_path / "deps.txt"
+    hooks = {
+        "deps": {"bash": ct.DepsBash([f"echo installed >> {deps_file}"]).to_dict()},
+        "call_before": [],
+        "call_after": [],
+    }
+    ser_task = serialize_node_asset(TransportableObject(task), "function")
+    ser_hooks = serialize_node_asset(hooks, "hooks")
+    resources = {
+        f"{base_url}/0/assets/output": serialize_node_asset(TransportableObject(0), "output")
+    }
+    for node_id in (1, 2, 3):
+        resources[f"{base_url}/{node_id}/assets/function"] = ser_task
+        resources[f"{base_url}/{node_id}/assets/hooks"] = ser_hooks
+
+    def mock_req_get(url, stream):
+        mock_resp = MagicMock()
+        mock_resp.content = resources[url]
+        return mock_resp
+
+    mock_session = MagicMock()
+    mock_session.get = mock_req_get
+    mocker.patch("covalent.executor.utils.wrappers._get_session", return_value=mock_session)
+    mocker.patch("covalent.executor.utils.wrappers._function_cache", wrappers._LRUCache(2))
+    mocker.patch("covalent.executor.utils.wrappers._hooks_cache", wrappers._LRUCache(2))
+    mocker.patch("covalent.executor.utils.wrappers._satisfied_deps", wrappers._LRUCache(2))
+    load_spy = mocker.spy(wrappers, "deserialize_node_asset")
+
+    output_uris = [
+        tuple(str(tmp_path / f"{name}_{node_id}") for name in ("result", "out", "err", "qdb"))
+        for node_id in (1, 2, 3)
+    ]
+    run_task_group(
+        task_specs=[
+            TaskSpec(function_id=node_id, args_ids=[node_id - 1], kwargs_ids={}).model_dump()
+            for node_id in (1, 2, 3)
+        ],
+        output_uris=output_uris,
+        results_dir=str(tmp_path),
+        task_group_metadata={
+            "dispatch_id": dispatch_id,
+            "node_ids": [1, 2, 3],
+            "task_group_id": 1,
+        },
+        server_url=server_url,
+    )
+
+    with open(output_uris[2][0], "rb") as f:
+        assert TransportableObject.deserialize(f.read()).get_deserialized() == 3
+
+    assert deps_file.read_text() == "installed\n"
+    loaded_keys = [c.args[1] for c in load_spy.call_args_list]
+    assert loaded_keys.count("function") == 1
+    # Hooks are prepared once with and once without the pip and bash deps
+    assert loaded_keys.count("hooks") == 2
+
+
+def test_lru_cache_eviction():
+    """Test the worker-local LRU cache"""
+    from covalent.executor.utils.wrappers import _LRUCache
+
+    cache = _LRUCache(2)
+    assert cache.get_or_load("a", lambda: 1) == 1
+    cache.add("b", 2)
+    assert cache.get_or_load("a", lambda: 3) == 1
+    cache.add("c", 3)
+    assert "a" in cache
+    assert "b" not in cache
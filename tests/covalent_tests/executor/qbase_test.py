@@ -0,0 +1,143 @@
+# Copyright 2023 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the pool-based quantum executors."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pennylane as qml
+import pytest
+
+from covalent._shared_files.qinfo import QElectronInfo
+from covalent.executor import qbase
+from covalent.executor.qbase import (
+    BaseProcessPoolQExecutor,
+    BaseThreadPoolQExecutor,
+    QCResult,
+    get_chunks,
+    get_thread_pool,
+    get_worker_device,
+)
+
+QELECTRON_INFO = QElectronInfo(
+    name="circuit",
+    device_name="default.qubit",
+    device_import_path="pennylane.devices.default_qubit:DefaultQubit",
+    device_wires=1,
+    pennylane_active_return=True,
+)
+
+
+def make_qscript(x):
+    return qml.tape.QuantumScript([qml.RX(x, wires=0)], [qml.expval(qml.PauliZ(0))])
+
+
+def test_get_chunks():
+    """Test that circuits are split into contiguous chunks of equal size."""
+
+    assert get_chunks(range(5), 2) == [[0, 1, 2], [3, 4]]
+    assert get_chunks(range(2), 4) == [[0], [1]]
+    assert get_chunks([], 4) == []
+
+
+def test_get_worker_device():
+    """Test that devices are reused by a worker, but not shared between workers."""
+
+    dev = get_worker_device("default.qubit", 1, None)
+    assert get_worker_device("default.qubit", 1, None) is dev
+    assert get_worker_device("default.qubit", 1, [10, 10]) is not dev
+    assert get_worker_device("default.qubit", 2, None) is not dev
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        assert pool.submit(get_worker_device, "default.qubit", 1, None).result() is not dev
+
+
+@pytest.mark.parametrize(
+    "executor",
+    [
+        BaseThreadPoolQExecutor(device="default.qubit", num_threads=2),
+        BaseProcessPoolQExecutor(device="default.qubit", num_processes=2),
+    ],
+)
+def test_pool_executors_run_chunks(mocker, executor):
+    """Test that pool executors run circuits in chunks and return results in order."""
+
+    executor.qelectron_info = QELECTRON_INFO
+    qscripts = [make_qscript(0.1 * i) for i in range(5)]
+    expected_results = qml.execute(qscripts, qml.device("default.qubit", wires=1), None)
+
+    mock_run_chunk = mocker.spy(qbase, "run_chunk")
+
+    futures = executor.batch_submit(qscripts)
+    assert len(futures) == len(qscripts)
+
+    result_objs = executor.batch_get_results(futures)
+    assert [result_obj.results[0] for result_obj in result_objs] == pytest.approx(expected_results)
+    for result_obj in result_objs:
+        assert result_obj.metadata["device_name"] == "default.qubit"
+        assert result_obj.metadata["executor_name"] == executor.__class__.__name__
+        assert result_obj.execution_time > 0
+
+    if isinstance(executor, BaseThreadPoolQExecutor):
+        assert mock_run_chunk.call_count == 2
+
+
+class PluginQExecutor(BaseThreadPoolQExecutor):
+    """Submits one task per circuit, like the executors in `quantum_plugins`."""
+
+    def batch_submit(self, qscripts_list):
+        pool = get_thread_pool(self.num_threads)
+        futures = []
+        for qscript in qscripts_list:
+            dev = qml.device(self.device, wires=self.qelectron_info.device_wires)
+            result_obj = QCResult.with_metadata(device_name=dev.short_name, executor=self)
+            futures.append(pool.submit(self.run_circuit, qscript, dev, result_obj))
+
+        return futures
+
+
+class CustomRunQExecutor(BaseThreadPoolQExecutor):
+    """Overrides how a single circuit is run."""
+
+    def run_circuit(self, qscript, device, result_obj):
+        result_obj = super().run_circuit(qscript, device, result_obj)
+        result_obj.metadata["custom"] = True
+        return result_obj
+
+
+def test_plugin_batch_submit():
+    """Test that results are gathered from plain futures returned by plugins."""
+
+    executor = PluginQExecutor(num_threads=2)
+    executor.qelectron_info = QELECTRON_INFO
+    qscripts = [make_qscript(0.1 * i) for i in range(3)]
+    expected_results = qml.execute(qscripts, qml.device("default.qubit", wires=1), None)
+
+    result_objs = executor.batch_get_results(executor.batch_submit(qscripts))
+    assert [result_obj.results[0] for result_obj in result_objs] == pytest.approx(expected_results)
+
+
+def test_run_circuit_override():
+    """Test that chunked submission still runs circuits through `run_circuit` overrides."""
+
+    executor = CustomRunQExecutor(num_threads=2)
+    executor.qelectron_info = QELECTRON_INFO
+    qscripts = [make_qscript(0.1 * i) for i in range(3)]
+    expected_results = qml.execute(qscripts, qml.device("default.qubit", wires=1), None)
+
+    result_objs = executor.batch_get_results(executor.batch_submit(qscripts))
+    assert [result_obj.results[0] for result_obj in result_objs] == pytest.approx(expected_results)
+    assert all(result_obj.metadata["custom"] for result_obj in result_objs)
@@ -0,0 +1,68 @@
+# Copyright 2023 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" Tests for the in-process qelectron client """
+
+
+from covalent.quantum.qclient.local_client import LocalQClient
+from covalent.quantum.qserver.core import QServer
+
+
+def test_local_client_passes_objects_by_reference(mocker):
+    """Test that the local client doesn't pickle objects sent to the server."""
+
+    mock_serialize = mocker.patch("covalent.quantum.qserver.core.cloudpickle_serialize")
+    mock_deserialize = mocker.patch("covalent.quantum.qserver.core.cloudpickle_deserialize")
+
+    qclient = LocalQClient()
+    mock_submit = mocker.patch.object(qclient.qserver, "submit", return_value="mock-batch-id")
+    mock_get_results = mocker.patch.object(qclient.qserver, "get_results")
+
+    qscripts, executors = [mocker.Mock()], [mocker.Mock()]
+    qelectron_info, qnode_specs = mocker.Mock(), mocker.Mock()
+
+    batch_id = qclient.submit(qscripts, executors, qelectron_info, qnode_specs)
+    mock_submit.assert_called_once_with(qscripts, executors, qelectron_info, qnode_specs)
+
+    assert qclient.get_results(batch_id) is mock_get_results.return_value
+    mock_get_results.assert_called_once_with("mock-batch-id")
+
+    def selector(qscript, executors):
+        return executors[-1]
+
+    qclient.selector = selector
+    assert qclient.selector is selector
+
+    # The server's database is not shared with the client
+    assert qclient.database is not qclient.qserver._database
+    assert qclient.database.db_dir == qclient.qserver._database.db_dir
+
+    mock_serialize.assert_not_called()
+    mock_deserialize.assert_not_called()
+
+
+def test_qserver_serializes_for_remote_clients(mocker):
+    """Test that a QServer that isn't in-process still pickles its inputs and outputs."""
+
+    mock_serialize = mocker.patch("covalent.quantum.qserver.core.cloudpickle_serialize")
+    mock_deserialize = mocker.patch("covalent.quantum.qserver.core.cloudpickle_deserialize")
+
+    qserver = QServer()
+
+    qserver.selector = "ser_selector"
+    mock_deserialize.assert_called_once_with("ser_selector")
+    assert qserver.selector is mock_serialize.return_value
+    mock_serialize.assert_called_once_with(mock_deserialize.return_value)
@@ -0,0 +1,254 @@
+# Copyright 2023 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+""" Tests for the qelectron server's circuit result cache """
+
+
+import tempfile
+
+import pennylane as qml
+import pytest
+
+from covalent._shared_files.qelectron_utils import cloudpickle_deserialize
+from covalent._shared_files.qinfo import QElectronInfo, QNodeSpecs
+from covalent.executor import Simulator, qbase
+from covalent.executor.qbase import QCResult
+from covalent.quantum.qserver import core
+from covalent.quantum.qserver.core import QServer
+from covalent.quantum.qserver.database import Database
+from covalent.quantum.qserver.utils import (
+    CircuitResultCache,
+    get_circuit_diagram,
+    get_circuit_key,
+)
+
+QELECTRON_INFO = QElectronInfo(
+    name="circuit",
+    device_name="default.qubit",
+    device_import_path="pennylane.devices.default_qubit:DefaultQubit",
+    device_wires=1,
+    pennylane_active_return=True,
+)
+
+QNODE_SPECS = QNodeSpecs(
+    gate_sizes={1: 1},
+    gate_types={"RX": 1},
+    num_operations=1,
+    num_observables=1,
+    num_diagonalizing_gates=0,
+    num_used_wires=1,
+    depth=1,
+    num_device_wires=1,
+    device_name="default.qubit",
+    expansion_strategy="gradient",
+    gradient_options={},
+)
+
+
+@pytest.fixture
+def temp_dir():
+    with tempfile.TemporaryDirectory() as temp_dir:
+        yield temp_dir
+
+
+def make_qscript(x, shots=None):
+    return qml.tape.QuantumScript([qml.RX(x, wires=0)], [qml.expval(qml.PauliZ(0))], shots=shots)
+
+
+def num_executed(mock_run_circuits):
+    """Count the circuits executed through `run_circuits`."""
+    return sum(len(call.args[1]) for call in mock_run_circuits.call_args_list)
+
+
+def test_get_circuit_key():
+    """Test that circuit keys depend on the circuit, shots, and executor settings."""
+
+    executor = Simulator()
+    key = get_circuit_key(make_qscript(0.1), executor, QELECTRON_INFO)
+
+    assert key == get_circuit_key(make_qscript(0.1), executor, QELECTRON_INFO)
+    assert key == get_circuit_key(
+        make_qscript(qml.numpy.array(0.1, requires_grad=True)), executor, QELECTRON_INFO
+    )
+    assert key != get_circuit_key(make_qscript(0.2), executor, QELECTRON_INFO)
+    assert key != get_circuit_key(make_qscript(0.1, shots=100), executor, QELECTRON_INFO)
+    assert key != get_circuit_key(make_qscript(0.1), Simulator(shots=100), QELECTRON_INFO)
+    assert key != get_circuit_key(
+        make_qscript(0.1), executor, QELECTRON_INFO.model_copy(update={"device_wires": 2})
+    )
+
+
+def test_circuit_result_cache():
+    """Test that the circuit result cache evicts the least recently used results."""
+
+    cache = CircuitResultCache(maxsize=2)
+    cache.put("a", QCResult(results=[1]))
+    cache.put("b", QCResult(results=[2]))
+    assert cache.get("a").results == [1]
+
+    cache.put("c", QCResult(results=[3]))
+    assert len(cache) == 2
+    assert cache.get("b") is None
+
+    # Cached results can't be modified through the returned copies
+    cache.get("c").results.append(4)
+    assert cache.get("c").results == [3]
+
+
+@pytest.mark.parametrize("persist_cache", [True, False])
+def test_qserver_reuses_cached_results(mocker, temp_dir, persist_cache):
+    """Test that identical circuits are only executed once."""
+
+    executor = Simulator(parallel="thread", cache_results=True, persist_cache=persist_cache)
+    qscripts = [make_qscript(0.1 * i) for i in range(3)]
+
+    qserver = QServer(in_process=True)
+    qserver._database = Database(temp_dir)
+    mock_run_circuits = mocker.spy(qbase.BaseQExecutor, "run_circuits")
+
+    batch_id = qserver.submit(qscripts, [executor], QELECTRON_INFO, QNODE_SPECS)
+    expected_results = qserver.get_results(batch_id)
+    assert num_executed(mock_run_circuits) == 3
+
+    batch_id = qserver.submit(qscripts[::-1], [executor], QELECTRON_INFO, QNODE_SPECS)
+    assert qserver.get_results(batch_id) == expected_results[::-1]
+    assert num_executed(mock_run_circuits) == 3
+
+    # Only persisted results are available to a new server
+    new_qserver = QServer(in_process=True)
+    new_qserver._database = Database(temp_dir)
+    batch_id = new_qserver.submit(qscripts, [executor], QELECTRON_INFO, QNODE_SPECS)
+    assert new_qserver.get_results(batch_id) == expected_results
+    assert num_executed(mock_run_circuits) == (3 if persist_cache else 6)
+
+    # Circuit records are written for cached results too
+    db_dict = qserver._database.get_db_dict(dispatch_id=None, node_id=None)
+    assert len(db_dict) == 9
+
+
+def test_qserver_cache_disabled(mocker, temp_dir):
+    """Test that circuits are always executed unless caching is enabled."""
+
+    executor = Simulator(parallel="thread")
+    qscripts = [make_qscript(0.1)]
+
+    qserver = QServer(in_process=True)
+    qserver._database = Database(temp_dir)
+    mock_run_circuits = mocker.spy(qbase.BaseQExecutor, "run_circuits")
+
+    for _ in range(2):
+        batch_id = qserver.submit(qscripts, [executor], QELECTRON_INFO, QNODE_SPECS)
+        qserver.get_results(batch_id)
+
+    assert num_executed(mock_run_circuits) == 2
+    assert len(qserver._circuit_cache) == 0
+
+
+def test_submit_to_executors_groups_by_executor(mocker):
+    """Test that qscripts are grouped by executor in order of first appearance."""
+
+    executors = [Simulator(workers=i) for i in range(3)]
+    mocker.patch.object(
+        Simulator, "batch_submit", lambda self, qscripts: [f"future-{q}" for q in qscripts]
+    )
+
+    # An equal executor that isn't the same object shares its group
+    equal_executor = Simulator(workers=1)
+    linked_executors = [executors[1], executors[0], equal_executor, executors[2], executors[1]]
+
+    executor_future_pairs, submission_order = QServer().submit_to_executors(
+        ["q0", "q1", "q2", None, "q4"], linked_executors, QELECTRON_INFO
+    )
+
+    assert submission_order == [0, 2, 4, 1]
+    assert executor_future_pairs == [
+        [executors[1], {0: "future-q0", 2: "future-q2", 4: "future-q4"}],
+        [executors[0], {1: "future-q1"}],
+    ]
+
+
+def test_qserver_gathers_results_from_several_executors(mocker, temp_dir):
+    """Test that results from several executors are returned in qscript order."""
+
+    executors = [Simulator(parallel="thread", workers=i + 1) for i in range(3)]
+    qscripts = [make_qscript(0.1 * i) for i in range(7)]
+
+    def selector(qscript, executors):
+        return executors[int(round(qscript.get_parameters()[0] * 10)) % len(executors)]
+
+    qserver = QServer(selector=selector, in_process=True)
+    qserver._database = Database(temp_dir)
+    mock_pool = mocker.spy(core, "get_results_pool")
+
+    batch_id = qserver.submit(qscripts, executors, QELECTRON_INFO, QNODE_SPECS)
+    results = qserver.get_results(batch_id)
+
+    assert mock_pool.call_count == 1
+    assert len(qserver.futures_table._ef_pairs) == 0
+    assert results == [
+        qml.execute([qscript], qml.device("default.qubit", wires=1))[0] for qscript in qscripts
+    ]
+
+
+@pytest.mark.parametrize("persistence", ["none", "metadata", "full"])
+def test_qserver_persistence(temp_dir, persistence):
+    """Test that circuit records are stored according to the executor's persistence level."""
+
+    executor = Simulator(parallel="thread", persistence=persistence)
+    qscript = make_qscript(0.1)
+
+    qserver = QServer(in_process=True)
+    qserver._database = Database(temp_dir)
+    batch_id = qserver.submit([qscript], [executor], QELECTRON_INFO, QNODE_SPECS)
+
+    # Nothing is written until the results are retrieved
+    assert not qserver._database.get_db_path(None, None).exists()
+
+    qserver.get_results(batch_id)
+
+    if persistence == "none":
+        assert not qserver._database.get_db_path(None, None).exists()
+        return
+
+    (record,) = qserver._database.get_db_dict(dispatch_id=None, node_id=None).values()
+    assert record["circuit_name"] == "circuit"
+    assert record["qexecutor"]["name"] == "Simulator"
+    assert record["execution_time"] > 0
+    assert record["circuit_diagram"] is None
+
+    if persistence == "metadata":
+        assert record["tape"] is None
+        assert record["result"] is None
+        assert get_circuit_diagram(record) is None
+    else:
+        assert cloudpickle_deserialize(record["tape"]).hash == qscript.hash
+        assert len(record["result"]) == 1
+        assert get_circuit_diagram(record) == qscript.draw()
+
+
+def test_in_process_qserver_keeps_caller_tapes(temp_dir):
+    """Test that executing circuits in-process doesn't modify the caller's tapes."""
+
+    executor = Simulator(parallel="thread")
+    qscript = make_qscript(0.1)
+    trainable_params, qscript_hash = qscript.trainable_params, qscript.hash
+
+    qserver = QServer(in_process=True)
+    qserver._database = Database(temp_dir)
+    qserver.get_results(qserver.submit([qscript], [executor], QELECTRON_INFO, QNODE_SPECS))
+
+    assert qscript.trainable_params == trainable_params
+    assert qscript.hash == qscript_hash
@@ -17,6 +17,7 @@
 """ Tests for qelectron's Database class """
 
 
+import os
 import tempfile
 
 import pytest
@@ -127,11 +128,27 @@ def test_set(mocker, db, direct_path):
         mock_dispatch_id, mock_node_id, direct_path=direct_path, mkdir=True
     )
 
-    mock_open.return_value.__enter__.return_value.update.assert_called_once_with(
+    mock_open.return_value.__enter__.return_value.merge.assert_called_once_with(
         dict(zip(mock_keys, mock_values))
     )
 
 
+def test_set_merges_records(db):
+    """Test that records are merged with stored ones and that the map grows to fit them."""
+
+    # Larger than the initial 1 MB map
+    payload = [os.urandom(100_000) for _ in range(20)]
+
+    db.set(["c0", "c1"], [{"a": 1}, {"b": payload}], dispatch_id="d", node_id=0)
+    db.set(["c1", "c2"], [{"c": 3}, {"d": 4}], dispatch_id="d", node_id=0)
+
+    assert db.get_db_dict(dispatch_id="d", node_id=0) == {
+        "c0": {"a": 1},
+        "c1": {"b": payload, "c": 3},
+        "c2": {"d": 4},
+    }
+
+
 @pytest.mark.parametrize("direct_path", [True, False])
 def test_get_circuit_ids(mocker, db, direct_path):
     """Test the function used to get circuit IDs from the database."""
@@ -16,6 +16,8 @@
 
 """Tests for results manager."""
 
+import hashlib
+import io
 import os
 import tempfile
 from datetime import datetime, timezone
@@ -29,6 +31,7 @@ from covalent._results_manager.results_manager import (
     MissingLatticeRecordError,
     Result,
     ResultManager,
+    _fetch_asset,
     _get_result_export_from_dispatcher,
     cancel,
     download_asset,
@@ -125,6 +128,62 @@ def test_result_export(mocker):
     )
 
 
+@pytest.mark.parametrize("events_status_code", [200, 404])
+def test_result_export_wait(mocker, events_status_code):
+    """Test waiting for a dispatch using the server's event stream."""
+    dispatch_id = "test_result_export_wait"
+    mock_body = {"id": dispatch_id, "status": "COMPLETED"}
+
+    events_response = Response()
+    events_response.status_code = events_status_code
+    events_response.raw = io.BytesIO(
+        b"event: node\n"
+        b'data: {"dispatch_id": "test_result_export_wait", "node_id": 0, "status": "COMPLETED"}\n\n'
+        b"event: dispatch\n"
+        b'data: {"dispatch_id": "test_result_export_wait", "node_id": null, "status": "COMPLETED"}\n\n'
+    )
+    export_response = Response()
+    export_response.status_code = 200
+    export_response.json = MagicMock(return_value=mock_body)
+
+    mock_get = mocker.patch(
+        "covalent._api.apiclient.requests.Session.get",
+        side_effect=[events_response, export_response],
+    )
+
+    assert mock_body == _get_result_export_from_dispatcher(
+        dispatch_id, wait=True, status_only=True, dispatcher_addr="http://localhost:48008"
+    )
+
+    events_call, export_call = mock_get.call_args_list
+    assert events_call.args[0].endswith(f"/api/v2/dispatches/{dispatch_id}/events")
+    # Older servers without event streams are polled as before
+    assert export_call.kwargs["params"]["wait"] == (events_status_code != 200)
+
+
+def test_wait_for_dispatch_empty_streams(mocker):
+    """Test that streams closing without events are retried with backoff, then polled."""
+    from covalent._results_manager import results_manager
+
+    def empty_response(*args, **kwargs):
+        response = Response()
+        response.status_code = 200
+        response.raw = io.BytesIO(b"")
+        return response
+
+    mock_get = mocker.patch(
+        "covalent._api.apiclient.requests.Session.get", side_effect=empty_response
+    )
+    mock_sleep = mocker.patch("covalent._results_manager.results_manager.time.sleep")
+
+    assert not results_manager._wait_for_dispatch("test_empty_streams", "http://localhost:48008")
+
+    assert mock_get.call_count == results_manager.EVENT_STREAM_MAX_EMPTY
+    delays = [call.args[0] for call in mock_sleep.call_args_list]
+    assert len(delays) == results_manager.EVENT_STREAM_MAX_EMPTY - 1
+    assert delays == sorted(delays) and delays[0] > 0
+
+
 def test_result_manager_assets_local_copies():
     """Test downloading and loading assets using local asset uris."""
     dispatch_id = "test_result_manager"
@@ -191,6 +250,33 @@ def test_get_result(mocker):
             assert res_obj.result == 42
 
 
+def test_get_result_lazy(mocker):
+    """Test that lazy results download node outputs on first access"""
+    dispatch_id = "test_get_result_lazy"
+    with tempfile.TemporaryDirectory() as server_dir:
+        manifest = get_test_manifest(server_dir)
+
+        mock_result_export = {
+            "id": dispatch_id,
+            "status": "COMPLETED",
+            "result_export": manifest.dict(),
+        }
+        mocker.patch(
+            "covalent._results_manager.results_manager._get_result_export_from_dispatcher",
+            return_value=mock_result_export,
+        )
+        with tempfile.TemporaryDirectory() as results_dir:
+            res_obj = get_result(dispatch_id, results_dir=results_dir, lazy=True)
+            output_path = os.path.join(results_dir, "node_0", "results.tobj")
+
+            assert res_obj.result == 42
+            assert not os.path.exists(output_path)
+
+            output = res_obj.get_node_result(0)["output"]
+            assert output.get_deserialized() == 2
+            assert os.path.exists(output_path)
+
+
 def test_get_result_sublattice(mocker):
     dispatch_id = "test_result_manager_sublattice"
     sub_dispatch_id = "test_result_manager_sublattice_sub"
@@ -307,3 +393,34 @@ def test_download_asset(mocker):
     with tempfile.NamedTemporaryFile() as local_file:
         download_asset(remote_uri, local_file.name)
         assert local_file.read().decode("utf-8") == "Hello"
+
+
+def test_fetch_asset_uses_local_cache(mocker, tmp_path):
+    """Test that assets with a previously downloaded digest aren't downloaded again"""
+
+    data = b"Hello"
+    asset = {
+        "digest_alg": "sha",
+        "digest": hashlib.sha1(data).hexdigest(),
+        "remote_uri": "http://localhost:48008/api/v2/dispatches/test/assets/result",
+    }
+
+    def mock_download(remote_uri, local_path, **kwargs):
+        with open(local_path, "wb") as f:
+            f.write(data)
+
+    mocker.patch(
+        "covalent._results_manager.results_manager.get_config",
+        return_value=str(tmp_path / "results"),
+    )
+    mock_download_asset = mocker.patch(
+        "covalent._results_manager.results_manager.download_asset", side_effect=mock_download
+    )
+    mocker.patch("covalent._results_manager.results_manager._get_download_session")
+
+    _fetch_asset(asset, str(tmp_path / "first"))
+    _fetch_asset(asset, str(tmp_path / "second"))
+
+    mock_download_asset.assert_called_once()
+    assert (tmp_path / "second").read_bytes() == data
+    assert (tmp_path / "results" / ".objects" / asset["digest"][:2] / asset["digest"]).exists()
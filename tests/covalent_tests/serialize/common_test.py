@@ -0,0 +1,60 @@
+# Copyright 2023 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for asset serialization helpers"""
+
+import os
+import tempfile
+
+import numpy as np
+
+from covalent._serialize.common import (
+    AssetType,
+    _sha1_asset,
+    read_asset_file,
+    write_asset_file,
+)
+from covalent._workflow.transportable_object import TransportableObject
+
+
+def test_write_asset_file_replaces_file():
+    """Test that rewriting an asset file leaves objects mapped from it intact"""
+
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, "value.tobj")
+        to = TransportableObject(np.arange(1000, dtype=float))
+        digest, size = write_asset_file(to, AssetType.TRANSPORTABLE, path)
+
+        assert digest == _sha1_asset(to.serialize())
+        assert size == os.path.getsize(path)
+
+        loaded = read_asset_file(path, AssetType.TRANSPORTABLE)
+        write_asset_file(TransportableObject(np.zeros(10)), AssetType.TRANSPORTABLE, path)
+
+        assert np.array_equal(loaded.get_deserialized(), np.arange(1000, dtype=float))
+        assert read_asset_file(path, AssetType.TRANSPORTABLE).get_deserialized().size == 10
+        assert os.listdir(d) == ["value.tobj"]
+
+
+def test_transportable_object_keeps_readonly_buffers():
+    """Test that the data of read-only arrays isn't copied"""
+
+    arr = np.arange(1000, dtype=float)
+    arr.flags.writeable = False
+    to = TransportableObject(arr)
+
+    assert isinstance(to._buffers[0], memoryview)
+    assert np.shares_memory(np.frombuffer(to._buffers[0], dtype=float), arr)
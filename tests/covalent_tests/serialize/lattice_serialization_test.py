@@ -16,10 +16,12 @@
 
 """Unit tests for lattice serializer"""
 
+import os
 import platform
 import tempfile
 
 import covalent as ct
+from covalent._serialize.common import PACKED_ASSET_MAX_SIZE, parse_asset_uri
 from covalent._serialize.lattice import deserialize_lattice, serialize_lattice
 
 
@@ -96,3 +98,71 @@ def test_serialize_lattice_custom_assets():
 
         node_1 = manifest.transport_graph.nodes[1]
         assert not node_1.assets._custom
+
+
+def test_serialize_electron_cache_flag():
+    @ct.electron(cache=True)
+    def identity(x):
+        return x
+
+    @ct.electron
+    def add(x, y):
+        return x + y
+
+    @ct.lattice
+    def workflow(x, y):
+        return add(identity(x), y)
+
+    workflow.build_graph(2, 3)
+    with tempfile.TemporaryDirectory() as d:
+        model = serialize_lattice(workflow, d)
+        cache_flags = {
+            node.metadata.name: node.metadata.cache for node in model.transport_graph.nodes
+        }
+        assert cache_flags["identity"] is True
+        assert cache_flags["add"] is False
+
+        lat = deserialize_lattice(model)
+        tg = lat.transport_graph
+        for node_id in tg._graph.nodes:
+            name = tg.get_node_value(node_id, "name")
+            assert tg.get_node_value(node_id, "metadata")["cache"] == cache_flags[name]
+
+
+def test_serialize_packs_small_node_assets():
+    """Test that small node assets share one file and large ones get their own"""
+
+    @ct.electron
+    def identity(x):
+        return x
+
+    @ct.lattice
+    def workflow(x, y):
+        return identity(x), identity(y)
+
+    big_input = "x" * PACKED_ASSET_MAX_SIZE
+    workflow.build_graph(2, big_input)
+    with tempfile.TemporaryDirectory() as d:
+        model = serialize_lattice(workflow, d)
+        nodes = {node.metadata.name: node for node in model.transport_graph.nodes}
+
+        small_asset = nodes[":parameter:2"].assets.value
+        path, offset, size = parse_asset_uri(small_asset.uri)
+        assert path.endswith("node_assets.pack")
+        assert size == small_asset.size
+
+        big_param = [name for name in nodes if name.startswith(":parameter:x")][0]
+        big_asset = nodes[big_param].assets.value
+        path, offset, size = parse_asset_uri(big_asset.uri)
+        assert size is None
+        assert big_asset.digest
+        assert os.path.getsize(path) == big_asset.size
+
+        # Electrons with only small assets don't need directories
+        assert os.path.isdir(os.path.join(d, f"node_{nodes[big_param].id}"))
+        assert not os.path.exists(os.path.join(d, f"node_{nodes[':parameter:2'].id}"))
+
+        lat = deserialize_lattice(model)
+        tg = lat.transport_graph
+        assert tg.get_node_value(nodes[big_param].id, "value").get_deserialized() == big_input
+        assert tg.get_node_value(nodes[":parameter:2"].id, "value").get_deserialized() == 2
@@ -16,6 +16,7 @@
 
 """Unit tests for transport graph."""
 
+import base64
 import platform
 from unittest.mock import call
 
@@ -26,6 +27,7 @@ import pytest
 import covalent as ct
 from covalent._shared_files.defaults import parameter_prefix
 from covalent._workflow.transport import (
+    DeferredNodeValue,
     TransportableObject,
     _TransportGraph,
     add_module_deps_to_lattice_metadata,
@@ -107,7 +109,7 @@ def test_transportable_object_get_serialized(transportable_object):
     """Test serialized transportable object retrieval."""
 
     to = transportable_object
-    assert to.get_serialized() == to._object
+    assert base64.b64decode(to.get_serialized()) == to._object
 
 
 def test_transportable_object_get_deserialized(transportable_object):
@@ -177,7 +179,7 @@ def test_transportable_object_sedeser_string_only():
     ser = to.serialize()
     new_to = TransportableObject.deserialize(ser, string_only=True)
     assert new_to.object_string == to.object_string
-    assert new_to._object == ""
+    assert new_to._object == b""
 
 
 def test_transportable_object_sedeser_header_only():
@@ -192,6 +194,168 @@ def test_transportable_object_sedeser_header_only():
     assert new_to._header
 
 
+def test_transportable_object_binary_archive():
+    """Test that archives store raw picklebytes and load from any buffer"""
+    import mmap
+    import tempfile
+
+    from covalent._workflow.transportable_object import TOArchiveUtils
+
+    to = TransportableObject(list(range(100)))
+    data = to.serialize()
+
+    start, _ = TOArchiveUtils.data_byte_range(data)
+    assert data[start:] == cloudpickle.dumps(list(range(100)))
+
+    new_to = TransportableObject.deserialize(memoryview(data))
+    assert new_to.get_deserialized() == list(range(100))
+    assert new_to.header == to.header
+    assert new_to == to
+
+    with tempfile.NamedTemporaryFile("wb") as f:
+        f.write(data)
+        f.flush()
+        with open(f.name, "rb") as rf:
+            mm = mmap.mmap(rf.fileno(), 0, access=mmap.ACCESS_READ)
+            assert TransportableObject.deserialize(mm).get_deserialized() == list(range(100))
+
+    # TObjs holding views into an archive can still be pickled
+    assert cloudpickle.loads(cloudpickle.dumps(new_to)).get_deserialized() == list(range(100))
+
+
+def test_transportable_object_out_of_band_buffers():
+    """Test that array data is stored as aligned out-of-band buffers"""
+    import numpy as np
+
+    from covalent._workflow.transportable_object import BUFFER_ALIGNMENT, TOArchiveUtils
+
+    array = np.arange(1000, dtype=np.float64)
+    to = TransportableObject(array)
+    assert [len(buf) for buf in to._buffers] == [array.nbytes]
+
+    # Later modifications of the original object don't leak into the TObj
+    array[0] = -1
+    assert to.get_deserialized()[0] == 0
+
+    data = to.serialize()
+    assert b"".join(to.serialize_segments()) == data
+    start, _ = TOArchiveUtils.data_byte_range(data)
+    assert start % BUFFER_ALIGNMENT == 0
+
+    new_to = TransportableObject.deserialize(data)
+    assert new_to == to
+    deserialized = new_to.get_deserialized()
+    assert deserialized.flags.writeable
+    assert np.array_equal(deserialized, np.arange(1000, dtype=np.float64))
+
+    # The JSON representation holds self-contained picklebytes
+    assert cloudpickle.loads(base64.b64decode(to.get_serialized()))[1] == 1
+    rehydrated = TransportableObject.from_dict(to.to_dict())
+    assert np.array_equal(rehydrated.get_deserialized(), deserialized)
+
+
+@pytest.mark.parametrize(
+    "policy,expected_string,complete",
+    [
+        ("full", str(list(range(1000))), True),
+        ("truncate", str(list(range(1000)))[:30], False),
+        ("summarize", "[0, 1, 2, 3, 4, 5, ...]", False),
+        ("skip", "", False),
+    ],
+)
+def test_transportable_object_string_policy(mocker, policy, expected_string, complete):
+    """Test the string representation policies for large objects"""
+    from covalent._workflow.transportable_object import TOArchiveUtils
+
+    config = {
+        "sdk.tobj_string_policy": policy,
+        "sdk.tobj_string_threshold": 100,
+        "sdk.tobj_string_max_length": 30,
+    }
+    mocker.patch("covalent._workflow.transportable_object.get_config", config.get)
+
+    to = TransportableObject(list(range(1000)))
+    assert to.object_string == expected_string
+    assert to.string_repr == {"policy": policy, "complete": complete}
+    assert to.get_deserialized() == list(range(1000))
+
+    # Small objects are always represented in full
+    assert TransportableObject(5).object_string == "5"
+    assert TransportableObject(5).string_repr == {"policy": "full", "complete": True}
+
+    data = to.serialize()
+    start, end = TOArchiveUtils.string_byte_range(data)
+    assert data[start:end].decode("utf-8") == expected_string
+    assert TransportableObject.deserialize(data, header_only=True).string_repr == to.string_repr
+
+
+class Point:
+    """Counts how often it is represented"""
+
+    num_reprs = 0
+
+    def __repr__(self):
+        Point.num_reprs += 1
+        return "Point"
+
+
+def test_transportable_object_string_without_unpickling(mocker):
+    """Test that the string of a large object is built without unpickling it"""
+
+    config = {
+        "sdk.tobj_string_policy": "truncate",
+        "sdk.tobj_string_threshold": 100,
+        "sdk.tobj_string_max_length": 30,
+    }
+    mocker.patch("covalent._workflow.transportable_object.get_config", config.get)
+    mock_loads = mocker.spy(cloudpickle, "loads")
+
+    obj = list(range(1000))
+    to = TransportableObject(obj)
+    obj[0] = "changed"
+
+    assert to.object_string == str(list(range(1000)))[:30]
+    assert to.string_repr == {"policy": "truncate", "complete": False}
+    assert to == TransportableObject.deserialize(to.serialize())
+    mock_loads.assert_not_called()
+
+
+def test_transportable_object_truncate_is_bounded(mocker):
+    """Test that truncated strings don't represent whole containers"""
+
+    config = {
+        "sdk.tobj_string_policy": "truncate",
+        "sdk.tobj_string_threshold": 100,
+        "sdk.tobj_string_max_length": 30,
+    }
+    mocker.patch("covalent._workflow.transportable_object.get_config", config.get)
+    Point.num_reprs = 0
+
+    to = TransportableObject([[Point()] * 100] * 100)
+    assert to.object_string == "[[Point, Point, Point, Point, "
+    assert Point.num_reprs < 10
+
+
+def test_transportable_object_legacy_archive():
+    """Test loading archives with base64-encoded picklebytes"""
+    import json
+
+    from covalent._workflow.transportable_object import _TOArchive
+
+    to = TransportableObject({"a": 1})
+    header = json.dumps(to.header).encode("utf-8")
+    legacy_data = base64.b64encode(cloudpickle.dumps({"a": 1}))
+    legacy = _TOArchive(header, to.object_string.encode("utf-8"), legacy_data).cat()
+
+    new_to = TransportableObject.deserialize(legacy)
+    assert new_to.get_deserialized() == {"a": 1}
+    assert new_to == to
+
+    legacy_state = {**to.__dict__, "_object": legacy_data.decode("utf-8")}
+    legacy_to = TransportableObject.from_dict({"attributes": legacy_state})
+    assert legacy_to.get_deserialized() == {"a": 1}
+
+
 def test_transportable_object_deserialize_list(transportable_object):
     deserialized = [1, 2, {"a": 3, "b": [4, 5]}]
     serialized_list = [
@@ -280,6 +444,20 @@ def test_transport_graph_get_and_set_node_values(workflow_transport_graph):
     assert wtg.get_node_value(node_key=0, value_key="node_name") == "square"
 
 
+def test_transport_graph_get_deferred_node_value(workflow_transport_graph, mocker):
+    """Test that deferred node values are loaded once, on first access."""
+
+    wtg = workflow_transport_graph
+    loader = mocker.Mock(return_value="square")
+
+    wtg.set_node_value(node_key=0, value_key="output", value=DeferredNodeValue(loader))
+    loader.assert_not_called()
+
+    assert wtg.get_node_value(node_key=0, value_key="output") == "square"
+    assert wtg.get_node_value(node_key=0, value_key="output") == "square"
+    loader.assert_called_once()
+
+
 def test_transport_graph_get_dependencies(workflow_transport_graph):
     """Test the graph node retrieval method in the transport graph."""
 
@@ -392,3 +392,21 @@ def test_get_qelectron_job_detail(qelectron_mocked_data_for_jobs):
     )
     assert response.status_code == test_data["status_code"]
     assert response.json() == test_data["response_data"]
+
+
+def test_get_qelectron_job_detail_undrawable_tape(qelectron_mocked_data_for_jobs, mocker):
+    """Test that a stored tape which can't be loaded falls back to the stored diagram"""
+    mocker.patch(
+        "covalent.quantum.qserver.utils.get_circuit_diagram",
+        side_effect=AttributeError("incompatible tape"),
+    )
+    test_data = output_data["test_get_qelectron_job_detail"]["case_1"]
+    response = object_test_template(
+        api_path=output_data["test_get_qelectron_job_detail"]["api_path"],
+        app=fastapi_app,
+        method_type=MethodType.GET,
+        path=test_data["path"],
+    )
+    expected_circuit = test_data["response_data"]["circuit"]
+    assert response.status_code == test_data["status_code"]
+    assert response.json()["circuit"] == expected_circuit
@@ -102,3 +102,24 @@ def test_models_helper():
     from covalent_ui.api.v1.utils.models_helper import SortBy
 
     assert (SortBy._missing_("runtime")) is not None
+
+
+def test_read_from_serialized_buffers(tmp_path, mocker):
+    """Test that stored objects with out-of-band buffers are shown without unpickling them"""
+    import ast
+    import pickle
+
+    import cloudpickle
+    import numpy as np
+
+    from covalent._workflow.transportable_object import TransportableObject
+
+    arr = np.arange(1000, dtype=float)
+    (tmp_path / "output.tobj").write_bytes(TransportableObject(arr).serialize())
+
+    mock_loads = mocker.spy(cloudpickle, "loads")
+    object_string, object_code = FileHandler(str(tmp_path)).read_from_serialized("output.tobj")
+    mock_loads.assert_not_called()
+
+    picklebytes = ast.literal_eval(object_code[len("import pickle\npickle.loads(") : -1])
+    assert np.array_equal(pickle.loads(picklebytes), arr)
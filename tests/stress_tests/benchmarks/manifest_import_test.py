@@ -0,0 +1,58 @@
+# Copyright 2023 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import tempfile
+import time
+
+import pytest
+
+import covalent as ct
+from covalent._results_manager.result import Result as SDKResult
+from covalent._serialize.result import serialize_result
+from covalent_dispatcher._dal.importers.result import import_result
+from covalent_dispatcher._db.datastore import DataStore
+
+
+@ct.electron
+def task(x):
+    return x
+
+
+@pytest.mark.parametrize("num_tasks", [5000, 50000])
+def test_manifest_import(benchmark, mocker, num_tasks):
+    logger = benchmark[1]
+
+    @ct.lattice
+    def workflow(n):
+        return [task(i) for i in range(n)]
+
+    test_db = DataStore(db_URL="sqlite+pysqlite:///:memory:", initialize_db=True)
+    mocker.patch("covalent_dispatcher._dal.base.workflow_db", test_db)
+
+    workflow.build_graph(num_tasks)
+    dispatch_id = f"manifest_import_{num_tasks}"
+
+    with tempfile.TemporaryDirectory(prefix="covalent-") as sdk_dir, tempfile.TemporaryDirectory(
+        prefix="covalent-"
+    ) as srv_dir:
+        manifest = serialize_result(SDKResult(workflow, dispatch_id=dispatch_id), sdk_dir)
+        num_nodes = len(manifest.lattice.transport_graph.nodes)
+
+        start = time.perf_counter()
+        import_result(manifest, srv_dir, None)
+        elapsed = time.perf_counter() - start
+
+    logger.debug({"workflow_name": "manifest_import", "nodes": num_nodes, "seconds": elapsed})
@@ -0,0 +1,67 @@
+# Copyright 2023 Agnostiq Inc.
+#
+# This file is part of Covalent.
+#
+# Licensed under the Apache License 2.0 (the "License"). A copy of the
+# License may be obtained with this software package or at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Use of this file is prohibited except in compliance with the License.
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+
+import pytest
+
+from covalent._shared_files.util_classes import RESULT_STATUS
+from covalent_dispatcher._dal.tg_ops import TransportGraphOps, _TransportGraph
+
+NUM_NODES = 50000
+WIDTH = 100
+
+
+def make_transport_graph(lattice_id: int, changed_node: int = None) -> _TransportGraph:
+    """A layered graph where each node depends on two nodes of the previous layer."""
+    tg = _TransportGraph(lattice_id)
+    g = tg._graph
+    for node_id in range(NUM_NODES):
+        g.add_node(node_id, name=f"task_{node_id % WIDTH}", status=RESULT_STATUS.COMPLETED)
+        if node_id >= WIDTH:
+            layer_start = (node_id // WIDTH - 1) * WIDTH
+            for i, parent in enumerate({node_id - WIDTH, layer_start + (node_id + 1) % WIDTH}):
+                g.add_edge(parent, node_id, edge_name="x", param_type="arg", arg_index=i)
+
+    digests = {node_id: f"{node_id:040x}" for node_id in range(NUM_NODES)}
+    if changed_node is not None:
+        digests[changed_node] = "0" * 40
+    tg.get_asset_digests = lambda key: digests
+    return tg
+
+
+@pytest.mark.parametrize("changed_node", [None, NUM_NODES // 2])
+def test_redispatch_graph_diff(benchmark, changed_node):
+    logger = benchmark[1]
+
+    tg_old = make_transport_graph(1)
+    tg_new = make_transport_graph(2, changed_node)
+
+    start = time.perf_counter()
+    reusable_nodes = TransportGraphOps(tg_old).get_reusable_nodes(tg_new)
+    elapsed = time.perf_counter() - start
+
+    logger.debug(
+        {"workflow_name": "redispatch_graph_diff", "nodes": NUM_NODES, "seconds": elapsed}
+    )
+
+    if changed_node is None:
+        assert len(reusable_nodes) == NUM_NODES
+    else:
+        reusable = set(reusable_nodes)
+        assert changed_node not in reusable
+        assert changed_node - WIDTH in reusable
+        assert all(node_id in reusable for node_id in range(changed_node // WIDTH * WIDTH))